@@ -7,7 +7,9 @@ from app.models import entities  # noqa: F401
 
 config = context.config
 
-if config.config_file_name is not None:
+# Skipped when the app runs migrations itself, so alembic.ini does not replace
+# the server's logging setup.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 target_metadata = Base.metadata
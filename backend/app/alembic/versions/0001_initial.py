@@ -7,6 +7,7 @@ Create Date: 2026-02-09 00:00:00
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 revision = "0001_initial"
 down_revision = None
@@ -14,32 +15,38 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade() -> None:
-    op.create_table(
+def _initial_metadata() -> sa.MetaData:
+    metadata = sa.MetaData()
+
+    sa.Table(
         "majors",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("name", sa.String(length=120), nullable=False, unique=True),
         sa.Column("description", sa.Text(), nullable=True),
         sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.text("true")),
     )
 
-    op.create_table(
+    sa.Table(
         "career_pathways",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("name", sa.String(length=120), nullable=False, unique=True),
         sa.Column("description", sa.Text(), nullable=True),
         sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.text("true")),
     )
 
-    op.create_table(
+    sa.Table(
         "skills",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("name", sa.String(length=160), nullable=False, unique=True),
         sa.Column("description", sa.Text(), nullable=True),
     )
 
-    op.create_table(
+    sa.Table(
         "checklist_versions",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("pathway_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("career_pathways.id"), nullable=False),
         sa.Column("version_number", sa.Integer(), nullable=False),
@@ -47,8 +54,9 @@ def upgrade() -> None:
         sa.Column("published_at", sa.DateTime(), nullable=True),
     )
 
-    op.create_table(
+    sa.Table(
         "checklist_items",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("version_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("checklist_versions.id"), nullable=False),
         sa.Column("skill_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("skills.id"), nullable=True),
@@ -60,8 +68,9 @@ def upgrade() -> None:
         sa.Column("allowed_proof_types", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default=sa.text("'[]'::jsonb")),
     )
 
-    op.create_table(
+    sa.Table(
         "milestones",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("pathway_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("career_pathways.id"), nullable=False),
         sa.Column("title", sa.String(length=200), nullable=False),
@@ -69,8 +78,9 @@ def upgrade() -> None:
         sa.Column("semester_index", sa.Integer(), nullable=False),
     )
 
-    op.create_table(
+    sa.Table(
         "major_pathway_map",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("major_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("majors.id"), nullable=False),
         sa.Column("pathway_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("career_pathways.id"), nullable=False),
@@ -78,8 +88,9 @@ def upgrade() -> None:
         sa.Column("notes", sa.Text(), nullable=True),
     )
 
-    op.create_table(
+    user_pathways = sa.Table(
         "user_pathways",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("user_id", sa.String(length=120), nullable=False),
         sa.Column("major_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("majors.id"), nullable=False),
@@ -89,8 +100,9 @@ def upgrade() -> None:
         sa.Column("selected_at", sa.DateTime(), nullable=False),
     )
 
-    op.create_table(
+    proofs = sa.Table(
         "proofs",
+        metadata,
         sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
         sa.Column("user_id", sa.String(length=120), nullable=False),
         sa.Column("checklist_item_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("checklist_items.id"), nullable=False),
@@ -101,8 +113,22 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(), nullable=False),
     )
 
-    op.create_index("ix_user_pathways_user_id", "user_pathways", ["user_id"])
-    op.create_index("ix_proofs_user_id", "proofs", ["user_id"])
+    sa.Index("ix_user_pathways_user_id", user_pathways.c.user_id)
+    sa.Index("ix_proofs_user_id", proofs.c.user_id)
+    return metadata
+
+
+def upgrade() -> None:
+    # Render the whole initial schema up front and send it as a single batch so
+    # the server parses it once instead of paying a round-trip per table/index.
+    metadata = _initial_metadata()
+    dialect = op.get_context().dialect
+    statements: list[str] = []
+    for table in metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        for index in sorted(table.indexes, key=lambda idx: idx.name):
+            statements.append(str(CreateIndex(index).compile(dialect=dialect)).strip())
+    op.execute(";\n".join(statements))
 
 
 def downgrade() -> None:
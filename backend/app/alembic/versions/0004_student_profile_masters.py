@@ -5,7 +5,6 @@ Revises: 0003_student_profiles
 Create Date: 2026-02-09 00:45:00
 """
 from alembic import op
-import sqlalchemy as sa
 
 revision = "0004_student_profile_masters"
 down_revision = "0003_student_profiles"
@@ -14,17 +13,21 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column(
-        "student_profiles",
-        sa.Column("masters_interest", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+    # One ALTER TABLE takes the ACCESS EXCLUSIVE lock once for all four columns.
+    op.execute(
+        "ALTER TABLE student_profiles "
+        "ADD COLUMN masters_interest BOOLEAN DEFAULT false NOT NULL, "
+        "ADD COLUMN masters_target VARCHAR(160), "
+        "ADD COLUMN masters_timeline VARCHAR(120), "
+        "ADD COLUMN masters_status VARCHAR(80)"
     )
-    op.add_column("student_profiles", sa.Column("masters_target", sa.String(length=160), nullable=True))
-    op.add_column("student_profiles", sa.Column("masters_timeline", sa.String(length=120), nullable=True))
-    op.add_column("student_profiles", sa.Column("masters_status", sa.String(length=80), nullable=True))
 
 
 def downgrade() -> None:
-    op.drop_column("student_profiles", "masters_status")
-    op.drop_column("student_profiles", "masters_timeline")
-    op.drop_column("student_profiles", "masters_target")
-    op.drop_column("student_profiles", "masters_interest")
+    op.execute(
+        "ALTER TABLE student_profiles "
+        "DROP COLUMN masters_status, "
+        "DROP COLUMN masters_timeline, "
+        "DROP COLUMN masters_target, "
+        "DROP COLUMN masters_interest"
+    )
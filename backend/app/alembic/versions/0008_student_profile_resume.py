@@ -6,7 +6,6 @@ Create Date: 2026-02-16
 """
 
 from alembic import op
-import sqlalchemy as sa
 
 
 revision = "0008_student_profile_resume"
@@ -16,12 +15,18 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column("student_profiles", sa.Column("resume_url", sa.Text(), nullable=True))
-    op.add_column("student_profiles", sa.Column("resume_filename", sa.String(length=255), nullable=True))
-    op.add_column("student_profiles", sa.Column("resume_uploaded_at", sa.DateTime(), nullable=True))
+    op.execute(
+        "ALTER TABLE student_profiles "
+        "ADD COLUMN resume_url TEXT, "
+        "ADD COLUMN resume_filename VARCHAR(255), "
+        "ADD COLUMN resume_uploaded_at TIMESTAMP WITHOUT TIME ZONE"
+    )
 
 
 def downgrade() -> None:
-    op.drop_column("student_profiles", "resume_uploaded_at")
-    op.drop_column("student_profiles", "resume_filename")
-    op.drop_column("student_profiles", "resume_url")
+    op.execute(
+        "ALTER TABLE student_profiles "
+        "DROP COLUMN resume_uploaded_at, "
+        "DROP COLUMN resume_filename, "
+        "DROP COLUMN resume_url"
+    )
@@ -39,7 +39,6 @@ def upgrade() -> None:
         sa.Column("password_reset_expires_at", sa.DateTime(), nullable=True),
     )
     op.create_index("ix_student_accounts_email", "student_accounts", ["email"], unique=True)
-    op.alter_column("student_accounts", "email_verified", server_default=None)
 
     op.create_table(
         "auth_sessions",
@@ -120,7 +119,6 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), nullable=False),
     )
     op.create_index("ix_student_goals_user_id", "student_goals", ["user_id"], unique=False)
-    op.alter_column("student_goals", "streak_days", server_default=None)
 
     op.create_table(
         "student_notifications",
@@ -138,7 +136,6 @@ def upgrade() -> None:
         ["user_id"],
         unique=False,
     )
-    op.alter_column("student_notifications", "is_read", server_default=None)
 
 
 def downgrade() -> None:
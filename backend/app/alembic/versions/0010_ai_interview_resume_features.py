@@ -35,8 +35,6 @@ def upgrade() -> None:
         ["user_id"],
         unique=False,
     )
-    op.alter_column("ai_interview_sessions", "question_count", server_default=None)
-    op.alter_column("ai_interview_sessions", "status", server_default=None)
 
     op.create_table(
         "ai_interview_questions",
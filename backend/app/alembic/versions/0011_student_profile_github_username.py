@@ -16,10 +16,16 @@ depends_on = None
 
 
 def _has_column(table_name: str, column_name: str) -> bool:
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    columns = {col["name"] for col in inspector.get_columns(table_name)}
-    return column_name in columns
+    # One catalog lookup instead of reflecting every column through the inspector.
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_attribute "
+            "WHERE attrelid = to_regclass(:table_name) "
+            "AND attname = :column_name AND attnum > 0 AND NOT attisdropped"
+        ),
+        {"table_name": table_name, "column_name": column_name},
+    )
+    return result.scalar() is not None
 
 
 def upgrade() -> None:
@@ -0,0 +1,104 @@
+"""Replace single-column user/session indexes with composite timeline indexes
+
+Revision ID: 0014_composite_user_indexes
+Revises: 0013_proficiency
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0014_composite_user_indexes"
+down_revision = "0013_proficiency"
+branch_labels = None
+depends_on = None
+
+
+# (new index, table, columns, replaced single-column index)
+COMPOSITE_INDEXES = [
+    ("ix_proofs_user_created", "proofs", ["user_id", sa.text("created_at DESC")], "ix_proofs_user_id"),
+    (
+        "ix_user_pathways_user_selected",
+        "user_pathways",
+        ["user_id", sa.text("selected_at DESC")],
+        "ix_user_pathways_user_id",
+    ),
+    (
+        "ix_student_notifications_user_created",
+        "student_notifications",
+        ["user_id", sa.text("created_at DESC")],
+        "ix_student_notifications_user_id",
+    ),
+    (
+        "ix_student_goals_user_updated",
+        "student_goals",
+        ["user_id", sa.text("updated_at DESC")],
+        "ix_student_goals_user_id",
+    ),
+    (
+        "ix_ai_interview_sessions_user_created",
+        "ai_interview_sessions",
+        ["user_id", sa.text("created_at DESC")],
+        "ix_ai_interview_sessions_user_id",
+    ),
+    (
+        "ix_ai_interview_questions_session_order",
+        "ai_interview_questions",
+        ["session_id", "order_index"],
+        "ix_ai_interview_questions_session_id",
+    ),
+    (
+        "ix_ai_interview_responses_session_submitted",
+        "ai_interview_responses",
+        ["session_id", "submitted_at"],
+        "ix_ai_interview_responses_session_id",
+    ),
+    (
+        "ix_ai_resume_artifacts_user_created",
+        "ai_resume_artifacts",
+        ["user_id", sa.text("created_at DESC")],
+        "ix_ai_resume_artifacts_user_id",
+    ),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction; building outside one keeps
+    # these tables writable while the indexes are populated on live data.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, replaced in COMPOSITE_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            # The composite index has the same leading column, so the old one is redundant.
+            op.drop_index(
+                replaced,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, replaced in reversed(COMPOSITE_INDEXES):
+            op.create_index(
+                replaced,
+                table_name,
+                [columns[0]],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,54 @@
+"""Use a hash index for auth_sessions.refresh_token_hash lookups
+
+Revision ID: 0015_auth_session_hash_index
+Revises: 0014_composite_user_indexes
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0015_auth_session_hash_index"
+down_revision = "0014_composite_user_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Refresh tokens are only ever looked up by equality, and the stored value is a
+    # SHA-256 of 48 random bytes, so a hash index is enough and is much smaller
+    # than the unique btree over 64-char hex strings.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_auth_sessions_refresh_token_hash_h",
+            "auth_sessions",
+            ["refresh_token_hash"],
+            unique=False,
+            postgresql_using="hash",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_auth_sessions_refresh_token_hash",
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_auth_sessions_refresh_token_hash",
+            "auth_sessions",
+            ["refresh_token_hash"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_auth_sessions_refresh_token_hash_h",
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
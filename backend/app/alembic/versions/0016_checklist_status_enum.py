@@ -0,0 +1,50 @@
+"""Store checklist_versions.status as a native enum
+
+Revision ID: 0016_checklist_status_enum
+Revises: 0015_auth_session_hash_index
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0016_checklist_status_enum"
+down_revision = "0015_auth_session_hash_index"
+branch_labels = None
+depends_on = None
+
+
+checklist_version_status = postgresql.ENUM(
+    "draft",
+    "published",
+    "archived",
+    name="checklist_version_status",
+)
+
+
+def upgrade() -> None:
+    # Only the version lifecycle is a closed set; proof/goal statuses and item
+    # tiers are written from admin and AI input and stay as VARCHAR.
+    checklist_version_status.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "checklist_versions",
+        "status",
+        existing_type=sa.String(length=16),
+        type_=checklist_version_status,
+        existing_nullable=False,
+        postgresql_using="status::checklist_version_status",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "checklist_versions",
+        "status",
+        existing_type=checklist_version_status,
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    checklist_version_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,38 @@
+"""Leave free space on frequently updated tables for HOT updates
+
+Revision ID: 0017_hot_update_fillfactor
+Revises: 0016_checklist_status_enum
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0017_hot_update_fillfactor"
+down_revision = "0016_checklist_status_enum"
+branch_labels = None
+depends_on = None
+
+
+# Rows rewritten in place (login timestamps, revocation, streaks, interview
+# progress, proof review). student_goals and auth_sessions turned out to update
+# indexed columns, so HOT never applies to them; 0029 resets their fillfactor.
+FILLFACTORS = {
+    "student_accounts": 80,
+    "auth_sessions": 80,
+    "student_goals": 80,
+    "ai_interview_sessions": 80,
+    "proofs": 85,
+}
+
+
+def upgrade() -> None:
+    # Only affects pages written from now on; existing pages pick up the free
+    # space the next time the table is rewritten (VACUUM FULL / pg_repack).
+    for table_name, fillfactor in FILLFACTORS.items():
+        op.execute(f"ALTER TABLE {table_name} SET (fillfactor = {fillfactor})")
+
+
+def downgrade() -> None:
+    for table_name in reversed(list(FILLFACTORS)):
+        op.execute(f"ALTER TABLE {table_name} RESET (fillfactor)")
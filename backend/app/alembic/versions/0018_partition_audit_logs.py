@@ -0,0 +1,113 @@
+"""Partition the append-only audit log tables by month
+
+Revision ID: 0018_partition_audit_logs
+Revises: 0017_hot_update_fillfactor
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0018_partition_audit_logs"
+down_revision = "0017_hot_update_fillfactor"
+branch_labels = None
+depends_on = None
+
+
+# table -> secondary indexes (name, column) recreated on the partitioned parent
+PARTITIONED_TABLES = {
+    "auth_audit_logs": [
+        ("ix_auth_audit_logs_user_id", "user_id"),
+        ("ix_auth_audit_logs_action", "action"),
+    ],
+    "ai_audit_logs": [
+        ("ix_ai_audit_logs_user_id", "user_id"),
+    ],
+}
+
+# Creates one partition per month from the month of `start_at` through
+# `months_ahead` months past the current one. Safe to call repeatedly; the app
+# calls it on startup (see app.services.partitions).
+ENSURE_MONTHLY_PARTITIONS = """
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    parent text,
+    months_ahead integer DEFAULT 2,
+    start_at timestamp DEFAULT now()
+) RETURNS void AS $$
+DECLARE
+    month_start timestamp := date_trunc('month', start_at);
+    last_month timestamp := date_trunc('month', now()) + make_interval(months => months_ahead);
+BEGIN
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(month_start, 'YYYY_MM'),
+            parent,
+            month_start,
+            month_start + interval '1 month'
+        );
+        month_start := month_start + interval '1 month';
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(ENSURE_MONTHLY_PARTITIONS)
+    for table_name, indexes in PARTITIONED_TABLES.items():
+        staging = f"{table_name}_partitioned"
+        op.execute(
+            f"CREATE TABLE {staging} (LIKE {table_name} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        # Rows outside every monthly range land here instead of failing the insert.
+        op.execute(f"CREATE TABLE {table_name}_default PARTITION OF {staging} DEFAULT")
+        op.execute(
+            f"SELECT ensure_monthly_partitions('{staging}', 2, "
+            f"COALESCE((SELECT min(created_at) FROM {table_name}), now()::timestamp))"
+        )
+        op.execute(f"INSERT INTO {staging} SELECT * FROM {table_name}")
+        op.execute(f"DROP TABLE {table_name}")
+        op.execute(f"ALTER TABLE {staging} RENAME TO {table_name}")
+        # The partition key has to be part of the primary key.
+        op.execute(
+            f"ALTER TABLE {table_name} ADD CONSTRAINT {table_name}_pkey "
+            "PRIMARY KEY (id, created_at)"
+        )
+        for index_name, column in indexes:
+            op.execute(f"CREATE INDEX {index_name} ON {table_name} ({column})")
+        # Child tables were named after the staging table; give them stable names.
+        op.execute(
+            f"""
+            DO $$
+            DECLARE child record;
+            BEGIN
+                FOR child IN
+                    SELECT c.relname FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    WHERE i.inhparent = '{table_name}'::regclass
+                      AND c.relname LIKE '{staging}\\_%'
+                LOOP
+                    EXECUTE format(
+                        'ALTER TABLE %I RENAME TO %I',
+                        child.relname,
+                        '{table_name}' || substr(child.relname, {len(staging) + 1})
+                    );
+                END LOOP;
+            END $$
+            """
+        )
+
+
+def downgrade() -> None:
+    for table_name, indexes in PARTITIONED_TABLES.items():
+        plain = f"{table_name}_plain"
+        op.execute(f"CREATE TABLE {plain} (LIKE {table_name} INCLUDING DEFAULTS)")
+        op.execute(f"INSERT INTO {plain} SELECT * FROM {table_name}")
+        op.execute(f"DROP TABLE {table_name} CASCADE")
+        op.execute(f"ALTER TABLE {plain} RENAME TO {table_name}")
+        op.execute(f"ALTER TABLE {table_name} ADD CONSTRAINT {table_name}_pkey PRIMARY KEY (id)")
+        for index_name, column in indexes:
+            op.execute(f"CREATE INDEX {index_name} ON {table_name} ({column})")
+    op.execute("DROP FUNCTION IF EXISTS ensure_monthly_partitions(text, integer, timestamp)")
@@ -0,0 +1,64 @@
+"""Add BRIN indexes on insert-ordered timestamp columns
+
+Revision ID: 0019_timestamp_brin_indexes
+Revises: 0018_partition_audit_logs
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0019_timestamp_brin_indexes"
+down_revision = "0018_partition_audit_logs"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column); rows are inserted in timestamp order so block ranges stay tight.
+BRIN_INDEXES = [
+    ("ix_market_raw_ingestions_fetched_at_brin", "market_raw_ingestions", "fetched_at"),
+    ("ix_student_notifications_created_at_brin", "student_notifications", "created_at"),
+    ("ix_proofs_created_at_brin", "proofs", "created_at"),
+]
+
+# Partitioned in 0018; CONCURRENTLY is not supported on a partitioned parent.
+PARTITIONED_BRIN_INDEXES = [
+    ("ix_auth_audit_logs_created_at_brin", "auth_audit_logs", "created_at"),
+    ("ix_ai_audit_logs_created_at_brin", "ai_audit_logs", "created_at"),
+]
+
+
+def upgrade() -> None:
+    for index_name, table_name, column in PARTITIONED_BRIN_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            if_not_exists=True,
+        )
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in BRIN_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column],
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(BRIN_INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    for index_name, table_name, _ in reversed(PARTITIONED_BRIN_INDEXES):
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
@@ -0,0 +1,47 @@
+"""Restore server defaults that 0009/0010 dropped after adding columns
+
+Revision ID: 0020_restore_server_defaults
+Revises: 0019_timestamp_brin_indexes
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0020_restore_server_defaults"
+down_revision = "0019_timestamp_brin_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, type, default); only metadata changes, no rows are rewritten.
+SERVER_DEFAULTS = [
+    ("student_accounts", "email_verified", sa.Boolean(), "false"),
+    ("student_goals", "streak_days", sa.Integer(), "0"),
+    ("student_notifications", "is_read", sa.Boolean(), "false"),
+    ("ai_interview_sessions", "question_count", sa.Integer(), "5"),
+    ("ai_interview_sessions", "status", sa.String(length=32), "'active'"),
+]
+
+
+def upgrade() -> None:
+    for table_name, column, existing_type, default in SERVER_DEFAULTS:
+        op.alter_column(
+            table_name,
+            column,
+            existing_type=existing_type,
+            existing_nullable=False,
+            server_default=sa.text(default),
+        )
+
+
+def downgrade() -> None:
+    for table_name, column, existing_type, _ in reversed(SERVER_DEFAULTS):
+        op.alter_column(
+            table_name,
+            column,
+            existing_type=existing_type,
+            existing_nullable=False,
+            server_default=None,
+        )
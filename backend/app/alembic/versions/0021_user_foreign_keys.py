@@ -0,0 +1,48 @@
+"""Add foreign keys for user and checklist change log references (NOT VALID)
+
+Revision ID: 0021_user_foreign_keys
+Revises: 0020_restore_server_defaults
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0021_user_foreign_keys"
+down_revision = "0020_restore_server_defaults"
+branch_labels = None
+depends_on = None
+
+
+# (constraint, table, column, referenced table, referenced column)
+# user_id holds the account username. ai_audit_logs is partitioned, and
+# PostgreSQL does not allow NOT VALID foreign keys there; its rows are
+# history that should outlive the account anyway.
+FOREIGN_KEYS = [
+    ("fk_user_pathways_user_id", "user_pathways", "user_id", "student_accounts", "username"),
+    ("fk_student_profiles_user_id", "student_profiles", "user_id", "student_accounts", "username"),
+    ("fk_auth_sessions_user_id", "auth_sessions", "user_id", "student_accounts", "username"),
+    ("fk_proofs_user_id", "proofs", "user_id", "student_accounts", "username"),
+    ("fk_student_goals_user_id", "student_goals", "user_id", "student_accounts", "username"),
+    ("fk_student_notifications_user_id", "student_notifications", "user_id", "student_accounts", "username"),
+    ("fk_ai_interview_sessions_user_id", "ai_interview_sessions", "user_id", "student_accounts", "username"),
+    ("fk_ai_resume_artifacts_user_id", "ai_resume_artifacts", "user_id", "student_accounts", "username"),
+    ("fk_checklist_change_logs_pathway_id", "checklist_change_logs", "pathway_id", "career_pathways", "id"),
+    ("fk_checklist_change_logs_from_version_id", "checklist_change_logs", "from_version_id", "checklist_versions", "id"),
+    ("fk_checklist_change_logs_to_version_id", "checklist_change_logs", "to_version_id", "checklist_versions", "id"),
+]
+
+
+def upgrade() -> None:
+    # NOT VALID only takes a brief lock and enforces the constraint for new
+    # writes; existing rows are checked by VALIDATE CONSTRAINT in 0022.
+    for name, table_name, column, ref_table, ref_column in FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table_name} ADD CONSTRAINT {name} "
+            f"FOREIGN KEY ({column}) REFERENCES {ref_table} ({ref_column}) NOT VALID"
+        )
+
+
+def downgrade() -> None:
+    for name, table_name, *_ in reversed(FOREIGN_KEYS):
+        op.drop_constraint(name, table_name, type_="foreignkey")
@@ -0,0 +1,64 @@
+"""Validate the foreign keys added NOT VALID in 0021
+
+Revision ID: 0022_validate_user_foreign_keys
+Revises: 0021_user_foreign_keys
+Create Date: 2026-03-02
+"""
+
+import logging
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = "0022_validate_user_foreign_keys"
+down_revision = "0021_user_foreign_keys"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# (constraint, table, column, referenced table, referenced column), as in 0021
+FOREIGN_KEYS = [
+    ("fk_user_pathways_user_id", "user_pathways", "user_id", "student_accounts", "username"),
+    ("fk_student_profiles_user_id", "student_profiles", "user_id", "student_accounts", "username"),
+    ("fk_auth_sessions_user_id", "auth_sessions", "user_id", "student_accounts", "username"),
+    ("fk_proofs_user_id", "proofs", "user_id", "student_accounts", "username"),
+    ("fk_student_goals_user_id", "student_goals", "user_id", "student_accounts", "username"),
+    ("fk_student_notifications_user_id", "student_notifications", "user_id", "student_accounts", "username"),
+    ("fk_ai_interview_sessions_user_id", "ai_interview_sessions", "user_id", "student_accounts", "username"),
+    ("fk_ai_resume_artifacts_user_id", "ai_resume_artifacts", "user_id", "student_accounts", "username"),
+    ("fk_checklist_change_logs_pathway_id", "checklist_change_logs", "pathway_id", "career_pathways", "id"),
+    ("fk_checklist_change_logs_from_version_id", "checklist_change_logs", "from_version_id", "checklist_versions", "id"),
+    ("fk_checklist_change_logs_to_version_id", "checklist_change_logs", "to_version_id", "checklist_versions", "id"),
+]
+
+
+def _has_orphans(table_name: str, column: str, ref_table: str, ref_column: str) -> bool:
+    result = op.get_bind().execute(
+        sa.text(
+            f"SELECT 1 FROM {table_name} t WHERE t.{column} IS NOT NULL "
+            f"AND NOT EXISTS (SELECT 1 FROM {ref_table} r WHERE r.{ref_column} = t.{column}) "
+            "LIMIT 1"
+        )
+    )
+    return result.scalar() is not None
+
+
+def upgrade() -> None:
+    # VALIDATE CONSTRAINT only takes SHARE UPDATE EXCLUSIVE, so reads and
+    # writes continue while existing rows are checked. Each runs in its own
+    # transaction so one long scan does not hold the others' locks.
+    with op.get_context().autocommit_block():
+        for name, table_name, column, ref_table, ref_column in FOREIGN_KEYS:
+            if not context.is_offline_mode() and _has_orphans(table_name, column, ref_table, ref_column):
+                # Leave it NOT VALID (still enforced for new writes) rather than
+                # failing the deploy on legacy rows that predate accounts.
+                logger.warning("Skipping VALIDATE for %s: %s has orphaned rows", name, table_name)
+                continue
+            op.execute(f"ALTER TABLE {table_name} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    # A validated constraint cannot be made NOT VALID again; 0021 drops it.
+    pass
@@ -0,0 +1,88 @@
+"""Index only active (unrevoked) auth sessions
+
+Revision ID: 0023_active_auth_session_indexes
+Revises: 0022_validate_user_foreign_keys
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0023_active_auth_session_indexes"
+down_revision = "0022_validate_user_foreign_keys"
+branch_labels = None
+depends_on = None
+
+
+ACTIVE = sa.text("revoked_at IS NULL")
+
+
+def upgrade() -> None:
+    # Every lookup (refresh, logout, revoke-all on password reset) only wants
+    # sessions that are still live, so revoked rows no longer need index entries.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_auth_sessions_active_refresh_token_hash",
+            "auth_sessions",
+            ["refresh_token_hash"],
+            unique=False,
+            postgresql_using="hash",
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_auth_sessions_active_user_id",
+            "auth_sessions",
+            ["user_id"],
+            unique=False,
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_auth_sessions_refresh_token_hash_h",
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_auth_sessions_user_id",
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_auth_sessions_user_id",
+            "auth_sessions",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_auth_sessions_refresh_token_hash_h",
+            "auth_sessions",
+            ["refresh_token_hash"],
+            unique=False,
+            postgresql_using="hash",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_auth_sessions_active_user_id",
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_auth_sessions_active_refresh_token_hash",
+            table_name="auth_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
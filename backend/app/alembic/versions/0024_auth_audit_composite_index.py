@@ -0,0 +1,35 @@
+"""Replace auth_audit_logs user_id/action indexes with one composite index
+
+Revision ID: 0024_auth_audit_composite_index
+Revises: 0023_active_auth_session_indexes
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0024_auth_audit_composite_index"
+down_revision = "0023_active_auth_session_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # auth_audit_logs is partitioned (0018), so the index cannot be built
+    # CONCURRENTLY; it is cascaded to every monthly partition.
+    op.create_index(
+        "ix_auth_audit_logs_user_action_created",
+        "auth_audit_logs",
+        ["user_id", "action", sa.text("created_at DESC")],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.drop_index("ix_auth_audit_logs_action", table_name="auth_audit_logs", if_exists=True)
+    op.drop_index("ix_auth_audit_logs_user_id", table_name="auth_audit_logs", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_auth_audit_logs_user_id", "auth_audit_logs", ["user_id"], unique=False)
+    op.create_index("ix_auth_audit_logs_action", "auth_audit_logs", ["action"], unique=False)
+    op.drop_index("ix_auth_audit_logs_user_action_created", table_name="auth_audit_logs")
@@ -0,0 +1,30 @@
+"""Drop the plain share_slug index duplicated by its unique constraint
+
+Revision ID: 0025_drop_share_slug_index
+Revises: 0024_auth_audit_composite_index
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0025_drop_share_slug_index"
+down_revision = "0024_auth_audit_composite_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 0012 created both uq_student_profiles_share_slug and this identical
+    # non-unique index; the unique one already serves slug lookups.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_student_profiles_share_slug",
+            table_name="student_profiles",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,83 @@
+"""Composite indexes for checklist version, item, change log and kanban lookups
+
+Revision ID: 0026_checklist_hot_path_indexes
+Revises: 0025_drop_share_slug_index
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0026_checklist_hot_path_indexes"
+down_revision = "0025_drop_share_slug_index"
+branch_labels = None
+depends_on = None
+
+
+# (new index, table, columns, replaced index or None)
+HOT_PATH_INDEXES = [
+    # latest draft/published/archived version per pathway (publish, rollback,
+    # readiness and every "published checklist" lookup)
+    (
+        "ix_checklist_versions_pathway_status_version",
+        "checklist_versions",
+        ["pathway_id", "status", sa.text("version_number DESC")],
+        None,
+    ),
+    # items of a version in display order; version_id had no index at all
+    ("ix_checklist_items_version_title", "checklist_items", ["version_id", "title"], None),
+    (
+        "ix_checklist_change_logs_pathway_created",
+        "checklist_change_logs",
+        ["pathway_id", sa.text("created_at DESC")],
+        "ix_checklist_change_logs_pathway_id",
+    ),
+    # board listing orders by (sort_order, created_at) within a user
+    (
+        "ix_kanban_tasks_user_sort",
+        "kanban_tasks",
+        ["user_id", "sort_order", "created_at"],
+        "ix_kanban_tasks_user_id",
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, replaced in HOT_PATH_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            if replaced:
+                op.drop_index(
+                    replaced,
+                    table_name=table_name,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, replaced in reversed(HOT_PATH_INDEXES):
+            if replaced:
+                op.create_index(
+                    replaced,
+                    table_name,
+                    [columns[0]],
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
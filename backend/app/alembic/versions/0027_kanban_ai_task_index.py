@@ -0,0 +1,41 @@
+"""Partial index for a user's AI-generated kanban tasks
+
+Revision ID: 0027_kanban_ai_task_index
+Revises: 0026_checklist_hot_path_indexes
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0027_kanban_ai_task_index"
+down_revision = "0026_checklist_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Regenerating a plan deletes the user's AI tasks; only those rows need
+    # entries, so manual tasks do not grow the index. The board and GitHub sync
+    # are served by ix_kanban_tasks_user_sort from 0026.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_kanban_tasks_user_ai_generated",
+            "kanban_tasks",
+            ["user_id"],
+            unique=False,
+            postgresql_where=sa.text("ai_generated"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_kanban_tasks_user_ai_generated",
+            table_name="kanban_tasks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
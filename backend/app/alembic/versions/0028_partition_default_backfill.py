@@ -0,0 +1,105 @@
+"""Let ensure_monthly_partitions move rows out of the default partition
+
+Revision ID: 0028_partition_default_backfill
+Revises: 0027_kanban_ai_task_index
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0028_partition_default_backfill"
+down_revision = "0027_kanban_ai_task_index"
+branch_labels = None
+depends_on = None
+
+
+# Once rows for a month have landed in `<parent>_default`, CREATE TABLE ...
+# PARTITION OF for that month fails. So the month is built as a plain table, the
+# rows are moved into it out of the default partition, and it is then attached.
+# A month that still fails is reported as a warning and skipped, so the later
+# months are still created.
+ENSURE_MONTHLY_PARTITIONS = """
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    parent text,
+    months_ahead integer DEFAULT 2,
+    start_at timestamp DEFAULT now()
+) RETURNS void AS $$
+DECLARE
+    month_start timestamp := date_trunc('month', start_at);
+    last_month timestamp := date_trunc('month', now()) + make_interval(months => months_ahead);
+    default_name text := parent || '_default';
+    partition_name text;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        partition_name := parent || '_' || to_char(month_start, 'YYYY_MM');
+        IF to_regclass(quote_ident(partition_name)) IS NULL THEN
+            BEGIN
+                IF to_regclass(quote_ident(default_name)) IS NULL THEN
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        parent,
+                        month_start,
+                        month_start + interval '1 month'
+                    );
+                ELSE
+                    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS)', partition_name, parent);
+                    EXECUTE format(
+                        'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                        'INSERT INTO %I SELECT * FROM moved',
+                        default_name,
+                        month_start,
+                        month_start + interval '1 month',
+                        partition_name
+                    );
+                    EXECUTE format(
+                        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        parent,
+                        partition_name,
+                        month_start,
+                        month_start + interval '1 month'
+                    );
+                END IF;
+            EXCEPTION WHEN others THEN
+                RAISE WARNING 'could not create partition % of %: %', partition_name, parent, SQLERRM;
+            END;
+        END IF;
+        month_start := month_start + interval '1 month';
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# The 0018 definition, restored on downgrade.
+PREVIOUS_ENSURE_MONTHLY_PARTITIONS = """
+CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+    parent text,
+    months_ahead integer DEFAULT 2,
+    start_at timestamp DEFAULT now()
+) RETURNS void AS $$
+DECLARE
+    month_start timestamp := date_trunc('month', start_at);
+    last_month timestamp := date_trunc('month', now()) + make_interval(months => months_ahead);
+BEGIN
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(month_start, 'YYYY_MM'),
+            parent,
+            month_start,
+            month_start + interval '1 month'
+        );
+        month_start := month_start + interval '1 month';
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(ENSURE_MONTHLY_PARTITIONS)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_ENSURE_MONTHLY_PARTITIONS)
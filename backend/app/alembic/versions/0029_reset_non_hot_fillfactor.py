@@ -0,0 +1,33 @@
+"""Reset fillfactor on tables whose updates cannot be HOT
+
+Revision ID: 0029_reset_non_hot_fillfactor
+Revises: 0028_partition_default_backfill
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0029_reset_non_hot_fillfactor"
+down_revision = "0028_partition_default_backfill"
+branch_labels = None
+depends_on = None
+
+
+# 0017 lowered fillfactor on these, but their updates always touch an indexed
+# column, so the reserved space only bloats the tables:
+# - student_goals: every update sets updated_at (ix_student_goals_user_updated).
+# - auth_sessions: revocation sets revoked_at, the predicate column of both
+#   partial indexes from 0023.
+TABLES = ("student_goals", "auth_sessions")
+
+
+def upgrade() -> None:
+    # Existing pages keep their free space until the next table rewrite.
+    for table_name in TABLES:
+        op.execute(f"ALTER TABLE {table_name} RESET (fillfactor)")
+
+
+def downgrade() -> None:
+    for table_name in reversed(TABLES):
+        op.execute(f"ALTER TABLE {table_name} SET (fillfactor = 80)")
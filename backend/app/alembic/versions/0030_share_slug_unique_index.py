@@ -0,0 +1,51 @@
+"""Replace the share_slug unique constraint with a concurrently built unique index
+
+Revision ID: 0030_share_slug_unique_index
+Revises: 0029_reset_non_hot_fillfactor
+Create Date: 2026-03-02
+"""
+
+from alembic import op
+
+
+revision = "0030_share_slug_unique_index"
+down_revision = "0029_reset_non_hot_fillfactor"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build the replacement without blocking profile writes, then swap it in;
+    # dropping the constraint and renaming the index only take brief locks.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_student_profiles_share_slug_new",
+            "student_profiles",
+            ["share_slug"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    # Databases built while 0012 briefly created a plain unique index instead of
+    # the constraint already have uq_student_profiles_share_slug as an index.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_student_profiles_share_slug') THEN
+                ALTER TABLE student_profiles DROP CONSTRAINT uq_student_profiles_share_slug;
+            ELSE
+                DROP INDEX IF EXISTS uq_student_profiles_share_slug;
+            END IF;
+        END $$
+        """
+    )
+    op.execute("ALTER INDEX uq_student_profiles_share_slug_new RENAME TO uq_student_profiles_share_slug")
+
+
+def downgrade() -> None:
+    # Promote the index back to the constraint 0012 created; no rebuild needed.
+    op.execute(
+        "ALTER TABLE student_profiles ADD CONSTRAINT uq_student_profiles_share_slug "
+        "UNIQUE USING INDEX uq_student_profiles_share_slug"
+    )
@@ -1,3 +1,5 @@
+import hmac
+
 from fastapi import Header, HTTPException
 from sqlalchemy.orm import Session
 
@@ -26,5 +28,7 @@ def get_current_user_id(x_auth_token: str | None = Header(default=None)) -> str:
 def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
     if not settings.admin_token:
         raise HTTPException(status_code=500, detail="Admin token not configured")
-    if not x_admin_token or x_admin_token != settings.admin_token:
+    if not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode("utf-8"), settings.admin_token.encode("utf-8")
+    ):
         raise HTTPException(status_code=401, detail="Invalid admin token")
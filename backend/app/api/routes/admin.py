@@ -1,7 +1,8 @@
 from datetime import datetime
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import and_, func, insert, or_, update
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_admin
@@ -33,8 +34,10 @@ from app.schemas.api import (
     AdminProofOut,
     AdminProofUpdateIn,
     ChecklistChangeLogOut,
+    MigrationStatusOut,
 )
-from app.services.storage import resolve_file_view_url
+from app.services.migrations import migration_status
+from app.services.storage import resolve_file_view_url, resolve_file_view_urls
 
 router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin)])
 
@@ -46,7 +49,6 @@ def upsert_pathway(payload: AdminPathwayIn, db: Session = Depends(get_db)):
         existing.description = payload.description
         existing.is_active = payload.is_active
         db.commit()
-        db.refresh(existing)
         return existing
 
     pathway = CareerPathway(
@@ -56,7 +58,6 @@ def upsert_pathway(payload: AdminPathwayIn, db: Session = Depends(get_db)):
     )
     db.add(pathway)
     db.commit()
-    db.refresh(pathway)
     return pathway
 
 
@@ -66,16 +67,23 @@ def upsert_skill(payload: AdminSkillIn, db: Session = Depends(get_db)):
     if existing:
         existing.description = payload.description
         db.commit()
-        db.refresh(existing)
         return existing
 
     skill = Skill(name=payload.name, description=payload.description)
     db.add(skill)
     db.commit()
-    db.refresh(skill)
     return skill
 
 
+def _update_returning(db: Session, model, row_id: str, values: dict):
+    """Apply values with a single UPDATE ... RETURNING; returns the updated row or None if missing."""
+    if not values:
+        return db.get(model, row_id)
+    return db.execute(
+        update(model).where(model.id == row_id).values(**values).returning(model)
+    ).scalar_one_or_none()
+
+
 @router.get("/skills", response_model=list[AdminSkillOut])
 def list_skills(db: Session = Depends(get_db)):
     return db.query(Skill).order_by(Skill.name.asc()).all()
@@ -83,24 +91,19 @@ def list_skills(db: Session = Depends(get_db)):
 
 @router.put("/skills/{skill_id}", response_model=AdminSkillOut)
 def update_skill(skill_id: str, payload: AdminSkillUpdateIn, db: Session = Depends(get_db)):
-    skill = db.query(Skill).get(skill_id)
+    data = payload.model_dump(exclude_unset=True)
+    values = {field: data[field] for field in ("name", "description") if field in data}
+    skill = _update_returning(db, Skill, skill_id, values)
     if not skill:
         raise HTTPException(status_code=404, detail="Skill not found")
 
-    data = payload.model_dump(exclude_unset=True)
-    if "name" in data:
-        skill.name = data["name"]
-    if "description" in data:
-        skill.description = data["description"]
-
     db.commit()
-    db.refresh(skill)
     return skill
 
 
 @router.delete("/skills/{skill_id}")
 def delete_skill(skill_id: str, db: Session = Depends(get_db)):
-    skill = db.query(Skill).get(skill_id)
+    skill = db.get(Skill, skill_id)
     if not skill:
         raise HTTPException(status_code=404, detail="Skill not found")
     db.delete(skill)
@@ -114,7 +117,7 @@ def create_draft_checklist(
     payload: AdminChecklistDraftIn,
     db: Session = Depends(get_db),
 ):
-    pathway = db.query(CareerPathway).get(pathway_id)
+    pathway = db.get(CareerPathway, pathway_id)
     if not pathway:
         raise HTTPException(status_code=404, detail="Pathway not found")
 
@@ -132,36 +135,42 @@ def create_draft_checklist(
     db.add(version)
     db.flush()
 
-    item_count = 0
-    for item in payload.items:
-        skill_id = item.skill_id
-        if not skill_id and item.skill_name:
-            skill = db.query(Skill).filter(Skill.name == item.skill_name).one_or_none()
-            if not skill:
-                skill = Skill(name=item.skill_name)
-                db.add(skill)
-                db.flush()
-            skill_id = skill.id
-
-        checklist_item = ChecklistItem(
-            version_id=version.id,
-            skill_id=skill_id,
-            title=item.title,
-            description=item.description,
-            tier=item.tier,
-            rationale=item.rationale,
-            is_critical=item.is_critical,
-            allowed_proof_types=item.allowed_proof_types,
-        )
-        db.add(checklist_item)
-        item_count += 1
+    skill_names = {item.skill_name for item in payload.items if not item.skill_id and item.skill_name}
+    skills_by_name = {}
+    if skill_names:
+        skills_by_name = {
+            skill.name: skill for skill in db.query(Skill).filter(Skill.name.in_(skill_names)).all()
+        }
+        missing = [Skill(name=name) for name in sorted(skill_names - skills_by_name.keys())]
+        if missing:
+            db.add_all(missing)
+            db.flush()
+            skills_by_name.update({skill.name: skill for skill in missing})
+
+    # Plain rows through a bulk INSERT: the items are not used after creation, so
+    # there is no need to build ORM objects and track them in the session.
+    checklist_rows = [
+        {
+            "version_id": version.id,
+            "skill_id": item.skill_id or (skills_by_name[item.skill_name].id if item.skill_name else None),
+            "title": item.title,
+            "description": item.description,
+            "tier": item.tier,
+            "rationale": item.rationale,
+            "is_critical": item.is_critical,
+            "allowed_proof_types": item.allowed_proof_types,
+        }
+        for item in payload.items
+    ]
+    if checklist_rows:
+        db.execute(insert(ChecklistItem), checklist_rows)
 
     db.commit()
     return {
         "version_id": version.id,
         "version_number": version.version_number,
         "status": version.status,
-        "item_count": item_count,
+        "item_count": len(checklist_rows),
     }
 
 
@@ -173,25 +182,25 @@ def list_checklist_versions(pathway_id: str, db: Session = Depends(get_db)):
         .order_by(ChecklistVersion.version_number.desc())
         .all()
     )
-    results = []
-    for version in versions:
-        item_count = (
-            db.query(func.count(ChecklistItem.id))
-            .filter(ChecklistItem.version_id == version.id)
-            .scalar()
-            or 0
+    item_counts = {}
+    if versions:
+        item_counts = dict(
+            db.query(ChecklistItem.version_id, func.count(ChecklistItem.id))
+            .filter(ChecklistItem.version_id.in_([version.id for version in versions]))
+            .group_by(ChecklistItem.version_id)
+            .all()
         )
-        results.append(
-            {
-                "id": version.id,
-                "pathway_id": version.pathway_id,
-                "version_number": version.version_number,
-                "status": version.status,
-                "published_at": version.published_at,
-                "item_count": item_count,
-            }
-        )
-    return results
+    return [
+        {
+            "id": version.id,
+            "pathway_id": version.pathway_id,
+            "version_number": version.version_number,
+            "status": version.status,
+            "published_at": version.published_at,
+            "item_count": item_counts.get(version.id, 0),
+        }
+        for version in versions
+    ]
 
 
 @router.get("/checklists/versions/{version_id}/items", response_model=list[AdminChecklistItemOut])
@@ -210,31 +219,31 @@ def update_checklist_item(
     payload: AdminChecklistItemUpdateIn,
     db: Session = Depends(get_db),
 ):
-    item = db.query(ChecklistItem).get(item_id)
+    data = payload.model_dump(exclude_unset=True)
+    values = {
+        field: data[field]
+        for field in [
+            "title",
+            "description",
+            "tier",
+            "rationale",
+            "is_critical",
+            "allowed_proof_types",
+            "skill_id",
+        ]
+        if field in data
+    }
+    item = _update_returning(db, ChecklistItem, item_id, values)
     if not item:
         raise HTTPException(status_code=404, detail="Checklist item not found")
 
-    data = payload.model_dump(exclude_unset=True)
-    for field in [
-        "title",
-        "description",
-        "tier",
-        "rationale",
-        "is_critical",
-        "allowed_proof_types",
-        "skill_id",
-    ]:
-        if field in data:
-            setattr(item, field, data[field])
-
     db.commit()
-    db.refresh(item)
     return item
 
 
 @router.delete("/checklists/items/{item_id}")
 def delete_checklist_item(item_id: str, db: Session = Depends(get_db)):
-    item = db.query(ChecklistItem).get(item_id)
+    item = db.get(ChecklistItem, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Checklist item not found")
     db.delete(item)
@@ -242,6 +251,18 @@ def delete_checklist_item(item_id: str, db: Session = Depends(get_db)):
     return {"deleted": True, "id": item_id}
 
 
+def _archive_published_versions(db: Session, pathway_id: str):
+    """Archive the pathway's published version(s) in one UPDATE ... RETURNING; returns the newest one."""
+    archived = db.execute(
+        update(ChecklistVersion)
+        .where(ChecklistVersion.pathway_id == pathway_id)
+        .where(ChecklistVersion.status == "published")
+        .values(status="archived")
+        .returning(ChecklistVersion.id, ChecklistVersion.version_number)
+    ).all()
+    return max(archived, key=lambda row: row.version_number, default=None)
+
+
 @router.post("/checklists/{pathway_id}/publish", response_model=AdminPublishOut)
 def publish_checklist(pathway_id: str, db: Session = Depends(get_db)):
     draft = (
@@ -249,21 +270,13 @@ def publish_checklist(pathway_id: str, db: Session = Depends(get_db)):
         .filter(ChecklistVersion.pathway_id == pathway_id)
         .filter(ChecklistVersion.status == "draft")
         .order_by(ChecklistVersion.version_number.desc())
+        .with_for_update()
         .first()
     )
     if not draft:
         raise HTTPException(status_code=404, detail="No draft checklist found")
 
-    db.query(ChecklistVersion).filter(ChecklistVersion.pathway_id == pathway_id).filter(
-        ChecklistVersion.status == "published"
-    ).update({"status": "archived"})
-    previous_published = (
-        db.query(ChecklistVersion)
-        .filter(ChecklistVersion.pathway_id == pathway_id)
-        .filter(ChecklistVersion.status == "archived")
-        .order_by(ChecklistVersion.version_number.desc())
-        .first()
-    )
+    previous_published = _archive_published_versions(db, pathway_id)
 
     draft.status = "published"
     draft.published_at = datetime.utcnow()
@@ -280,7 +293,6 @@ def publish_checklist(pathway_id: str, db: Session = Depends(get_db)):
         )
     )
     db.commit()
-    db.refresh(draft)
     return {
         "version_id": draft.id,
         "status": draft.status,
@@ -290,24 +302,22 @@ def publish_checklist(pathway_id: str, db: Session = Depends(get_db)):
 
 @router.post("/checklists/{pathway_id}/rollback", response_model=AdminPublishOut)
 def rollback_checklist(pathway_id: str, db: Session = Depends(get_db)):
-    current = (
-        db.query(ChecklistVersion)
-        .filter(ChecklistVersion.pathway_id == pathway_id)
-        .filter(ChecklistVersion.status == "published")
-        .order_by(ChecklistVersion.version_number.desc())
-        .first()
-    )
-    target = (
-        db.query(ChecklistVersion)
-        .filter(ChecklistVersion.pathway_id == pathway_id)
-        .filter(ChecklistVersion.status == "archived")
-        .order_by(ChecklistVersion.version_number.desc())
-        .first()
-    )
+    current = _archive_published_versions(db, pathway_id)
+    target = None
+    if current:
+        target = (
+            db.query(ChecklistVersion)
+            .filter(ChecklistVersion.pathway_id == pathway_id)
+            .filter(ChecklistVersion.status == "archived")
+            .filter(ChecklistVersion.id != current.id)
+            .order_by(ChecklistVersion.version_number.desc())
+            .with_for_update()
+            .first()
+        )
     if not current or not target:
+        db.rollback()
         raise HTTPException(status_code=404, detail="No rollback target available")
 
-    current.status = "archived"
     target.status = "published"
     target.published_at = datetime.utcnow()
     db.add(
@@ -326,7 +336,6 @@ def rollback_checklist(pathway_id: str, db: Session = Depends(get_db)):
         )
     )
     db.commit()
-    db.refresh(target)
     return {
         "version_id": target.id,
         "status": target.status,
@@ -336,27 +345,15 @@ def rollback_checklist(pathway_id: str, db: Session = Depends(get_db)):
 
 @router.get("/checklists/{pathway_id}/changes", response_model=list[ChecklistChangeLogOut])
 def list_checklist_changes(pathway_id: str, db: Session = Depends(get_db)):
-    logs = (
+    # Rows go straight to the response model (validated from attributes and
+    # dumped to JSON in one pass) instead of being copied into dicts first.
+    return (
         db.query(ChecklistChangeLog)
         .filter(ChecklistChangeLog.pathway_id == pathway_id)
         .order_by(ChecklistChangeLog.created_at.desc())
         .limit(200)
         .all()
     )
-    return [
-        {
-            "id": log.id,
-            "pathway_id": log.pathway_id,
-            "from_version_id": log.from_version_id,
-            "to_version_id": log.to_version_id,
-            "change_type": log.change_type,
-            "summary": log.summary,
-            "metadata": log.metadata_json,
-            "created_by": log.created_by,
-            "created_at": log.created_at,
-        }
-        for log in logs
-    ]
 
 
 @router.post("/milestones", response_model=AdminMilestoneOut)
@@ -385,7 +382,6 @@ def create_milestone(payload: AdminMilestoneIn, db: Session = Depends(get_db)):
     )
     db.add(milestone)
     db.commit()
-    db.refresh(milestone)
     return {
         "milestone_id": milestone.id,
         "pathway_id": milestone.pathway_id,
@@ -401,7 +397,7 @@ def verify_proof(
     payload: AdminProofVerifyIn,
     db: Session = Depends(get_db),
 ):
-    proof = db.query(Proof).get(proof_id)
+    proof = db.get(Proof, proof_id)
     if not proof:
         raise HTTPException(status_code=404, detail="Proof not found")
 
@@ -411,15 +407,17 @@ def verify_proof(
 
     proof.status = status
     db.commit()
-    db.refresh(proof)
     return {"id": proof.id, "status": proof.status}
 
 
 @router.get("/proofs", response_model=list[AdminProofOut])
 def list_proofs(
+    response: Response,
     status: str | None = None,
     user_id: str | None = None,
     checklist_item_id: str | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     query = db.query(Proof)
@@ -429,8 +427,33 @@ def list_proofs(
         query = query.filter(Proof.user_id == user_id)
     if checklist_item_id:
         query = query.filter(Proof.checklist_item_id == checklist_item_id)
+    if cursor:
+        # Keyset cursor "<created_at ISO>,<id>" taken from the last proof of the previous page.
+        try:
+            raw_created_at, raw_id = cursor.rsplit(",", 1)
+            cursor_created_at = datetime.fromisoformat(raw_created_at)
+            cursor_id = UUID(raw_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(
+            or_(
+                Proof.created_at < cursor_created_at,
+                and_(Proof.created_at == cursor_created_at, Proof.id < cursor_id),
+            )
+        )
 
-    proofs = query.order_by(Proof.created_at.desc()).all()
+    page_size = max(1, min(limit, 500))
+    # One extra row tells us whether another page exists without a count query.
+    proofs = (
+        query.order_by(Proof.created_at.desc(), Proof.id.desc())
+        .limit(page_size + 1)
+        .all()
+    )
+    if len(proofs) > page_size:
+        proofs = proofs[:page_size]
+        last = proofs[-1]
+        response.headers["X-Next-Cursor"] = f"{last.created_at.isoformat()},{last.id}"
+    view_urls = resolve_file_view_urls(proof.url for proof in proofs)
     return [
         {
             "id": proof.id,
@@ -438,7 +461,7 @@ def list_proofs(
             "checklist_item_id": proof.checklist_item_id,
             "proof_type": proof.proof_type,
             "url": proof.url,
-            "view_url": resolve_file_view_url(proof.url),
+            "view_url": view_urls[proof.url],
             "status": proof.status,
             "review_note": proof.review_note,
             "metadata": proof.metadata_json,
@@ -454,22 +477,15 @@ def update_proof(
     payload: AdminProofUpdateIn,
     db: Session = Depends(get_db),
 ):
-    proof = db.query(Proof).get(proof_id)
-    if not proof:
-        raise HTTPException(status_code=404, detail="Proof not found")
-
     data = payload.model_dump(exclude_unset=True)
-    if "status" in data:
-        proof.status = data["status"]
-    if "url" in data:
-        proof.url = data["url"]
+    values = {field: data[field] for field in ("status", "url", "review_note") if field in data}
     if "metadata" in data:
-        proof.metadata_json = data["metadata"]
-    if "review_note" in data:
-        proof.review_note = data["review_note"]
+        values["metadata_json"] = data["metadata"]
+    proof = _update_returning(db, Proof, proof_id, values)
+    if not proof:
+        raise HTTPException(status_code=404, detail="Proof not found")
 
     db.commit()
-    db.refresh(proof)
     return {
         "id": proof.id,
         "user_id": proof.user_id,
@@ -486,9 +502,14 @@ def update_proof(
 
 @router.delete("/proofs/{proof_id}")
 def delete_proof(proof_id: str, db: Session = Depends(get_db)):
-    proof = db.query(Proof).get(proof_id)
+    proof = db.get(Proof, proof_id)
     if not proof:
         raise HTTPException(status_code=404, detail="Proof not found")
     db.delete(proof)
     db.commit()
     return {"deleted": True, "id": proof_id}
+
+
+@router.get("/migrations/status", response_model=MigrationStatusOut)
+def get_migration_status(db: Session = Depends(get_db)):
+    return migration_status(db)
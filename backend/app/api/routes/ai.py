@@ -1,4 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+import json
+from typing import Any
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user_id, require_admin
@@ -37,7 +42,7 @@ from app.schemas.api import (
 from app.services.ai import (
     generate_student_guidance,
     generate_admin_summary,
-    log_ai_feedback,
+    log_ai_feedback_in_background,
     sync_evidence_requirement_matches,
 )
 from app.services.ai_suite import (
@@ -61,6 +66,23 @@ from app.services.ai_orchestrator import run_ai_career_orchestrator
 router = APIRouter()
 
 
+def _conditional_list_response(request: Request, response: Response, rows: list[Any]) -> Any:
+    """Tag a per-user list with a content ETag; answer 304 when the client already has it.
+
+    Revalidation still runs the query, but unchanged lists cost no body to
+    encode or send. no-cache keeps clients from showing a stale list after a
+    create.
+    """
+    digest = hashlib.sha256(
+        json.dumps(jsonable_encoder(rows), sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    headers = {"ETag": f'W/"{digest[:32]}"', "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return rows
+
+
 @router.post("/user/ai/guide", response_model=AiGuideOut)
 def student_ai_guide(
     payload: AiGuideIn,
@@ -208,7 +230,7 @@ def student_repo_proof_checker(
             target_job=payload.target_job,
             location=payload.location,
             repo_url=payload.repo_url,
-            proof_id=str(payload.proof_id) if payload.proof_id else None,
+            proof_id=payload.proof_id,
         )
     except RuntimeError as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
@@ -249,16 +271,17 @@ def student_ai_evidence_mapper(
 @router.post("/user/ai/guide/feedback", response_model=AiGuideFeedbackOut)
 def student_ai_guide_feedback(
     payload: AiGuideFeedbackIn,
+    background_tasks: BackgroundTasks,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db),
 ):
     ai_rate_limiter.check(f"user:{user_id}:guide-feedback")
-    log_ai_feedback(
-        db,
+    # The audit row is not read back, so write it after the response is sent.
+    background_tasks.add_task(
+        log_ai_feedback_in_background,
         user_id=user_id,
         helpful=payload.helpful,
         comment=payload.comment,
-        context_ids=[str(value) for value in payload.context_item_ids],
+        context_ids=payload.context_item_ids,
     )
     return {"ok": True, "message": "Thanks. Feedback saved."}
 
@@ -286,11 +309,13 @@ def student_ai_interview_create_session(
 
 @router.get("/user/ai/interview/sessions", response_model=list[AiInterviewSessionOut])
 def student_ai_interview_list_sessions(
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
     ai_rate_limiter.check(f"user:{user_id}:interview-list")
-    return list_interview_sessions(db, user_id)
+    return _conditional_list_response(request, response, list_interview_sessions(db, user_id))
 
 
 @router.get("/user/ai/interview/sessions/{session_id}", response_model=AiInterviewSessionOut)
@@ -322,7 +347,7 @@ def student_ai_interview_submit_response(
             db,
             user_id,
             session_id=session_id,
-            question_id=str(payload.question_id),
+            question_id=payload.question_id,
             answer_text=payload.answer_text,
             video_url=payload.video_url,
         )
@@ -354,11 +379,13 @@ def student_ai_resume_architect_generate(
 
 @router.get("/user/ai/resume-architect", response_model=list[AiResumeArtifactOut])
 def student_ai_resume_architect_list(
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
     ai_rate_limiter.check(f"user:{user_id}:resume-architect-list")
-    return list_resume_artifacts(db, user_id)
+    return _conditional_list_response(request, response, list_resume_artifacts(db, user_id))
 
 
 @router.post("/admin/ai/summarize", response_model=AdminAiSummaryOut, dependencies=[Depends(require_admin)])
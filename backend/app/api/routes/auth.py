@@ -1,12 +1,16 @@
 from datetime import datetime
+import secrets
+import time
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from sqlalchemy import bindparam, lambda_stmt, or_, select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.core.config import settings
+from app.core.database import SessionLocal
 from app.core.ratelimit import auth_login_rate_limiter
-from app.models.entities import AuthAuditLog, AuthSession, StudentAccount
+from app.models.entities import AuthSession, StudentAccount
 from app.schemas.api import (
     AuthActionOut,
     AuthLoginIn,
@@ -29,6 +33,7 @@ from app.services.auth import (
     password_policy_issues,
     verify_password,
 )
+from app.services.auth_audit import enqueue_auth_audit_on_commit
 from app.services.mailer import (
     mail_is_configured,
     send_password_reset_email,
@@ -37,6 +42,31 @@ from app.services.mailer import (
 
 router = APIRouter(prefix="/auth")
 
+EMAIL_SEND_ATTEMPTS = 3
+# Verified against when the username is unknown; computed at import so even the
+# first such login costs the same as a real one.
+_DUMMY_PASSWORD_HASH = hash_password(secrets.token_urlsafe(16))
+
+
+# Built once so the hot auth lookups skip statement construction and hit the
+# compiled cache directly; only the bound value changes per request.
+_ACCOUNT_BY_USERNAME = lambda_stmt(
+    lambda: select(StudentAccount).where(StudentAccount.username == bindparam("username"))
+)
+_ACTIVE_SESSION_BY_HASH = lambda_stmt(
+    lambda: select(AuthSession)
+    .where(AuthSession.refresh_token_hash == bindparam("token_hash"))
+    .where(AuthSession.revoked_at.is_(None))
+)
+
+
+def _account_by_username(db: Session, username: str) -> StudentAccount | None:
+    return db.execute(_ACCOUNT_BY_USERNAME, {"username": username}).scalar_one_or_none()
+
+
+def _active_session_by_hash(db: Session, token_hash: str) -> AuthSession | None:
+    return db.execute(_ACTIVE_SESSION_BY_HASH, {"token_hash": token_hash}).scalar_one_or_none()
+
 
 def _normalize_username(value: str) -> str:
     return value.strip().lower()
@@ -64,6 +94,33 @@ def _login_throttle_key(username: str, request: Request) -> str:
     return f"{username}:{ip_address}"
 
 
+def _write_audit(
+    db: Session,
+    *,
+    action: str,
+    status: str,
+    ip_address: str | None,
+    user_agent: str | None,
+    user_id: str | None = None,
+    detail: dict | None = None,
+    commit: bool = True,
+) -> None:
+    row = {
+        "user_id": user_id,
+        "action": action,
+        "status": status,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "detail": detail,
+        "created_at": datetime.utcnow(),
+    }
+    # The batch writer takes the row off the request path, but only once this
+    # session's transaction commits; a rolled-back request leaves no audit row.
+    enqueue_auth_audit_on_commit(db, row)
+    if commit:
+        db.commit()
+
+
 def _audit(
     db: Session,
     *,
@@ -72,92 +129,135 @@ def _audit(
     request: Request,
     user_id: str | None = None,
     detail: dict | None = None,
+    commit: bool = True,
 ) -> None:
     ip_address, user_agent = _request_context(request)
-    db.add(
-        AuthAuditLog(
-            user_id=user_id,
-            action=action,
-            status=status,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            detail=detail,
-            created_at=datetime.utcnow(),
-        )
+    _write_audit(
+        db,
+        action=action,
+        status=status,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        user_id=user_id,
+        detail=detail,
+        commit=commit,
     )
-    db.commit()
 
 
-def _send_code_email(
-    db: Session,
+def _deliver_code_email(
     *,
-    request: Request,
+    ip_address: str | None,
+    user_agent: str | None,
     user_id: str,
-    email: str | None,
+    email: str,
     kind: str,
     code: str,
-) -> tuple[bool, str]:
-    if not email:
-        return False, "missing_email"
-    if not mail_is_configured():
-        _audit(
-            db,
-            action=f"{kind}_email",
-            status="skipped",
-            request=request,
-            user_id=user_id,
-            detail={"reason": "mail_not_configured"},
-        )
-        return False, "mail_not_configured"
-
+) -> None:
+    # Runs after the response is sent, so it cannot share the request session.
     ttl_minutes = (
         max(1, settings.auth_email_code_ttl_seconds // 60)
         if kind == "verification"
         else max(1, settings.auth_password_reset_ttl_seconds // 60)
     )
-    try:
-        send_result = None
-        if kind == "verification":
-            send_result = send_verification_code_email(
+    sender = send_verification_code_email if kind == "verification" else send_password_reset_email
+    send_result = None
+    error: Exception | None = None
+    for attempt in range(EMAIL_SEND_ATTEMPTS):
+        if attempt:
+            time.sleep(2 ** (attempt - 1))
+        try:
+            send_result = sender(
                 to_email=email,
                 username=user_id,
                 code=code,
                 ttl_minutes=ttl_minutes,
             )
+            error = None
+            break
+        except Exception as exc:
+            error = exc
+
+    db = SessionLocal()
+    try:
+        if error is None:
+            _write_audit(
+                db,
+                action=f"{kind}_email",
+                status="success",
+                ip_address=ip_address,
+                user_agent=user_agent,
+                user_id=user_id,
+                detail={
+                    "to_email": email,
+                    "provider": send_result.provider if send_result else "unknown",
+                    "provider_message_id": (send_result.provider_message_id if send_result else None),
+                },
+            )
         else:
-            send_result = send_password_reset_email(
-                to_email=email,
-                username=user_id,
-                code=code,
-                ttl_minutes=ttl_minutes,
+            _write_audit(
+                db,
+                action=f"{kind}_email",
+                status="failed",
+                ip_address=ip_address,
+                user_agent=user_agent,
+                user_id=user_id,
+                detail={"to_email": email, "reason": str(error), "attempts": EMAIL_SEND_ATTEMPTS},
             )
-        provider = send_result.provider if send_result else "unknown"
-        _audit(
-            db,
-            action=f"{kind}_email",
-            status="success",
-            request=request,
-            user_id=user_id,
-            detail={
-                "to_email": email,
-                "provider": provider,
-                "provider_message_id": (send_result.provider_message_id if send_result else None),
-            },
-        )
-        return True, provider
-    except Exception as exc:
+    finally:
+        db.close()
+
+
+def _send_code_email(
+    db: Session,
+    background_tasks: BackgroundTasks,
+    *,
+    request: Request,
+    user_id: str,
+    email: str | None,
+    kind: str,
+    code: str,
+) -> str:
+    if not email:
+        return "missing_email"
+    if not mail_is_configured():
         _audit(
             db,
             action=f"{kind}_email",
-            status="failed",
+            status="skipped",
             request=request,
             user_id=user_id,
-            detail={"to_email": email, "reason": str(exc)},
+            detail={"reason": "mail_not_configured"},
         )
-        return False, "send_failed"
+        return "mail_not_configured"
+
+    ip_address, user_agent = _request_context(request)
+    background_tasks.add_task(
+        _deliver_code_email,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        user_id=user_id,
+        email=email,
+        kind=kind,
+        code=code,
+    )
+    _audit(
+        db,
+        action=f"{kind}_email",
+        status="queued",
+        request=request,
+        user_id=user_id,
+        detail={"to_email": email},
+    )
+    return "queued"
 
 
-def _issue_session_tokens(db: Session, *, user_id: str, request: Request) -> dict:
+def _issue_session_tokens(
+    db: Session,
+    *,
+    user_id: str,
+    request: Request,
+    commit: bool = True,
+) -> dict:
     refresh_raw = create_refresh_token()
     refresh_hash = hash_token(refresh_raw)
     now = datetime.utcnow()
@@ -174,7 +274,8 @@ def _issue_session_tokens(db: Session, *, user_id: str, request: Request) -> dic
             user_agent=user_agent,
         )
     )
-    db.commit()
+    if commit:
+        db.commit()
 
     return {
         "auth_token": create_access_token(user_id),
@@ -185,7 +286,12 @@ def _issue_session_tokens(db: Session, *, user_id: str, request: Request) -> dic
 
 
 @router.post("/register", response_model=AuthOut)
-def register(payload: AuthRegisterIn, request: Request, db: Session = Depends(get_db)):
+def register(
+    payload: AuthRegisterIn,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     username = _normalize_username(payload.username)
     email = _normalize_email(payload.email)
     if len(username) < 3:
@@ -205,13 +311,15 @@ def register(payload: AuthRegisterIn, request: Request, db: Session = Depends(ge
     if settings.auth_require_email_verification and not email:
         raise HTTPException(status_code=400, detail="Email is required for account verification")
 
-    existing = db.query(StudentAccount).filter(StudentAccount.username == username).one_or_none()
-    if existing:
-        raise HTTPException(status_code=409, detail="Username already exists")
+    # One round-trip for both uniqueness checks; at most two rows can match.
+    identity_filter = StudentAccount.username == username
     if email:
-        existing_email = db.query(StudentAccount).filter(StudentAccount.email == email).one_or_none()
-        if existing_email:
-            raise HTTPException(status_code=409, detail="Email already exists")
+        identity_filter = or_(identity_filter, StudentAccount.email == email)
+    taken = db.query(StudentAccount.username, StudentAccount.email).filter(identity_filter).all()
+    if any(row.username == username for row in taken):
+        raise HTTPException(status_code=409, detail="Username already exists")
+    if taken:
+        raise HTTPException(status_code=409, detail="Email already exists")
 
     salt, digest = hash_password(payload.password)
     account = StudentAccount(
@@ -231,8 +339,6 @@ def register(payload: AuthRegisterIn, request: Request, db: Session = Depends(ge
             dev_code = code
 
     db.add(account)
-    db.commit()
-
     _audit(
         db,
         action="register",
@@ -240,14 +346,16 @@ def register(payload: AuthRegisterIn, request: Request, db: Session = Depends(ge
         request=request,
         user_id=username,
         detail={"email_provided": bool(email)},
+        commit=False,
     )
+    db.commit()
 
     if settings.auth_require_email_verification:
-        delivered = False
         delivery_state = "missing_email"
         if account.email_verification_code:
-            delivered, delivery_state = _send_code_email(
+            delivery_state = _send_code_email(
                 db,
+                background_tasks,
                 request=request,
                 user_id=username,
                 email=account.email,
@@ -255,7 +363,7 @@ def register(payload: AuthRegisterIn, request: Request, db: Session = Depends(ge
                 code=account.email_verification_code,
             )
 
-        if delivered:
+        if delivery_state == "queued":
             message = "Account created. Check your email for the verification code before login."
         elif delivery_state == "mail_not_configured":
             message = (
@@ -288,7 +396,11 @@ def login(payload: AuthLoginIn, request: Request, db: Session = Depends(get_db))
     throttle_key = _login_throttle_key(username, request)
     auth_login_rate_limiter.check(throttle_key)
 
-    account = db.query(StudentAccount).filter(StudentAccount.username == username).one_or_none()
+    account = _account_by_username(db, username)
+    # Always pay for one PBKDF2 run so response time does not reveal whether the
+    # username exists.
+    salt, digest = (account.password_salt, account.password_hash) if account else _DUMMY_PASSWORD_HASH
+    password_ok = verify_password(payload.password, salt, digest)
     if not account or not account.is_active:
         _audit(
             db,
@@ -299,7 +411,7 @@ def login(payload: AuthLoginIn, request: Request, db: Session = Depends(get_db))
             detail={"reason": "unknown_or_inactive_user"},
         )
         raise HTTPException(status_code=401, detail="Invalid username or password")
-    if not verify_password(payload.password, account.password_salt, account.password_hash):
+    if not password_ok:
         _audit(
             db,
             action="login",
@@ -317,7 +429,6 @@ def login(payload: AuthLoginIn, request: Request, db: Session = Depends(get_db))
         ):
             account.email_verification_code = one_time_code()
             account.email_verification_expires_at = expiry_from_now(settings.auth_email_code_ttl_seconds)
-            db.commit()
         _audit(
             db,
             action="login",
@@ -329,24 +440,25 @@ def login(payload: AuthLoginIn, request: Request, db: Session = Depends(get_db))
         raise HTTPException(status_code=403, detail="Email verification required")
 
     auth_login_rate_limiter.clear(throttle_key)
+    # Last-login stamp, new session row and audit row go out in one transaction.
     account.last_login_at = datetime.utcnow()
-    db.commit()
-
-    tokens = _issue_session_tokens(db, user_id=username, request=request)
+    tokens = _issue_session_tokens(db, user_id=username, request=request, commit=False)
     _audit(
         db,
         action="login",
         status="success",
         request=request,
         user_id=username,
+        commit=False,
     )
+    db.commit()
     return {"user_id": username, **tokens}
 
 
 @router.post("/verify-email", response_model=AuthActionOut)
 def verify_email(payload: AuthVerifyEmailIn, request: Request, db: Session = Depends(get_db)):
     username = _normalize_username(payload.username)
-    account = db.query(StudentAccount).filter(StudentAccount.username == username).one_or_none()
+    account = _account_by_username(db, username)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     if account.email_verified:
@@ -378,10 +490,11 @@ def verify_email(payload: AuthVerifyEmailIn, request: Request, db: Session = Dep
 def resend_verification(
     payload: AuthResendVerificationIn,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     username = _normalize_username(payload.username)
-    account = db.query(StudentAccount).filter(StudentAccount.username == username).one_or_none()
+    account = _account_by_username(db, username)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     if account.email_verified:
@@ -391,8 +504,9 @@ def resend_verification(
     account.email_verification_expires_at = expiry_from_now(settings.auth_email_code_ttl_seconds)
     db.commit()
     dev_code = account.email_verification_code if settings.auth_dev_return_codes else None
-    delivered, delivery_state = _send_code_email(
+    delivery_state = _send_code_email(
         db,
+        background_tasks,
         request=request,
         user_id=username,
         email=account.email,
@@ -408,15 +522,13 @@ def resend_verification(
         detail={"email_delivery": delivery_state},
     )
     message = "Verification code re-issued."
-    if delivered:
+    if delivery_state == "queued":
         message = "Verification code sent to your email."
     elif delivery_state == "mail_not_configured":
         message = (
             "Verification code generated, but email delivery is not configured. "
             "Configure SMTP to receive codes by email."
         )
-    elif delivery_state == "send_failed":
-        message = "Verification code generated, but email delivery failed. Try again."
     return {
         "ok": True,
         "message": message,
@@ -425,12 +537,17 @@ def resend_verification(
 
 
 @router.post("/password/forgot", response_model=AuthActionOut)
-def forgot_password(payload: AuthPasswordForgotIn, request: Request, db: Session = Depends(get_db)):
+def forgot_password(
+    payload: AuthPasswordForgotIn,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     username = _normalize_username(payload.username) if payload.username else None
     email = _normalize_email(payload.email)
     account = None
     if username:
-        account = db.query(StudentAccount).filter(StudentAccount.username == username).one_or_none()
+        account = _account_by_username(db, username)
     elif email:
         account = db.query(StudentAccount).filter(StudentAccount.email == email).one_or_none()
 
@@ -443,24 +560,21 @@ def forgot_password(payload: AuthPasswordForgotIn, request: Request, db: Session
         db.commit()
         if settings.auth_dev_return_codes:
             dev_code = account.password_reset_code
-        delivered, delivery_state = _send_code_email(
+        delivery_state = _send_code_email(
             db,
+            background_tasks,
             request=request,
             user_id=account.username,
             email=account.email,
             kind="password_reset",
             code=account.password_reset_code,
         )
-        if delivered:
+        if delivery_state == "queued":
             message = "If the account exists, a reset code has been sent to email."
         elif delivery_state == "mail_not_configured":
             message = (
                 "If the account exists, a reset code was created but email delivery is not configured."
             )
-        elif delivery_state == "send_failed":
-            message = (
-                "If the account exists, a reset code was created but email send failed. Try again."
-            )
         _audit(
             db,
             action="forgot_password",
@@ -492,7 +606,7 @@ def reset_password(payload: AuthPasswordResetIn, request: Request, db: Session =
             ),
         )
 
-    account = db.query(StudentAccount).filter(StudentAccount.username == username).one_or_none()
+    account = _account_by_username(db, username)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     if not account.password_reset_code or not account.password_reset_expires_at:
@@ -527,30 +641,29 @@ def reset_password(payload: AuthPasswordResetIn, request: Request, db: Session =
 @router.post("/refresh", response_model=AuthOut)
 def refresh_token(payload: AuthRefreshIn, request: Request, db: Session = Depends(get_db)):
     token_hash = hash_token(payload.refresh_token)
-    session = (
-        db.query(AuthSession)
-        .filter(AuthSession.refresh_token_hash == token_hash)
-        .one_or_none()
-    )
-    if not session or session.revoked_at is not None or session.expires_at < datetime.utcnow():
+    session = _active_session_by_hash(db, token_hash)
+    if not session or session.expires_at < datetime.utcnow():
         raise HTTPException(status_code=401, detail="Invalid refresh token")
 
     user_id = session.user_id
     session.revoked_at = datetime.utcnow()
+    tokens = _issue_session_tokens(db, user_id=user_id, request=request, commit=False)
+    _audit(
+        db,
+        action="refresh_token",
+        status="success",
+        request=request,
+        user_id=user_id,
+        commit=False,
+    )
     db.commit()
-    tokens = _issue_session_tokens(db, user_id=user_id, request=request)
-    _audit(db, action="refresh_token", status="success", request=request, user_id=user_id)
     return {"user_id": user_id, **tokens}
 
 
 @router.post("/logout", response_model=AuthActionOut)
 def logout(payload: AuthLogoutIn, request: Request, db: Session = Depends(get_db)):
     token_hash = hash_token(payload.refresh_token)
-    session = (
-        db.query(AuthSession)
-        .filter(AuthSession.refresh_token_hash == token_hash)
-        .one_or_none()
-    )
+    session = _active_session_by_hash(db, token_hash)
     if not session:
         return {"ok": True, "message": "Session already ended."}
     session.revoked_at = datetime.utcnow()
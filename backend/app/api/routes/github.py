@@ -1,20 +1,30 @@
 """GitHub Signal Auditor - analyzes a user's GitHub repos to verify skills and contribution velocity."""
 from __future__ import annotations
 
+import json
+import random
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from threading import Lock
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+
+from app.core.config import settings
+from app.services.http_clients import github_client
 
 GITHUB_API_BASE = "https://api.github.com"
-REQUEST_TIMEOUT = 10.0
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_BASE}/graphql"
 RECENT_WINDOW_DAYS = 90
-HEADERS = {
-    "Accept": "application/vnd.github+json",
-    "User-Agent": "MarketReadySignalAuditor/1.0",
-}
+AUDIT_REPO_SAMPLE = 5
+_USERNAME_RE = re.compile(r"^[a-zA-Z0-9-]{1,39}$")
+AUDIT_CACHE_TTL_SECONDS = 10 * 60
+AUDIT_CACHE_JITTER_SECONDS = 60
+AUDIT_CACHE_STALE_SECONDS = 5 * 60
+RAW_CONTENT_ACCEPT = "application/vnd.github.raw+json"
 
 # Dependency -> skill mappings
 DEP_SKILL_MAP: dict[str, list[str]] = {
@@ -64,6 +74,11 @@ COMMIT_SKILL_KEYWORDS = {
 
 router = APIRouter(prefix="/github")
 
+_audit_cache_lock = Lock()
+# username -> (fresh_until, stale_until, audit payload)
+_audit_cache: dict[str, tuple[float, float, dict[str, Any]]] = {}
+_audit_refreshing: set[str] = set()
+
 
 def _fetch_repos(client: httpx.Client, username: str) -> list[dict]:
     resp = client.get(
@@ -72,69 +87,253 @@ def _fetch_repos(client: httpx.Client, username: str) -> list[dict]:
     )
     if resp.status_code == 404:
         raise HTTPException(status_code=404, detail=f"GitHub user '{username}' not found")
-    if resp.status_code == 403:
-        return []
+    if resp.status_code in (403, 429):
+        # Almost always the rate limit; an empty list here would read as "no repos".
+        raise HTTPException(status_code=503, detail="GitHub rate limit reached, try again later")
     resp.raise_for_status()
     return resp.json() if isinstance(resp.json(), list) else []
 
 
-def _fetch_package_json(client: httpx.Client, owner: str, repo: str) -> dict | None:
+def _parse_package_json(content: str | None) -> dict | None:
+    if not content:
+        return None
     try:
-        resp = client.get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/package.json")
-        if resp.status_code != 200:
-            return None
-        import base64 as b64, json as _json2
-        content_b64 = resp.json().get("content", "")
-        content = b64.b64decode(content_b64.replace("\n", "")).decode("utf-8")
-        return _json2.loads(content)
-    except Exception:
+        parsed = json.loads(content)
+    except ValueError:
         return None
+    return parsed if isinstance(parsed, dict) else None
 
 
-def _fetch_requirements_txt(client: httpx.Client, owner: str, repo: str) -> list[str]:
-    try:
-        resp = client.get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/requirements.txt")
-        if resp.status_code != 200:
-            return []
-        import base64
-        content_b64 = resp.json().get("content", "")
-        content = base64.b64decode(content_b64.replace("\n", "")).decode("utf-8")
-        return [line.split("==")[0].split(">=")[0].strip().lower() for line in content.splitlines() if line.strip() and not line.startswith("#")]
-    except Exception:
+def _parse_requirements_txt(content: str | None) -> list[str]:
+    if not content:
         return []
+    return [line.split("==")[0].split(">=")[0].strip().lower() for line in content.splitlines() if line.strip() and not line.startswith("#")]
+
+
+def _fetch_raw_file(client: httpx.Client, owner: str, repo: str, path: str) -> str | None:
+    # The raw media type returns the file body itself instead of a JSON wrapper
+    # around base64 content.
+    resp = client.get(
+        f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}",
+        headers={"Accept": RAW_CONTENT_ACCEPT},
+    )
+    if resp.status_code == 404:
+        return None
+    # Anything else unexpected (rate limit, server error) raises so the audit is
+    # marked incomplete instead of looking like a repo without the file.
+    resp.raise_for_status()
+    return resp.text if resp.status_code == 200 else None
+
+
+def _fetch_package_json(client: httpx.Client, owner: str, repo: str) -> dict | None:
+    return _parse_package_json(_fetch_raw_file(client, owner, repo, "package.json"))
+
+
+def _fetch_requirements_txt(client: httpx.Client, owner: str, repo: str) -> list[str]:
+    return _parse_requirements_txt(_fetch_raw_file(client, owner, repo, "requirements.txt"))
 
 
 def _fetch_recent_commits(client: httpx.Client, owner: str, repo: str) -> list[dict]:
+    since = (datetime.now(timezone.utc) - timedelta(days=RECENT_WINDOW_DAYS)).isoformat()
+    resp = client.get(
+        f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits",
+        params={"per_page": 30, "since": since},
+    )
+    # 409 is an empty repository, 404 one that disappeared; neither has commits.
+    if resp.status_code in (404, 409):
+        return []
+    resp.raise_for_status()
+    return resp.json() if isinstance(resp.json(), list) else []
+
+
+def _result_or_default(future, default):
+    """Return (result, True), or (default, False) when the fetch failed."""
     try:
-        since = (datetime.now(timezone.utc) - timedelta(days=RECENT_WINDOW_DAYS)).isoformat()
-        resp = client.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits",
-            params={"per_page": 30, "since": since},
-        )
-        if resp.status_code != 200:
-            return []
-        return resp.json() if isinstance(resp.json(), list) else []
+        return future.result(), True
     except Exception:
-        return []
+        return default, False
+
+
+def _collect_via_rest(
+    client: httpx.Client, username: str
+) -> tuple[dict, list[dict], list[tuple[dict, dict | None, list[str], list[dict]]], bool]:
+    """REST fan-out; the last element is False when any request did not succeed."""
+    user_resp = client.get(f"{GITHUB_API_BASE}/users/{username}")
+    if user_resp.status_code == 404:
+        raise HTTPException(status_code=404, detail=f"GitHub user '{username}' not found")
+    complete = user_resp.status_code == 200
+    user_data = user_resp.json() if complete else {}
+
+    repos = _fetch_repos(client, username)
+    if not repos:
+        return user_data, [], [], complete
+
+    # Every fetch is independent, so all of them are issued at once and the
+    # results collected in repo order afterwards.
+    sampled = repos[:AUDIT_REPO_SAMPLE]
+    with ThreadPoolExecutor(max_workers=max(1, len(sampled) * 3)) as pool:
+        pending = []
+        for repo in sampled:
+            repo_name = repo.get("name", "")
+            owner = repo.get("owner", {}).get("login", username)
+            pending.append(
+                (
+                    repo,
+                    pool.submit(_fetch_package_json, client, owner, repo_name),
+                    pool.submit(_fetch_requirements_txt, client, owner, repo_name),
+                    pool.submit(_fetch_recent_commits, client, owner, repo_name),
+                )
+            )
+        sampled_files = []
+        for repo, pkg, reqs, commits in pending:
+            pkg_data, pkg_ok = _result_or_default(pkg, None)
+            reqs_data, reqs_ok = _result_or_default(reqs, [])
+            commits_data, commits_ok = _result_or_default(commits, [])
+            complete = complete and pkg_ok and reqs_ok and commits_ok
+            sampled_files.append((repo, pkg_data, reqs_data, commits_data))
+    return user_data, repos, sampled_files, complete
+
+
+_AUDIT_GRAPHQL_QUERY = """
+query Audit($login: String!, $since: GitTimestamp!, $sample: Int!) {
+  user(login: $login) {
+    bio
+    followers { totalCount }
+    publicRepos: repositories(privacy: PUBLIC) { totalCount }
+    repos: repositories(
+      first: 30, privacy: PUBLIC, ownerAffiliations: OWNER,
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      nodes {
+        name
+        createdAt
+        pushedAt
+        stargazerCount
+        owner { login }
+        primaryLanguage { name }
+      }
+    }
+    sampled: repositories(
+      first: $sample, privacy: PUBLIC, ownerAffiliations: OWNER,
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      nodes {
+        packageJson: object(expression: "HEAD:package.json") { ... on Blob { text } }
+        requirementsTxt: object(expression: "HEAD:requirements.txt") { ... on Blob { text } }
+        defaultBranchRef {
+          target {
+            ... on Commit { history(first: 30, since: $since) { nodes { message } } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _collect_via_graphql(
+    client: httpx.Client, username: str
+) -> tuple[dict, list[dict], list[tuple[dict, dict | None, list[str], list[dict]]]] | None:
+    """Fetch everything the audit needs in one GraphQL request.
+
+    Returns None when GraphQL cannot answer (rate limit, auth or schema errors) so
+    the caller can fall back to the REST fan-out.
+    """
+    since = (datetime.now(timezone.utc) - timedelta(days=RECENT_WINDOW_DAYS)).isoformat()
+    resp = client.post(
+        GITHUB_GRAPHQL_URL,
+        json={
+            "query": _AUDIT_GRAPHQL_QUERY,
+            "variables": {"login": username, "since": since, "sample": AUDIT_REPO_SAMPLE},
+        },
+        headers={"Authorization": f"Bearer {settings.github_token}"},
+    )
+    if resp.status_code != 200:
+        return None
+    body = resp.json()
+    errors = body.get("errors") or []
+    user = (body.get("data") or {}).get("user")
+    if user is None:
+        if any(error.get("type") == "NOT_FOUND" for error in errors):
+            raise HTTPException(status_code=404, detail=f"GitHub user '{username}' not found")
+        return None
+    if errors:
+        return None
+
+    # Reshape into the REST payloads the scoring helpers already understand.
+    user_data = {
+        "bio": user.get("bio"),
+        "followers": (user.get("followers") or {}).get("totalCount", 0),
+        "public_repos": (user.get("publicRepos") or {}).get("totalCount", 0),
+    }
+    repos = [
+        {
+            "name": node.get("name", ""),
+            "owner": {"login": (node.get("owner") or {}).get("login", username)},
+            "language": (node.get("primaryLanguage") or {}).get("name"),
+            "created_at": node.get("createdAt"),
+            "pushed_at": node.get("pushedAt"),
+            "stargazers_count": node.get("stargazerCount") or 0,
+        }
+        for node in (user.get("repos") or {}).get("nodes") or []
+        if node
+    ]
+    sampled_nodes = (user.get("sampled") or {}).get("nodes") or []
+    sampled_files = []
+    for repo, node in zip(repos, sampled_nodes):
+        node = node or {}
+        target = ((node.get("defaultBranchRef") or {}).get("target")) or {}
+        history = (target.get("history") or {}).get("nodes") or []
+        sampled_files.append(
+            (
+                repo,
+                _parse_package_json((node.get("packageJson") or {}).get("text")),
+                _parse_requirements_txt((node.get("requirementsTxt") or {}).get("text")),
+                [{"commit": {"message": commit.get("message")}} for commit in history if commit],
+            )
+        )
+    return user_data, repos, sampled_files
+
+
+def _compile_keyword_matcher(mapping: dict[str, list[str]]) -> tuple[re.Pattern[str], dict[str, frozenset[str]]]:
+    """Build one pattern that finds every keyword occurrence in a single scan.
+
+    The zero-width lookahead reports a match at every offset, so overlapping
+    keywords are all seen. Only the longest keyword starting at an offset is
+    reported, so each keyword also carries the skills of keywords that are its
+    prefixes. The result is identical to testing `keyword in text` for each one.
+    """
+    keywords = sorted(mapping, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))")
+    skills_by_match = {
+        keyword: frozenset(
+            skill for other, mapped in mapping.items() if keyword.startswith(other) for skill in mapped
+        )
+        for keyword in keywords
+    }
+    return pattern, skills_by_match
+
+
+_DEP_MATCHER, _DEP_MATCH_SKILLS = _compile_keyword_matcher(DEP_SKILL_MAP)
+_COMMIT_MATCHER, _COMMIT_MATCH_SKILLS = _compile_keyword_matcher(COMMIT_SKILL_KEYWORDS)
 
 
 def _extract_skills_from_deps(deps: list[str]) -> set[str]:
     skills: set[str] = set()
     for dep in deps:
-        dep_lower = dep.lower().strip()
-        for keyword, mapped in DEP_SKILL_MAP.items():
-            if keyword in dep_lower:
-                skills.update(mapped)
+        for match in _DEP_MATCHER.finditer(dep.lower().strip()):
+            skills.update(_DEP_MATCH_SKILLS[match.group(1)])
     return skills
 
 
 def _extract_skills_from_commits(commits: list[dict]) -> set[str]:
+    # No keyword contains a newline, so one scan over the joined messages finds
+    # exactly the matches a per-message scan would.
+    messages = "\n".join((commit.get("commit", {}).get("message") or "") for commit in commits).lower()
     skills: set[str] = set()
-    for commit in commits:
-        msg = (commit.get("commit", {}).get("message") or "").lower()
-        for keyword, mapped in COMMIT_SKILL_KEYWORDS.items():
-            if keyword in msg:
-                skills.update(mapped)
+    for match in _COMMIT_MATCHER.finditer(messages):
+        skills.update(_COMMIT_MATCH_SKILLS[match.group(1)])
     return skills
 
 
@@ -179,81 +378,58 @@ def _compute_velocity(repos: list[dict], total_commits: int) -> dict:
     }
 
 
-@router.get("/audit/{username}")
-def audit_github_user(username: str) -> dict[str, Any]:
-    """Analyze a GitHub user's repositories for skills and contribution velocity."""
-    if not username or not re.match(r"^[a-zA-Z0-9\-]{1,39}$", username):
-        raise HTTPException(status_code=400, detail="Invalid GitHub username")
-
+def _run_audit(username: str) -> tuple[dict[str, Any], bool]:
+    """Run the audit; the flag is False when GitHub did not answer every request."""
     verified_skills: set[str] = set()
     commit_skill_signals: set[str] = set()
     total_commits = 0
     warnings: list[str] = []
 
     try:
-        with httpx.Client(timeout=REQUEST_TIMEOUT, headers=HEADERS, follow_redirects=True) as client:
-            # Fetch user info
-            user_resp = client.get(f"{GITHUB_API_BASE}/users/{username}")
-            if user_resp.status_code == 404:
-                raise HTTPException(status_code=404, detail=f"GitHub user '{username}' not found")
-            user_data = user_resp.json() if user_resp.status_code == 200 else {}
-
-            repos = _fetch_repos(client, username)
-            if not repos:
-                return {
-                    "username": username,
-                    "verified_skills": [],
-                    "commit_skill_signals": [],
-                    "velocity": {"velocity_score": 0, "recent_repos": 0, "total_repos": 0, "total_commits_sampled": 0, "languages": [], "stars": 0},
-                    "warnings": ["No public repositories found"],
-                    "bulk_upload_detected": False,
-                    "profile": {"public_repos": 0, "followers": 0, "bio": None},
-                }
-
-            bulk_flag = _check_bulk_upload(repos)
-            if bulk_flag:
-                warnings.append("Bulk repo upload pattern detected — skills may be unverified")
-
-            # Analyze top 5 repos for dependencies
-            for repo in repos[:5]:
-                repo_name = repo.get("name", "")
-                owner = repo.get("owner", {}).get("login", username)
-                lang = (repo.get("language") or "").strip()
-                if lang:
-                    verified_skills.add(lang)
-
-                # Check package.json
-                pkg = _fetch_package_json(client, owner, repo_name)
-                if pkg:
-                    deps = list(pkg.get("dependencies", {}).keys()) + list(pkg.get("devDependencies", {}).keys())
-                    verified_skills.update(_extract_skills_from_deps(deps))
-
-                # Check requirements.txt
-                reqs = _fetch_requirements_txt(client, owner, repo_name)
-                if reqs:
-                    verified_skills.update(_extract_skills_from_deps(reqs))
-
-                # Fetch recent commits
-                commits = _fetch_recent_commits(client, owner, repo_name)
-                total_commits += len(commits)
-                commit_skill_signals.update(_extract_skills_from_commits(commits))
-
-            velocity = _compute_velocity(repos, total_commits)
-
-            # Language-to-skill mapping
-            LANG_SKILLS = {
-                "Python": "Python",
-                "JavaScript": "JavaScript",
-                "TypeScript": "TypeScript",
-                "Java": "Java",
-                "Go": "Go",
-                "Rust": "Rust",
-                "C#": "C#",
-                "SQL": "SQL",
-            }
-            for lang, skill in LANG_SKILLS.items():
-                if lang in verified_skills:
-                    verified_skills.add(skill)
+        client = github_client()
+        collected = _collect_via_graphql(client, username) if settings.github_token else None
+        if collected is None:
+            user_data, repos, sampled_files, complete = _collect_via_rest(client, username)
+        else:
+            user_data, repos, sampled_files = collected
+            complete = True
+        if not complete:
+            warnings.append("GitHub did not answer every request; results may be incomplete")
+        if not repos:
+            return {
+                "username": username,
+                "verified_skills": [],
+                "commit_skill_signals": [],
+                "velocity": {"velocity_score": 0, "recent_repos": 0, "total_repos": 0, "total_commits_sampled": 0, "languages": [], "stars": 0},
+                "warnings": warnings + ["No public repositories found"],
+                "bulk_upload_detected": False,
+                "profile": {"public_repos": 0, "followers": 0, "bio": None},
+            }, complete
+
+        bulk_flag = _check_bulk_upload(repos)
+        if bulk_flag:
+            warnings.append("Bulk repo upload pattern detected — skills may be unverified")
+
+        # Analyze top repos for dependencies
+        for repo, pkg, reqs, commits in sampled_files:
+            lang = (repo.get("language") or "").strip()
+            if lang:
+                verified_skills.add(lang)
+
+            # Check package.json
+            if pkg:
+                deps = list(pkg.get("dependencies", {}).keys()) + list(pkg.get("devDependencies", {}).keys())
+                verified_skills.update(_extract_skills_from_deps(deps))
+
+            # Check requirements.txt
+            if reqs:
+                verified_skills.update(_extract_skills_from_deps(reqs))
+
+            # Recent commits
+            total_commits += len(commits)
+            commit_skill_signals.update(_extract_skills_from_commits(commits))
+
+        velocity = _compute_velocity(repos, total_commits)
 
     except HTTPException:
         raise
@@ -272,4 +448,53 @@ def audit_github_user(username: str) -> dict[str, Any]:
             "followers": int(user_data.get("followers") or 0),
             "bio": user_data.get("bio"),
         },
-    }
+    }, complete
+
+
+def _store_audit(username: str, result: dict[str, Any], complete: bool) -> None:
+    if not complete:
+        # A partial answer (rate limit, GitHub errors) must not be pinned for the
+        # whole TTL; the next request tries again.
+        return
+    now = time.monotonic()
+    # Jitter spreads expiries so audits cached together do not all refetch at once.
+    fresh_until = now + AUDIT_CACHE_TTL_SECONDS + random.uniform(0, AUDIT_CACHE_JITTER_SECONDS)
+    with _audit_cache_lock:
+        _audit_cache[username] = (fresh_until, fresh_until + AUDIT_CACHE_STALE_SECONDS, result)
+        if len(_audit_cache) > 256:
+            oldest_key = min(_audit_cache.items(), key=lambda item: item[1][1])[0]
+            _audit_cache.pop(oldest_key, None)
+
+
+def _refresh_audit(username: str) -> None:
+    try:
+        _store_audit(username, *_run_audit(username))
+    except Exception:
+        # Keep serving the stale entry until it ages out; the next miss retries.
+        pass
+    finally:
+        with _audit_cache_lock:
+            _audit_refreshing.discard(username)
+
+
+@router.get("/audit/{username}")
+def audit_github_user(username: str, background_tasks: BackgroundTasks) -> dict[str, Any]:
+    """Analyze a GitHub user's repositories for skills and contribution velocity."""
+    if not username or not _USERNAME_RE.match(username):
+        raise HTTPException(status_code=400, detail="Invalid GitHub username")
+
+    now = time.monotonic()
+    with _audit_cache_lock:
+        cached = _audit_cache.get(username)
+        if cached and cached[0] > now:
+            return cached[2]
+        if cached and cached[1] > now:
+            # Stale-while-revalidate: answer now, refresh once in the background.
+            if username not in _audit_refreshing:
+                _audit_refreshing.add(username)
+                background_tasks.add_task(_refresh_audit, username)
+            return cached[2]
+
+    result, complete = _run_audit(username)
+    _store_audit(username, result, complete)
+    return result
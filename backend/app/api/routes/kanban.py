@@ -1,17 +1,26 @@
 """Interactive 90-Day Pivot Kanban — CRUD + AI-generated plan."""
 from __future__ import annotations
+import hashlib
 import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import Lock
 from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import and_, func, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user_id
+from app.core.database import release_connection
+from app.core.ids import uuid7
 from app.models.entities import KanbanTask, StudentProfile, UserPathway
-from app.services.ai import _call_llm, ai_is_configured
+from app.services.ai import _call_llm, ai_is_configured, get_active_ai_model
+from app.services.http_clients import github_client
 import json as _json
 
 def _safe_json(text: str) -> dict | None:
@@ -28,6 +37,28 @@ def _safe_json(text: str) -> dict | None:
 
 router = APIRouter(prefix="/kanban")
 
+# The plan prompt only depends on pathway, top gaps and whether GitHub is linked,
+# so students with the same context can share one generated plan for a while.
+AI_PLAN_CACHE_TTL_SECONDS = 6 * 60 * 60
+_ai_plan_cache_lock = Lock()
+_ai_plan_cache: dict[str, tuple[float, list[dict]]] = {}
+
+
+def _cached_ai_plan(cache_key: str) -> list[dict] | None:
+    with _ai_plan_cache_lock:
+        cached = _ai_plan_cache.get(cache_key)
+    if cached and cached[0] > time.time():
+        return cached[1]
+    return None
+
+
+def _store_ai_plan(cache_key: str, tasks: list[dict]) -> None:
+    with _ai_plan_cache_lock:
+        _ai_plan_cache[cache_key] = (time.time() + AI_PLAN_CACHE_TTL_SECONDS, tasks)
+        if len(_ai_plan_cache) > 256:
+            oldest_key = min(_ai_plan_cache.items(), key=lambda item: item[1][0])[0]
+            _ai_plan_cache.pop(oldest_key, None)
+
 
 class TaskCreateIn(BaseModel):
     title: str
@@ -65,22 +96,41 @@ def _serialize_task(task: KanbanTask) -> dict:
     }
 
 
+# The board reads plain columns; the UUID and datetime values are left for the
+# response serializer to encode (same strings as str()/isoformat()).
+_BOARD_COLUMNS = (
+    KanbanTask.id,
+    KanbanTask.title,
+    KanbanTask.description,
+    KanbanTask.status,
+    KanbanTask.week_number,
+    KanbanTask.skill_tag,
+    KanbanTask.priority,
+    KanbanTask.github_synced,
+    KanbanTask.ai_generated,
+    KanbanTask.sort_order,
+    KanbanTask.created_at,
+    KanbanTask.updated_at,
+)
+_BOARD_FIELDS = tuple(column.key for column in _BOARD_COLUMNS)
+
+
 @router.get("/board")
 def get_board(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
-    tasks = (
-        db.query(KanbanTask)
-        .filter(KanbanTask.user_id == user_id)
+    rows = db.execute(
+        select(*_BOARD_COLUMNS)
+        .where(KanbanTask.user_id == user_id)
         .order_by(KanbanTask.sort_order.asc(), KanbanTask.created_at.asc())
-        .all()
-    )
+    ).all()
     board = {"todo": [], "in_progress": [], "done": []}
-    for task in tasks:
-        col = task.status if task.status in board else "todo"
-        board[col].append(_serialize_task(task))
-    return {"board": board, "total": len(tasks)}
+    for row in rows:
+        task = dict(zip(_BOARD_FIELDS, row))
+        col = task["status"] if task["status"] in board else "todo"
+        board[col].append(task)
+    return {"board": board, "total": len(rows)}
 
 
 @router.post("/tasks")
@@ -89,6 +139,7 @@ def create_task(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
+    now = datetime.utcnow()
     task = KanbanTask(
         user_id=user_id,
         title=payload.title.strip(),
@@ -100,8 +151,8 @@ def create_task(
         sort_order=0,
         ai_generated=False,
         github_synced=False,
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        created_at=now,
+        updated_at=now,
     )
     db.add(task)
     db.commit()
@@ -158,32 +209,56 @@ def _get_user_context(db: Session, user_id: str) -> dict:
     from app.models.entities import (
         ChecklistItem, ChecklistVersion, Proof, StudentProfile, UserPathway as UPAlias, CareerPathway
     )
-    selection = db.query(UPAlias).filter(UPAlias.user_id == user_id).one_or_none()
-    profile = db.query(StudentProfile).filter(StudentProfile.user_id == user_id).one_or_none()
+    # Selection, pathway name and effective checklist version in one round-trip;
+    # the latest published version only stands in when none is pinned.
+    latest_published = (
+        select(ChecklistVersion.id)
+        .where(ChecklistVersion.pathway_id == UPAlias.pathway_id)
+        .where(ChecklistVersion.status == "published")
+        .order_by(ChecklistVersion.version_number.desc())
+        .limit(1)
+        .correlate(UPAlias)
+        .scalar_subquery()
+    )
+    selection = (
+        db.query(
+            CareerPathway.name.label("pathway_name"),
+            func.coalesce(UPAlias.checklist_version_id, latest_published).label("version_id"),
+        )
+        .select_from(UPAlias)
+        .outerjoin(CareerPathway, CareerPathway.id == UPAlias.pathway_id)
+        .filter(UPAlias.user_id == user_id)
+        .one_or_none()
+    )
+    profile = (
+        db.query(StudentProfile.github_username, StudentProfile.semester)
+        .filter(StudentProfile.user_id == user_id)
+        .one_or_none()
+    )
     pathway_name = "Software Engineering"
-    if selection:
-        cp = db.query(CareerPathway).filter(CareerPathway.id == selection.pathway_id).first()
-        if cp:
-            pathway_name = cp.name
+    if selection and selection.pathway_name:
+        pathway_name = selection.pathway_name
 
     gaps = []
-    if selection:
-        version_id = selection.checklist_version_id
-        if not version_id:
-            version = (
-                db.query(ChecklistVersion)
-                .filter(ChecklistVersion.pathway_id == selection.pathway_id)
-                .filter(ChecklistVersion.status == "published")
-                .order_by(ChecklistVersion.version_number.desc())
-                .first()
+    if selection and selection.version_id:
+        # High-tier items with no verified proof, as an anti-join.
+        gap_rows = (
+            db.query(ChecklistItem.title)
+            .outerjoin(
+                Proof,
+                and_(
+                    Proof.checklist_item_id == ChecklistItem.id,
+                    Proof.user_id == user_id,
+                    Proof.status == "verified",
+                ),
             )
-            if version:
-                version_id = version.id
-        if version_id:
-            items = db.query(ChecklistItem).filter(ChecklistItem.version_id == version_id).all()
-            proofs = db.query(Proof).filter(Proof.user_id == user_id).all()
-            verified_ids = {str(p.checklist_item_id) for p in proofs if p.status == "verified"}
-            gaps = [i.title for i in items if str(i.id) not in verified_ids and i.tier in ("non_negotiable", "strong_signal")][:8]
+            .filter(ChecklistItem.version_id == selection.version_id)
+            .filter(ChecklistItem.tier.in_(("non_negotiable", "strong_signal")))
+            .filter(Proof.id.is_(None))
+            .limit(8)
+            .all()
+        )
+        gaps = [row.title for row in gap_rows]
     return {
         "pathway": pathway_name,
         "gaps": gaps,
@@ -198,14 +273,8 @@ def generate_ai_plan(
     db: Session = Depends(get_db),
 ) -> dict[str, Any]:
     """Generate an AI-powered 90-day pivot plan and populate the Kanban board."""
-    # Remove old AI-generated tasks first
-    db.query(KanbanTask).filter(
-        KanbanTask.user_id == user_id,
-        KanbanTask.ai_generated.is_(True),
-    ).delete()
-    db.commit()
-
     context = _get_user_context(db, user_id)
+    release_connection(db)
 
     if ai_is_configured():
         system = (
@@ -219,12 +288,17 @@ def generate_ai_plan(
             "top_gaps": context["gaps"][:6],
             "github": bool(context["github_username"]),
         })
-        try:
-            raw = _call_llm(system, user_msg)
-            parsed = _safe_json(raw)
-            ai_tasks = parsed.get("tasks", []) if parsed else []
-        except Exception:
-            ai_tasks = []
+        cache_key = hashlib.sha256(f"{get_active_ai_model()}|{user_msg}".encode("utf-8")).hexdigest()
+        ai_tasks = _cached_ai_plan(cache_key)
+        if ai_tasks is None:
+            try:
+                raw = _call_llm(system, user_msg)
+                parsed = _safe_json(raw)
+                ai_tasks = parsed.get("tasks", []) if parsed else []
+            except Exception:
+                ai_tasks = []
+            if ai_tasks:
+                _store_ai_plan(cache_key, ai_tasks)
     else:
         ai_tasks = []
 
@@ -232,54 +306,82 @@ def generate_ai_plan(
     if not ai_tasks:
         ai_tasks = _default_90_day_plan(context["gaps"], context["pathway"])
 
-    created = []
-    for i, task_data in enumerate(ai_tasks[:12]):
-        task = KanbanTask(
-            user_id=user_id,
-            title=str(task_data.get("title", "Untitled Task"))[:300],
-            description=task_data.get("description"),
-            status="todo",
-            week_number=int(task_data.get("week_number", (i // 4) + 1)),
-            skill_tag=task_data.get("skill_tag"),
-            priority=task_data.get("priority", "medium"),
-            sort_order=i,
-            ai_generated=True,
-            github_synced=False,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-        db.add(task)
-        created.append(task)
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid7(),
+            "user_id": user_id,
+            "title": str(task_data.get("title", "Untitled Task"))[:300],
+            "description": task_data.get("description"),
+            "status": "todo",
+            "week_number": int(task_data.get("week_number", (i // 4) + 1)),
+            "skill_tag": task_data.get("skill_tag"),
+            "priority": task_data.get("priority", "medium"),
+            "sort_order": i,
+            "ai_generated": True,
+            "github_synced": False,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i, task_data in enumerate(ai_tasks[:12])
+    ]
 
+    # Replace the previous AI plan atomically: one DELETE and one multi-row INSERT.
+    db.query(KanbanTask).filter(
+        KanbanTask.user_id == user_id,
+        KanbanTask.ai_generated.is_(True),
+    ).delete(synchronize_session=False)
+    if rows:
+        db.execute(insert(KanbanTask), rows)
     db.commit()
     return {
-        "tasks_created": len(created),
-        "tasks": [_serialize_task(t) for t in created],
+        "tasks_created": len(rows),
+        "tasks": [_serialize_task(KanbanTask(**row)) for row in rows],
         "ai_powered": ai_is_configured() and bool(ai_tasks),
     }
 
 
+# Steps with a "gap_index" become "Close gap: <gap>" (tagged with the gap) when the
+# user has that many gaps; otherwise their own title and skill_tag are used.
+_DEFAULT_PLAN_TEMPLATES: tuple[dict[str, Any], ...] = (
+    # Phase 1
+    {"title": "Audit your current {pathway} skills", "description": "Review checklist and identify critical gaps", "week_number": 1, "skill_tag": "Planning", "priority": "high"},
+    {"gap_index": 0, "title": "Complete first non-negotiable requirement", "description": "Focus on your #1 priority skill gap", "week_number": 2, "skill_tag": "Core Skills", "priority": "high"},
+    {"title": "Build a proof artifact for Week 2 skill", "description": "Create a project, get a certificate, or submit evidence", "week_number": 3, "skill_tag": "Evidence", "priority": "high"},
+    {"gap_index": 1, "title": "Improve GitHub profile quality", "description": "Add README to all repos, pin top 6 projects", "week_number": 4, "skill_tag": "GitHub", "priority": "medium"},
+    # Phase 2
+    {"title": "Complete a portfolio project (end-to-end)", "description": "Build something deployable that demonstrates your target role skills", "week_number": 5, "skill_tag": "Portfolio", "priority": "high"},
+    {"gap_index": 2, "title": "Add a cloud deployment to portfolio", "description": "Deploy to Vercel, AWS, or Railway", "week_number": 6, "skill_tag": "Cloud", "priority": "medium"},
+    {"title": "Network: Attend 2 online tech events or meetups", "description": "LinkedIn connections + follow-up messages", "week_number": 7, "skill_tag": "Networking", "priority": "medium"},
+    {"title": "Apply to 5 internships or entry-level positions", "description": "Tailor each application with your proof artifacts", "week_number": 8, "skill_tag": "Applications", "priority": "high"},
+    # Phase 3
+    {"title": "Earn a certification: {pathway}", "description": "Complete an industry-recognized certificate to validate skills", "week_number": 9, "skill_tag": "Certification", "priority": "medium"},
+    {"title": "Mock interview practice (3 sessions)", "description": "Use Interview AI or a peer to practice behavioral + technical", "week_number": 10, "skill_tag": "Interview Prep", "priority": "high"},
+    {"title": "Update resume with all new proofs and projects", "description": "Ensure ATS keywords match your target roles", "week_number": 11, "skill_tag": "Resume", "priority": "medium"},
+    {"title": "Final readiness check: run MRI score and address remaining gaps", "description": "Review MRI components and close final gaps before job search", "week_number": 12, "skill_tag": "Review", "priority": "high"},
+)
+
+
 def _default_90_day_plan(gaps: list[str], pathway: str) -> list[dict]:
     """Fallback 90-day plan when AI is unavailable."""
-    phase1 = [
-        {"title": f"Audit your current {pathway} skills", "description": "Review checklist and identify critical gaps", "week_number": 1, "skill_tag": "Planning", "priority": "high"},
-        {"title": f"Close gap: {gaps[0]}" if gaps else "Complete first non-negotiable requirement", "description": "Focus on your #1 priority skill gap", "week_number": 2, "skill_tag": gaps[0] if gaps else "Core Skills", "priority": "high"},
-        {"title": "Build a proof artifact for Week 2 skill", "description": "Create a project, get a certificate, or submit evidence", "week_number": 3, "skill_tag": "Evidence", "priority": "high"},
-        {"title": f"Close gap: {gaps[1]}" if len(gaps) > 1 else "Improve GitHub profile quality", "description": "Add README to all repos, pin top 6 projects", "week_number": 4, "skill_tag": gaps[1] if len(gaps) > 1 else "GitHub", "priority": "medium"},
-    ]
-    phase2 = [
-        {"title": "Complete a portfolio project (end-to-end)", "description": "Build something deployable that demonstrates your target role skills", "week_number": 5, "skill_tag": "Portfolio", "priority": "high"},
-        {"title": f"Close gap: {gaps[2]}" if len(gaps) > 2 else "Add a cloud deployment to portfolio", "description": "Deploy to Vercel, AWS, or Railway", "week_number": 6, "skill_tag": gaps[2] if len(gaps) > 2 else "Cloud", "priority": "medium"},
-        {"title": "Network: Attend 2 online tech events or meetups", "description": "LinkedIn connections + follow-up messages", "week_number": 7, "skill_tag": "Networking", "priority": "medium"},
-        {"title": "Apply to 5 internships or entry-level positions", "description": "Tailor each application with your proof artifacts", "week_number": 8, "skill_tag": "Applications", "priority": "high"},
-    ]
-    phase3 = [
-        {"title": f"Earn a certification: {pathway}", "description": "Complete an industry-recognized certificate to validate skills", "week_number": 9, "skill_tag": "Certification", "priority": "medium"},
-        {"title": "Mock interview practice (3 sessions)", "description": "Use Interview AI or a peer to practice behavioral + technical", "week_number": 10, "skill_tag": "Interview Prep", "priority": "high"},
-        {"title": "Update resume with all new proofs and projects", "description": "Ensure ATS keywords match your target roles", "week_number": 11, "skill_tag": "Resume", "priority": "medium"},
-        {"title": "Final readiness check: run MRI score and address remaining gaps", "description": "Review MRI components and close final gaps before job search", "week_number": 12, "skill_tag": "Review", "priority": "high"},
-    ]
-    return phase1 + phase2 + phase3
+    plan = []
+    for template in _DEFAULT_PLAN_TEMPLATES:
+        task = {key: value for key, value in template.items() if key != "gap_index"}
+        task["title"] = task["title"].format(pathway=pathway)
+        gap_index = template.get("gap_index")
+        if gap_index is not None and gap_index < len(gaps):
+            task["title"] = f"Close gap: {gaps[gap_index]}"
+            task["skill_tag"] = gaps[gap_index]
+        plan.append(task)
+    return plan
+
+
+def _token_pattern(values) -> re.Pattern[str] | None:
+    """One alternation over the non-empty lowercased values, or None if there are none."""
+    tokens = {(value or "").lower() for value in values} - {""}
+    if not tokens:
+        return None
+    return re.compile("|".join(re.escape(token) for token in tokens))
 
 
 @router.post("/sync-github")
@@ -292,29 +394,42 @@ def sync_github(
     if not profile or not profile.github_username:
         raise HTTPException(status_code=400, detail="GitHub username not set in profile")
 
-    import httpx
-    from app.api.routes.github import _fetch_repos, HEADERS
+    from app.api.routes.github import _fetch_repos
 
-    synced_count = 0
     try:
-        with httpx.Client(timeout=10.0, headers=HEADERS, follow_redirects=True) as client:
-            repos = _fetch_repos(client, profile.github_username)
-            repo_names = {r.get("name", "").lower() for r in repos}
-            languages = {(r.get("language") or "").lower() for r in repos}
-
-        tasks = db.query(KanbanTask).filter(KanbanTask.user_id == user_id, KanbanTask.status != "done").all()
-        for task in tasks:
-            title_lower = task.title.lower()
-            skill_lower = (task.skill_tag or "").lower()
+        # The GitHub call and the task query are independent, so fetch repos on a
+        # worker thread while this thread loads the open tasks.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            repos_future = pool.submit(_fetch_repos, github_client(), profile.github_username)
+            tasks = db.execute(
+                select(KanbanTask.id, KanbanTask.title, KanbanTask.skill_tag).where(
+                    KanbanTask.user_id == user_id, KanbanTask.status != "done"
+                )
+            ).all()
+            repos = repos_future.result()
+        repo_pattern = _token_pattern(r.get("name") for r in repos)
+        language_pattern = _token_pattern(r.get("language") for r in repos)
+
+        matched_ids = []
+        for task_id, title, skill_tag in tasks:
+            title_lower = title.lower()
+            skill_lower = (skill_tag or "").lower()
             # Complete if skill tag matches a detected language or repo name
             if (
-                any(lang in title_lower or lang in skill_lower for lang in languages if lang)
-                or any(repo in title_lower for repo in repo_names if repo)
-            ):
-                task.status = "done"
-                task.github_synced = True
-                task.updated_at = datetime.utcnow()
-                synced_count += 1
+                language_pattern is not None
+                and (language_pattern.search(title_lower) or language_pattern.search(skill_lower))
+            ) or (repo_pattern is not None and repo_pattern.search(title_lower)):
+                matched_ids.append(task_id)
+
+        if matched_ids:
+            # One UPDATE for every matched task instead of one per dirty ORM object.
+            db.execute(
+                update(KanbanTask)
+                .where(KanbanTask.id.in_(matched_ids))
+                .values(status="done", github_synced=True, updated_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+        synced_count = len(matched_ids)
         db.commit()
     except HTTPException:
         raise
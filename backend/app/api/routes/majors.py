@@ -14,23 +14,25 @@ def list_majors(db: Session = Depends(get_db)):
 
 @router.get("/{major_id}/pathways", response_model=list[PathwayWithCompatibility])
 def list_pathways_for_major(major_id: str, db: Session = Depends(get_db)):
-    maps = (
-        db.query(MajorPathwayMap)
+    rows = (
+        db.query(
+            CareerPathway.id,
+            CareerPathway.name,
+            CareerPathway.description,
+            MajorPathwayMap.is_compatible,
+            MajorPathwayMap.notes,
+        )
+        .join(CareerPathway, MajorPathwayMap.pathway_id == CareerPathway.id)
         .filter(MajorPathwayMap.major_id == major_id)
         .all()
     )
-    results = []
-    for m in maps:
-        pathway = db.query(CareerPathway).get(m.pathway_id)
-        if pathway is None:
-            continue
-        results.append(
-            {
-                "id": pathway.id,
-                "name": pathway.name,
-                "description": pathway.description,
-                "is_compatible": m.is_compatible,
-                "notes": m.notes,
-            }
-        )
-    return results
+    return [
+        {
+            "id": row.id,
+            "name": row.name,
+            "description": row.description,
+            "is_compatible": row.is_compatible,
+            "notes": row.notes,
+        }
+        for row in rows
+    ]
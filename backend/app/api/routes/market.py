@@ -138,6 +138,22 @@ def run_market_automation(
         raise HTTPException(status_code=status_code, detail=detail) from exc
 
 
+# Plain column rows avoid building an ORM entity and identity-map entry per
+# signal just to copy its fields into a response or prompt.
+_SIGNAL_COLUMNS = (
+    MarketSignal.id,
+    MarketSignal.pathway_id,
+    MarketSignal.skill_id,
+    Skill.name.label("skill_name"),
+    MarketSignal.role_family,
+    MarketSignal.window_start,
+    MarketSignal.window_end,
+    MarketSignal.frequency,
+    MarketSignal.source_count,
+    MarketSignal.metadata_json,
+)
+
+
 @router.get("/signals", response_model=list[MarketSignalOut])
 def list_signals(
     pathway_id: str | None = None,
@@ -146,9 +162,7 @@ def list_signals(
     limit: int = 100,
     db: Session = Depends(get_db),
 ):
-    query = db.query(MarketSignal, Skill).outerjoin(
-        Skill, MarketSignal.skill_id == Skill.id
-    )
+    query = db.query(*_SIGNAL_COLUMNS).outerjoin(Skill, MarketSignal.skill_id == Skill.id)
     if pathway_id:
         query = query.filter(MarketSignal.pathway_id == pathway_id)
     if role_family:
@@ -161,23 +175,21 @@ def list_signals(
         .limit(limit)
         .all()
     )
-    results = []
-    for signal, skill in rows:
-        results.append(
-            {
-                "id": signal.id,
-                "pathway_id": signal.pathway_id,
-                "skill_id": signal.skill_id,
-                "skill_name": getattr(skill, "name", None),
-                "role_family": signal.role_family,
-                "window_start": signal.window_start,
-                "window_end": signal.window_end,
-                "frequency": signal.frequency,
-                "source_count": signal.source_count,
-                "metadata": signal.metadata_json,
-            }
-        )
-    return results
+    return [
+        {
+            "id": row.id,
+            "pathway_id": row.pathway_id,
+            "skill_id": row.skill_id,
+            "skill_name": row.skill_name,
+            "role_family": row.role_family,
+            "window_start": row.window_start,
+            "window_end": row.window_end,
+            "frequency": row.frequency,
+            "source_count": row.source_count,
+            "metadata": row.metadata_json,
+        }
+        for row in rows
+    ]
 
 
 @router.post("/proposals", response_model=MarketProposalOut)
@@ -214,7 +226,7 @@ def create_proposal_with_copilot(
     payload: MarketCopilotProposalIn,
     db: Session = Depends(get_db),
 ):
-    signal_query = db.query(MarketSignal, Skill).outerjoin(
+    signal_query = db.query(*_SIGNAL_COLUMNS).outerjoin(
         Skill, MarketSignal.skill_id == Skill.id
     ).filter(MarketSignal.pathway_id == payload.pathway_id)
     if payload.signal_ids:
@@ -228,22 +240,22 @@ def create_proposal_with_copilot(
     if not rows:
         raise HTTPException(status_code=404, detail="No market signals found for proposal generation")
 
-    signals: list[dict] = []
-    for signal, skill in rows:
-        signals.append(
-            {
-                "id": str(signal.id),
-                "pathway_id": str(signal.pathway_id) if signal.pathway_id else None,
-                "skill_id": str(signal.skill_id) if signal.skill_id else None,
-                "skill_name": skill.name if skill else None,
-                "role_family": signal.role_family,
-                "window_start": signal.window_start.isoformat() if signal.window_start else None,
-                "window_end": signal.window_end.isoformat() if signal.window_end else None,
-                "frequency": signal.frequency,
-                "source_count": signal.source_count,
-                "metadata": signal.metadata_json,
-            }
-        )
+    # These dicts are stored in the proposal's JSON diff, so values stay strings.
+    signals: list[dict] = [
+        {
+            "id": str(row.id),
+            "pathway_id": str(row.pathway_id) if row.pathway_id else None,
+            "skill_id": str(row.skill_id) if row.skill_id else None,
+            "skill_name": row.skill_name,
+            "role_family": row.role_family,
+            "window_start": row.window_start.isoformat() if row.window_start else None,
+            "window_end": row.window_end.isoformat() if row.window_end else None,
+            "frequency": row.frequency,
+            "source_count": row.source_count,
+            "metadata": row.metadata_json,
+        }
+        for row in rows
+    ]
 
     generated = generate_market_proposal_from_signals(
         signals=signals,
@@ -274,14 +286,13 @@ def approve_proposal(
     x_admin_actor: str | None = Header(default=None),
     db: Session = Depends(get_db),
 ):
-    proposal = db.query(MarketUpdateProposal).get(proposal_id)
+    proposal = db.get(MarketUpdateProposal, proposal_id)
     if not proposal:
         raise HTTPException(status_code=404, detail="Proposal not found")
     proposal.status = "approved"
     proposal.approved_at = datetime.utcnow()
     proposal.approved_by = (x_admin_actor or "admin").strip() or "admin"
     db.commit()
-    db.refresh(proposal)
     return _serialize_proposal(proposal)
 
 
@@ -291,7 +302,7 @@ def publish_proposal(
     x_admin_actor: str | None = Header(default=None),
     db: Session = Depends(get_db),
 ):
-    proposal = db.query(MarketUpdateProposal).get(proposal_id)
+    proposal = db.get(MarketUpdateProposal, proposal_id)
     if not proposal:
         raise HTTPException(status_code=404, detail="Proposal not found")
     if proposal.status not in {"approved", "draft"}:
@@ -300,5 +311,4 @@ def publish_proposal(
     proposal.published_at = datetime.utcnow()
     proposal.published_by = (x_admin_actor or "admin").strip() or "admin"
     db.commit()
-    db.refresh(proposal)
     return _serialize_proposal(proposal)
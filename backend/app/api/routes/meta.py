@@ -1,9 +1,14 @@
+import time
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
 
 from app.api.deps import require_admin
 from app.core.config import settings
-from app.core.database import engine
+from app.core.database import engine, pool_stats
 from app.services.ai import (
     ai_is_configured,
     ai_strict_mode_enabled,
@@ -11,13 +16,45 @@ from app.services.ai import (
     get_active_ai_model,
     get_active_ai_provider,
 )
+from app.services.auth_audit import auth_audit_queue_depth
 from app.services.storage import s3_is_enabled, storage_self_test
 
 router = APIRouter(prefix="/meta")
 
+# App Runner and uptime monitors poll /meta/health every few seconds;
+# one SELECT 1 per interval is enough to report database reachability.
+HEALTH_DB_TTL_SECONDS = 5.0
 
-@router.get("/ai")
-def ai_meta():
+_db_probe_lock = Lock()
+_db_probe: tuple[float, bool, str | None] | None = None
+
+
+def _probe_database() -> tuple[bool, str | None]:
+    global _db_probe
+    cached = _db_probe
+    if cached and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+    with _db_probe_lock:
+        # Concurrent probes wait here and reuse the result of the one that ran.
+        cached = _db_probe
+        if cached and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+        db_ok = False
+        db_error = None
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            db_ok = True
+        except Exception as exc:
+            db_error = str(exc)
+        _db_probe = (time.monotonic() + HEALTH_DB_TTL_SECONDS, db_ok, db_error)
+    return db_ok, db_error
+
+
+# AI and storage metadata only depend on settings, which are fixed for the life
+# of the process, so these payloads are built once.
+@lru_cache(maxsize=1)
+def _ai_meta() -> dict[str, Any]:
     return {
         "ai_enabled": ai_is_configured(),
         "ai_strict_mode": ai_strict_mode_enabled(),
@@ -26,13 +63,8 @@ def ai_meta():
     }
 
 
-@router.get("/ai/test", dependencies=[Depends(require_admin)])
-def ai_meta_test():
-    return ai_runtime_diagnostics()
-
-
-@router.get("/storage")
-def storage_meta():
+@lru_cache(maxsize=1)
+def _storage_meta() -> dict[str, Any]:
     return {
         "s3_enabled": s3_is_enabled(),
         "s3_bucket": settings.s3_bucket,
@@ -41,33 +73,44 @@ def storage_meta():
     }
 
 
+@router.get("/ai")
+def ai_meta() -> dict[str, Any]:
+    return _ai_meta()
+
+
+@router.get("/ai/test", dependencies=[Depends(require_admin)])
+def ai_meta_test() -> dict[str, Any]:
+    return ai_runtime_diagnostics()
+
+
+@router.get("/storage")
+def storage_meta() -> dict[str, Any]:
+    return _storage_meta()
+
+
 @router.get("/storage/test")
-def storage_test():
+def storage_test() -> dict[str, Any]:
     return storage_self_test()
 
 
 @router.get("/health")
-def health_meta():
-    db_ok = False
-    db_error = None
-    try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        db_ok = True
-    except Exception as exc:
-        db_error = str(exc)
+def health_meta() -> dict[str, Any]:
+    db_ok, db_error = _probe_database()
+    ai = _ai_meta()
+    storage = _storage_meta()
     return {
         "ok": db_ok,
-        "database": {"ok": db_ok, "error": db_error},
+        "database": {"ok": db_ok, "error": db_error, "pool": pool_stats()},
         "ai": {
-            "enabled": ai_is_configured(),
-            "strict_mode": ai_strict_mode_enabled(),
-            "provider": get_active_ai_provider(),
-            "model": get_active_ai_model(),
+            "enabled": ai["ai_enabled"],
+            "strict_mode": ai["ai_strict_mode"],
+            "provider": ai["provider"],
+            "model": ai["model"],
         },
         "storage": {
-            "s3_enabled": s3_is_enabled(),
-            "s3_bucket": settings.s3_bucket,
+            "s3_enabled": storage["s3_enabled"],
+            "s3_bucket": storage["s3_bucket"],
             "local_enabled": True,
         },
+        "auth_audit_queue_depth": auth_audit_queue_depth(),
     }
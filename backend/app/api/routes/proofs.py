@@ -12,6 +12,7 @@ from app.services.storage import (
     create_presigned_upload,
     is_s3_object_url,
     resolve_file_view_url,
+    resolve_file_view_urls,
     s3_is_enabled,
 )
 from app.services.ai import (
@@ -36,13 +37,13 @@ def _is_uploaded_document_url(url: str) -> bool:
     return is_s3_object_url(url)
 
 
-def _serialize_proof(proof: Proof) -> dict:
+def _serialize_proof(proof: Proof, view_url: str | None = None) -> dict:
     return {
         "id": proof.id,
         "checklist_item_id": proof.checklist_item_id,
         "proof_type": proof.proof_type,
         "url": proof.url,
-        "view_url": resolve_file_view_url(proof.url),
+        "view_url": view_url if view_url is not None else resolve_file_view_url(proof.url),
         "status": proof.status,
         "review_note": proof.review_note,
         "proficiency_level": proof.proficiency_level or "intermediate",
@@ -91,7 +92,8 @@ def list_proofs(
     if checklist_item_id:
         query = query.filter(Proof.checklist_item_id == checklist_item_id)
     proofs = query.order_by(Proof.created_at.desc()).all()
-    return [_serialize_proof(proof) for proof in proofs]
+    view_urls = resolve_file_view_urls(proof.url for proof in proofs)
+    return [_serialize_proof(proof, view_urls[proof.url]) for proof in proofs]
 
 
 @router.post("", response_model=ProofOut)
@@ -100,7 +102,7 @@ def register_proof(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    checklist_item = db.query(ChecklistItem).get(payload.checklist_item_id)
+    checklist_item = db.get(ChecklistItem, payload.checklist_item_id)
     if not checklist_item:
         raise HTTPException(status_code=404, detail="Checklist item not found")
 
@@ -132,7 +132,7 @@ def select_pathway(
     cohort_id = payload.cohort_id
     cohort_label = payload.cohort
     if cohort_id and not cohort_label:
-        cohort = db.query(Cohort).get(cohort_id)
+        cohort = db.get(Cohort, cohort_id)
         if not cohort:
             raise HTTPException(status_code=404, detail="Cohort not found")
         cohort_label = cohort.name
@@ -466,7 +466,7 @@ def update_goal(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    goal = db.query(StudentGoal).get(goal_id)
+    goal = db.get(StudentGoal, goal_id)
     if not goal or goal.user_id != user_id:
         raise HTTPException(status_code=404, detail="Goal not found")
     data = payload.model_dump(exclude_unset=True)
@@ -490,7 +490,7 @@ def goal_check_in(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    goal = db.query(StudentGoal).get(goal_id)
+    goal = db.get(StudentGoal, goal_id)
     if not goal or goal.user_id != user_id:
         raise HTTPException(status_code=404, detail="Goal not found")
 
@@ -577,7 +577,7 @@ def mark_notification_read(
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
-    note = db.query(StudentNotification).get(notification_id)
+    note = db.get(StudentNotification, notification_id)
     if not note or note.user_id != user_id:
         raise HTTPException(status_code=404, detail="Notification not found")
     note.is_read = True
@@ -5,6 +5,23 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout_seconds: int = 30
+    db_pool_recycle_seconds: int = 3600
+    # Open a fresh connection per checkout: for tests, and for running behind an
+    # external pooler (pgbouncer) that already owns connection reuse.
+    db_use_null_pool: bool = False
+    # Size of the engine's compiled-SQL LRU (SQLAlchemy default 500); headroom so
+    # hot statements are not evicted by the long tail of admin/market queries.
+    db_query_cache_size: int = 1200
+    # Sync route handlers and deps run in anyio's worker pool (40 threads by
+    # default); size it to the DB pool so threads, not requests, are the queue.
+    worker_threads: int = 60
+    # skip: the start command runs `alembic upgrade head` before the server;
+    # sync: the app upgrades during startup; async: it upgrades in the
+    # background after startup so the server is ready while indexes build.
+    migration_mode: str = "skip"
     aws_access_key_id: str | None = None
     aws_secret_access_key: str | None = None
     aws_session_token: str | None = None
@@ -26,6 +43,8 @@ class Settings(BaseSettings):
     openai_finetune_base_model: str = "gpt-4.1-nano-2025-04-14"
     llm_timeout_seconds: int = 90
     llm_max_retries: int = 3
+    # Identical prompts within this window reuse one completion; 0 disables.
+    llm_response_cache_ttl_seconds: int = 30
     local_upload_dir: str = "uploads"
     ai_proof_verify_threshold: float = 0.8
     auth_secret: str = "change-me-auth-secret"
@@ -37,6 +56,9 @@ class Settings(BaseSettings):
     auth_login_window_seconds: int = 60 * 10
     auth_dev_return_codes: bool = True
     auth_require_email_verification: bool = False
+    # Expired/revoked refresh sessions older than this are deleted; 0 disables pruning.
+    auth_session_retention_days: int = 30
+    auth_session_prune_interval_hours: int = 24
     public_app_base_url: str = "http://127.0.0.1:3000"
     mail_enabled: bool = False
     mail_from: str | None = None
@@ -62,6 +84,8 @@ class Settings(BaseSettings):
     onet_password: str | None = None
     careeronestop_api_key: str | None = None
     careeronestop_user_id: str | None = None
+    # Enables the single-request GraphQL path for GitHub audits (GraphQL requires auth).
+    github_token: str | None = None
     market_auto_enabled: bool = False
     market_auto_run_on_startup: bool = False
     market_auto_interval_minutes: int = 360
@@ -81,12 +105,21 @@ class Settings(BaseSettings):
             return "postgresql://" + value[len("postgres://"):]
         return value
 
+    @field_validator("migration_mode", mode="before")
+    @classmethod
+    def normalize_migration_mode(cls, value: str) -> str:
+        mode = str(value or "skip").strip().lower()
+        if mode not in {"skip", "sync", "async"}:
+            raise ValueError("migration_mode must be one of: skip, sync, async")
+        return mode
+
     @field_validator(
         "market_auto_interval_minutes",
         "market_auto_signal_limit",
         "market_auto_proposal_lookback_days",
         "market_auto_proposal_min_signals",
         "market_auto_proposal_cooldown_hours",
+        "auth_session_prune_interval_hours",
     )
     @classmethod
     def ensure_positive(cls, value: int) -> int:
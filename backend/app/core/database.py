@@ -1,7 +1,40 @@
 ﻿from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine_options: dict = {"pool_pre_ping": True, "query_cache_size": settings.db_query_cache_size}
+if settings.db_use_null_pool:
+    engine_options["poolclass"] = NullPool
+elif not settings.database_url.startswith("sqlite"):
+    engine_options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+    )
+
+engine = create_engine(settings.database_url, **engine_options)
+# Objects stay loaded after commit; handlers that need DB-generated values call db.refresh().
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
+
+
+def pool_stats() -> dict:
+    pool = engine.pool
+    return {
+        "class": type(pool).__name__,
+        "size": pool.size() if hasattr(pool, "size") else None,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+        "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+    }
+
+
+def release_connection(db: Session) -> None:
+    """End a read-only transaction so its pooled connection is free during slow non-DB work.
+
+    Loaded objects stay usable (expire_on_commit=False); the next query checks out a
+    connection again. Sessions with pending changes are left alone.
+    """
+    if db.in_transaction() and not (db.new or db.dirty or db.deleted):
+        db.commit()
@@ -1,43 +1,64 @@
-from datetime import datetime, timedelta
-from typing import Dict, List
+import math
+import time
+from threading import Lock
+from typing import Dict, Tuple
 
 from fastapi import HTTPException
 
 
 class RateLimiter:
+    # Idle buckets are swept every this many checks so throwaway keys
+    # (credential stuffing, rotating IPs) do not accumulate forever.
+    SWEEP_EVERY = 1024
+
     def __init__(self, limit: int, window_seconds: int):
         self.limit = limit
-        self.window = timedelta(seconds=window_seconds)
-        self.hits: Dict[str, List[datetime]] = {}
+        self.window = float(window_seconds)
+        # Token bucket: holds up to `limit` tokens, refilled at limit/window per second.
+        self.refill_per_second = limit / self.window
+        self.buckets: Dict[str, Tuple[float, float]] = {}
+        self._checks = 0
+        # Sync handlers run on a threadpool; check-and-record must be atomic so
+        # concurrent requests cannot all see "under limit" and over-admit.
+        self._lock = Lock()
+
+    def _sweep(self, now: float) -> None:
+        # A bucket untouched for a full window has refilled completely, which is
+        # the same as not tracking it at all.
+        idle_before = now - self.window
+        for key in [key for key, (_, updated) in self.buckets.items() if updated <= idle_before]:
+            del self.buckets[key]
 
     def check(self, key: str) -> None:
-        now = datetime.utcnow()
-        window_start = now - self.window
-        entries = self.hits.get(key, [])
-        entries = [ts for ts in entries if ts >= window_start]
-
-        if len(entries) >= self.limit:
-            oldest_in_window = min(entries) if entries else now
-            retry_after = int(max(1, (oldest_in_window + self.window - now).total_seconds()))
-            raise HTTPException(
-                status_code=429,
-                detail={
-                    "message": "Rate limit exceeded",
-                    "retry_after_seconds": retry_after,
-                },
-            )
-
-        entries.append(now)
-        self.hits[key] = entries
+        now = time.monotonic()
+        with self._lock:
+            self._checks += 1
+            if self._checks % self.SWEEP_EVERY == 0:
+                self._sweep(now)
+
+            tokens, updated = self.buckets.get(key, (float(self.limit), now))
+            tokens = min(float(self.limit), tokens + (now - updated) * self.refill_per_second)
+            if tokens < 1.0:
+                self.buckets[key] = (tokens, now)
+                retry_after = max(1, math.ceil((1.0 - tokens) / self.refill_per_second))
+                raise HTTPException(
+                    status_code=429,
+                    detail={
+                        "message": "Rate limit exceeded",
+                        "retry_after_seconds": retry_after,
+                    },
+                )
+
+            self.buckets[key] = (tokens - 1.0, now)
 
     def clear(self, key: str) -> None:
-        if key in self.hits:
-            del self.hits[key]
+        with self._lock:
+            self.buckets.pop(key, None)
 
     def clear_prefix(self, prefix: str) -> None:
-        for key in list(self.hits.keys()):
-            if key.startswith(prefix):
-                del self.hits[key]
+        with self._lock:
+            for key in [key for key in self.buckets if key.startswith(prefix)]:
+                del self.buckets[key]
 
 from app.core.config import settings
 
@@ -215,7 +215,7 @@ def export_training_file(
 
         rows = []
         for proof in proofs:
-            item = db.query(ChecklistItem).get(proof.checklist_item_id)
+            item = db.get(ChecklistItem, proof.checklist_item_id)
             if not item:
                 continue
             profile = db.query(StudentProfile).filter(StudentProfile.user_id == proof.user_id).one_or_none()
@@ -4,21 +4,47 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import asyncio
 from pathlib import Path
 
+from anyio import to_thread
+
 from app.api.routes import auth, majors, user, proofs, readiness, timeline, admin, ai, market, meta
 from app.api.routes import github, mri, sentinel, kanban, simulator, public_profile
 from app.core.config import settings
+from app.services.auth_audit import start_auth_audit_writer, stop_auth_audit_writer
 from app.services.market_automation import start_market_scheduler, stop_market_scheduler
+from app.services.migrations import run_migrations, start_background_migrations
+from app.services.partitions import (
+    ensure_log_partitions,
+    start_partition_maintenance,
+    stop_partition_maintenance,
+)
+from app.services.session_pruning import start_session_pruning, stop_session_pruning
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    to_thread.current_default_thread_limiter().total_tokens = settings.worker_threads
+    if settings.migration_mode == "async":
+        # Partitions depend on the migrated schema, so the background task
+        # creates them once the upgrade finishes.
+        await start_background_migrations()
+    else:
+        if settings.migration_mode == "sync":
+            await asyncio.to_thread(run_migrations)
+        await asyncio.to_thread(ensure_log_partitions)
     await start_market_scheduler()
+    await start_session_pruning()
+    await start_partition_maintenance()
+    start_auth_audit_writer()
     try:
         yield
     finally:
+        await stop_partition_maintenance()
+        await stop_session_pruning()
         await stop_market_scheduler()
+        await asyncio.to_thread(stop_auth_audit_writer)
 
 
 app = FastAPI(title="Career Pathways API", version="0.1.0", lifespan=lifespan)
@@ -36,6 +62,7 @@ app.add_middleware(
         "X-Admin-Token",
         "X-Request-Id",
     ],
+    expose_headers=["X-Next-Cursor"],
 )
 
 upload_dir = Path(settings.local_upload_dir)
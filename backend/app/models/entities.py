@@ -1,10 +1,11 @@
 ﻿from enum import Enum
 from uuid import uuid4
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Boolean, Integer, DateTime, ForeignKey, Float
+from sqlalchemy import Column, String, Text, Boolean, Integer, DateTime, ForeignKey, Float, Index, Enum as SAEnum, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.core.ids import uuid7
 
 
 class ChecklistTier(str, Enum):
@@ -75,9 +76,21 @@ class ChecklistVersion(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     pathway_id = Column(UUID(as_uuid=True), ForeignKey("career_pathways.id"), nullable=False)
     version_number = Column(Integer, nullable=False)
-    status = Column(String(16), nullable=False)
+    status = Column(
+        SAEnum(*(status.value for status in ChecklistVersionStatus), name="checklist_version_status"),
+        nullable=False,
+    )
     published_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        Index(
+            "ix_checklist_versions_pathway_status_version",
+            pathway_id,
+            status,
+            version_number.desc(),
+        ),
+    )
+
     pathway = relationship("CareerPathway")
 
 
@@ -94,6 +107,8 @@ class ChecklistItem(Base):
     is_critical = Column(Boolean, default=False, nullable=False)
     allowed_proof_types = Column(JSONB, nullable=False, default=list)
 
+    __table_args__ = (Index("ix_checklist_items_version_title", version_id, title),)
+
     version = relationship("ChecklistVersion")
     skill = relationship("Skill")
 
@@ -114,7 +129,7 @@ class UserPathway(Base):
     __tablename__ = "user_pathways"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, index=True)
+    user_id = Column(String(120), ForeignKey("student_accounts.username"), nullable=False)
     major_id = Column(UUID(as_uuid=True), ForeignKey("majors.id"), nullable=False)
     pathway_id = Column(UUID(as_uuid=True), ForeignKey("career_pathways.id"), nullable=False)
     cohort = Column(String(80), nullable=True)
@@ -122,6 +137,8 @@ class UserPathway(Base):
     checklist_version_id = Column(UUID(as_uuid=True), ForeignKey("checklist_versions.id"), nullable=True)
     selected_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("ix_user_pathways_user_selected", user_id, selected_at.desc()),)
+
     major = relationship("Major")
     pathway = relationship("CareerPathway")
     checklist_version = relationship("ChecklistVersion")
@@ -132,7 +149,7 @@ class StudentProfile(Base):
     __tablename__ = "student_profiles"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, unique=True, index=True)
+    user_id = Column(String(120), ForeignKey("student_accounts.username"), nullable=False, unique=True, index=True)
     semester = Column(String(80), nullable=True)
     state = Column(String(80), nullable=True)
     university = Column(String(160), nullable=True)
@@ -141,13 +158,15 @@ class StudentProfile(Base):
     masters_timeline = Column(String(120), nullable=True)
     masters_status = Column(String(80), nullable=True)
     github_username = Column(String(255), nullable=True)
-    share_slug = Column(String(120), nullable=True, unique=True, index=True)
+    share_slug = Column(String(120), nullable=True)
     resume_url = Column(Text, nullable=True)
     resume_filename = Column(String(255), nullable=True)
     resume_uploaded_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("uq_student_profiles_share_slug", share_slug, unique=True),)
+
 
 class StudentAccount(Base):
     __tablename__ = "student_accounts"
@@ -155,7 +174,7 @@ class StudentAccount(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     username = Column(String(120), nullable=False, unique=True, index=True)
     email = Column(String(255), nullable=True, unique=True, index=True)
-    email_verified = Column(Boolean, default=False, nullable=False)
+    email_verified = Column(Boolean, default=False, server_default=text("false"), nullable=False)
     email_verification_code = Column(String(24), nullable=True)
     email_verification_expires_at = Column(DateTime, nullable=True)
     password_reset_code = Column(String(24), nullable=True)
@@ -170,34 +189,54 @@ class StudentAccount(Base):
 class AuthSession(Base):
     __tablename__ = "auth_sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, index=True)
-    refresh_token_hash = Column(String(128), nullable=False, unique=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(String(120), ForeignKey("student_accounts.username"), nullable=False)
+    refresh_token_hash = Column(String(128), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     expires_at = Column(DateTime, nullable=False)
     revoked_at = Column(DateTime, nullable=True)
     ip_address = Column(String(64), nullable=True)
     user_agent = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index(
+            "ix_auth_sessions_active_refresh_token_hash",
+            refresh_token_hash,
+            postgresql_using="hash",
+            postgresql_where=revoked_at.is_(None),
+        ),
+        Index("ix_auth_sessions_active_user_id", user_id, postgresql_where=revoked_at.is_(None)),
+    )
+
 
 class AuthAuditLog(Base):
     __tablename__ = "auth_audit_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=True, index=True)
-    action = Column(String(64), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(String(120), nullable=True)
+    action = Column(String(64), nullable=False)
     status = Column(String(32), nullable=False)
     ip_address = Column(String(64), nullable=True)
     user_agent = Column(Text, nullable=True)
     detail = Column(JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        Index("ix_auth_audit_logs_user_action_created", user_id, action, created_at.desc()),
+        Index(
+            "ix_auth_audit_logs_created_at_brin",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
 
 class Proof(Base):
     __tablename__ = "proofs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, index=True)
+    user_id = Column(String(120), ForeignKey("student_accounts.username"), nullable=False)
     checklist_item_id = Column(UUID(as_uuid=True), ForeignKey("checklist_items.id"), nullable=False)
     proof_type = Column(String(80), nullable=False)
     url = Column(Text, nullable=False)
@@ -207,13 +246,23 @@ class Proof(Base):
     metadata_json = Column("metadata", JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        Index("ix_proofs_user_created", user_id, created_at.desc()),
+        Index(
+            "ix_proofs_created_at_brin",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
     checklist_item = relationship("ChecklistItem")
 
 
 class AiAuditLog(Base):
     __tablename__ = "ai_audit_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(String(120), nullable=True, index=True)
     feature = Column(String(80), nullable=False)
     prompt_input = Column(JSONB, nullable=True)
@@ -223,6 +272,15 @@ class AiAuditLog(Base):
     feedback = Column(JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        Index(
+            "ix_ai_audit_logs_created_at_brin",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
 
 class MarketRawIngestion(Base):
     __tablename__ = "market_raw_ingestions"
@@ -233,6 +291,15 @@ class MarketRawIngestion(Base):
     storage_key = Column(Text, nullable=True)
     metadata_json = Column("metadata", JSONB, nullable=True)
 
+    __table_args__ = (
+        Index(
+            "ix_market_raw_ingestions_fetched_at_brin",
+            fetched_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
 
 class MarketSignal(Base):
     __tablename__ = "market_signals"
@@ -268,7 +335,7 @@ class ChecklistChangeLog(Base):
     __tablename__ = "checklist_change_logs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    pathway_id = Column(UUID(as_uuid=True), ForeignKey("career_pathways.id"), nullable=False, index=True)
+    pathway_id = Column(UUID(as_uuid=True), ForeignKey("career_pathways.id"), nullable=False)
     from_version_id = Column(UUID(as_uuid=True), ForeignKey("checklist_versions.id"), nullable=True)
     to_version_id = Column(UUID(as_uuid=True), ForeignKey("checklist_versions.id"), nullable=True)
     change_type = Column(String(32), nullable=False)
@@ -277,47 +344,63 @@ class ChecklistChangeLog(Base):
     created_by = Column(String(120), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("ix_checklist_change_logs_pathway_created", pathway_id, created_at.desc()),)
+
 
 class StudentGoal(Base):
     __tablename__ = "student_goals"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, index=True)
+    user_id = Column(String(120), ForeignKey("student_accounts.username"), nullable=False)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(String(32), nullable=False, default="active")
     target_date = Column(DateTime, nullable=True)
     last_check_in_at = Column(DateTime, nullable=True)
-    streak_days = Column(Integer, nullable=False, default=0)
+    streak_days = Column(Integer, nullable=False, default=0, server_default=text("0"))
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("ix_student_goals_user_updated", user_id, updated_at.desc()),)
+
 
 class StudentNotification(Base):
     __tablename__ = "student_notifications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(String(120), ForeignKey("student_accounts.username"), nullable=False)
     kind = Column(String(64), nullable=False)
     message = Column(Text, nullable=False)
-    is_read = Column(Boolean, nullable=False, default=False)
+    is_read = Column(Boolean, nullable=False, default=False, server_default=text("false"))
     metadata_json = Column("metadata", JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        Index("ix_student_notifications_user_created", user_id, created_at.desc()),
+        Index(
+            "ix_student_notifications_created_at_brin",
+            created_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
 
 class AiInterviewSession(Base):
     __tablename__ = "ai_interview_sessions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, index=True)
+    user_id = Column(String(120), ForeignKey("student_accounts.username"), nullable=False)
     target_role = Column(String(160), nullable=True)
     job_description = Column(Text, nullable=True)
-    question_count = Column(Integer, nullable=False, default=5)
-    status = Column(String(32), nullable=False, default="active")
+    question_count = Column(Integer, nullable=False, default=5, server_default=text("5"))
+    status = Column(String(32), nullable=False, default="active", server_default=text("'active'"))
     summary = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("ix_ai_interview_sessions_user_created", user_id, created_at.desc()),)
+
 
 class AiInterviewQuestion(Base):
     __tablename__ = "ai_interview_questions"
@@ -327,7 +410,6 @@ class AiInterviewQuestion(Base):
         UUID(as_uuid=True),
         ForeignKey("ai_interview_sessions.id"),
         nullable=False,
-        index=True,
     )
     order_index = Column(Integer, nullable=False)
     prompt = Column(Text, nullable=False)
@@ -337,6 +419,8 @@ class AiInterviewQuestion(Base):
     difficulty = Column(String(32), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("ix_ai_interview_questions_session_order", session_id, order_index),)
+
     session = relationship("AiInterviewSession")
     focus_item = relationship("ChecklistItem")
     focus_milestone = relationship("Milestone")
@@ -346,12 +430,11 @@ class AiInterviewQuestion(Base):
 class AiInterviewResponse(Base):
     __tablename__ = "ai_interview_responses"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey("ai_interview_sessions.id"),
         nullable=False,
-        index=True,
     )
     question_id = Column(
         UUID(as_uuid=True),
@@ -367,6 +450,8 @@ class AiInterviewResponse(Base):
     confidence = Column(Float, nullable=True)
     submitted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("ix_ai_interview_responses_session_submitted", session_id, submitted_at),)
+
     session = relationship("AiInterviewSession")
     question = relationship("AiInterviewQuestion")
 
@@ -375,7 +460,7 @@ class AiResumeArtifact(Base):
     __tablename__ = "ai_resume_artifacts"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, index=True)
+    user_id = Column(String(120), ForeignKey("student_accounts.username"), nullable=False)
     target_role = Column(String(160), nullable=True)
     job_description = Column(Text, nullable=True)
     ats_keywords = Column(JSONB, nullable=True)
@@ -383,12 +468,14 @@ class AiResumeArtifact(Base):
     structured_json = Column("structured", JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (Index("ix_ai_resume_artifacts_user_created", user_id, created_at.desc()),)
+
 
 class KanbanTask(Base):
     __tablename__ = "kanban_tasks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    user_id = Column(String(120), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(String(120), nullable=False)
     title = Column(String(300), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(String(32), nullable=False, default="todo")  # todo, in_progress, done
@@ -400,3 +487,8 @@ class KanbanTask(Base):
     sort_order = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_kanban_tasks_user_sort", user_id, sort_order, created_at),
+        Index("ix_kanban_tasks_user_ai_generated", user_id, postgresql_where=ai_generated),
+    )
@@ -1,7 +1,15 @@
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, BeforeValidator, Field, WithJsonSchema
 from uuid import UUID
 from datetime import datetime
-from typing import Any, List, Optional
+from typing import Annotated, Any, List, Optional
+
+
+def _canonical_uuid(value: Any) -> str:
+    return str(value if isinstance(value, UUID) else UUID(str(value)))
+
+
+# Validated as a UUID but kept as its canonical string, ready for queries and JSON columns.
+UUIDStr = Annotated[str, BeforeValidator(_canonical_uuid), WithJsonSchema({"type": "string", "format": "uuid"})]
 
 
 class MajorOut(BaseModel):
@@ -362,7 +370,7 @@ class RepoProofCheckerIn(BaseModel):
     target_job: str
     location: str
     repo_url: str
-    proof_id: Optional[UUID] = None
+    proof_id: Optional[UUIDStr] = None
 
 
 class RepoProofCheckerOut(BaseModel):
@@ -415,7 +423,7 @@ class AiEvidenceMapOut(BaseModel):
 class AiGuideFeedbackIn(BaseModel):
     helpful: bool
     comment: Optional[str] = None
-    context_item_ids: List[UUID] = Field(default_factory=list)
+    context_item_ids: List[UUIDStr] = Field(default_factory=list)
 
 
 class AiGuideFeedbackOut(BaseModel):
@@ -442,7 +450,7 @@ class AiInterviewQuestionOut(BaseModel):
 
 
 class AiInterviewResponseIn(BaseModel):
-    question_id: UUID
+    question_id: UUIDStr
     answer_text: Optional[str] = None
     video_url: Optional[str] = None
 
@@ -695,6 +703,17 @@ class MarketAutomationStatusOut(BaseModel):
     last_scheduler_error: Optional[str] = None
 
 
+class MigrationStatusOut(BaseModel):
+    mode: str
+    state: str
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    current_revision: Optional[str] = None
+    head_revision: Optional[str] = None
+    up_to_date: bool
+
+
 class MarketSignalIn(BaseModel):
     pathway_id: Optional[UUID] = None
     skill_id: Optional[UUID] = None
@@ -762,7 +781,10 @@ class ChecklistChangeLogOut(BaseModel):
     to_version_id: Optional[UUID] = None
     change_type: str
     summary: Optional[str] = None
-    metadata: Optional[dict[str, Any]] = None
+    # Read straight from ChecklistChangeLog rows, where the column is mapped as metadata_json.
+    metadata: Optional[dict[str, Any]] = Field(
+        default=None, validation_alias=AliasChoices("metadata_json", "metadata")
+    )
     created_by: Optional[str] = None
     created_at: datetime
 
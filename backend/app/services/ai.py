@@ -1,6 +1,9 @@
+from concurrent.futures import Future
 from datetime import datetime
+import hashlib
 from html import unescape
 import io
+import logging
 from pathlib import Path
 import json
 import re
@@ -15,6 +18,7 @@ from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.database import SessionLocal, release_connection
 from app.models.entities import (
     AiAuditLog,
     ChecklistItem,
@@ -29,6 +33,8 @@ from app.models.entities import (
 from app.services.readiness import calculate_readiness
 from app.services.storage import is_s3_object_url, read_s3_object_bytes
 
+logger = logging.getLogger(__name__)
+
 MAX_EVIDENCE_CHARS = 4000
 MAX_RESUME_CONTEXT_CHARS = 120_000
 MAX_RESUME_TEXT_READ_BYTES = 5 * 1024 * 1024
@@ -78,6 +84,9 @@ GENERAL_PROOF_TYPES = [
 ]
 _resume_context_cache_lock = Lock()
 _resume_context_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_llm_response_cache_lock = Lock()
+_llm_response_cache: dict[str, tuple[float, str]] = {}
+_llm_inflight: dict[str, Future] = {}
 
 
 def _truncate(text: str, limit: int = MAX_EVIDENCE_CHARS) -> str:
@@ -1493,12 +1502,72 @@ def ai_runtime_diagnostics() -> dict[str, Any]:
     return result
 
 
+def _llm_cache_key(system_prompt: str, user_payload: str, model: str | None, expect_json: bool) -> str:
+    provider, _, default_model, _ = _provider_config()
+    raw = json.dumps([provider, model or default_model, expect_json, system_prompt, user_payload])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _llm_cache_set(cache_key: str, content: str) -> None:
+    expires_at = time.time() + settings.llm_response_cache_ttl_seconds
+    with _llm_response_cache_lock:
+        _llm_response_cache[cache_key] = (expires_at, content)
+        if len(_llm_response_cache) > 256:
+            oldest_key = min(_llm_response_cache.items(), key=lambda item: item[1][0])[0]
+            _llm_response_cache.pop(oldest_key, None)
+
+
 def _call_llm(
     system_prompt: str,
     user_payload: str,
     *,
     override_model: str | None = None,
     expect_json: bool = True,
+    use_cache: bool = False,
+) -> str:
+    """Chat completion with single-flight: identical prompts already in flight share
+    one provider call.
+
+    use_cache=True also reuses a completion seen within
+    LLM_RESPONSE_CACHE_TTL_SECONDS. Only pass it for outputs that are a pure
+    function of the prompt; anything a user can "regenerate" must not opt in.
+    """
+    cache_results = use_cache and settings.llm_response_cache_ttl_seconds > 0
+    cache_key = _llm_cache_key(system_prompt, user_payload, override_model, expect_json)
+    with _llm_response_cache_lock:
+        cached = _llm_response_cache.get(cache_key) if cache_results else None
+        if cached and cached[0] > time.time():
+            return cached[1]
+        inflight = _llm_inflight.get(cache_key)
+        if inflight is None:
+            future: Future = Future()
+            _llm_inflight[cache_key] = future
+    if inflight is not None:
+        return inflight.result()
+
+    try:
+        content = _request_llm_completion(
+            system_prompt, user_payload, override_model=override_model, expect_json=expect_json
+        )
+    except Exception as exc:
+        with _llm_response_cache_lock:
+            _llm_inflight.pop(cache_key, None)
+        future.set_exception(exc)
+        raise
+    if cache_results:
+        _llm_cache_set(cache_key, content)
+    with _llm_response_cache_lock:
+        _llm_inflight.pop(cache_key, None)
+    future.set_result(content)
+    return content
+
+
+def _request_llm_completion(
+    system_prompt: str,
+    user_payload: str,
+    *,
+    override_model: str | None = None,
+    expect_json: bool = True,
 ) -> str:
     provider, api_key, default_model, api_base = _provider_config()
     model = (override_model or default_model or "").strip()
@@ -1616,6 +1685,18 @@ def log_ai_feedback(
     db.commit()
 
 
+def log_ai_feedback_in_background(**kwargs: Any) -> None:
+    """log_ai_feedback for BackgroundTasks: runs after the response, when the request session is closed."""
+    db = SessionLocal()
+    try:
+        log_ai_feedback(db, **kwargs)
+    except Exception as exc:
+        db.rollback()
+        logger.exception("Could not save AI guide feedback: %s", exc)
+    finally:
+        db.close()
+
+
 def sync_resume_requirement_matches(db: Session, user_id: str) -> dict[str, Any]:
     selection = db.query(UserPathway).filter(UserPathway.user_id == user_id).one_or_none()
     profile = db.query(StudentProfile).filter(StudentProfile.user_id == user_id).one_or_none()
@@ -1737,17 +1818,15 @@ def sync_evidence_requirement_matches(db: Session, user_id: str) -> dict[str, An
     if not items:
         return {"matched_count": 0, "mode": "no_items", "matched_item_ids": []}
 
-    existing_ai_matches = (
-        db.query(Proof)
-        .filter(Proof.user_id == user_id)
-        .filter(Proof.proof_type == AI_EVIDENCE_MAP_PROOF_TYPE)
-        .all()
-    )
-    for proof in existing_ai_matches:
-        db.delete(proof)
+    db.query(Proof).filter(Proof.user_id == user_id).filter(
+        Proof.proof_type == AI_EVIDENCE_MAP_PROOF_TYPE
+    ).delete(synchronize_session=False)
     db.commit()
 
     all_user_proofs = db.query(Proof).filter(Proof.user_id == user_id).all()
+    # Evidence extraction reads from storage and the mapping may call the model;
+    # neither needs the connection held by the reads above.
+    release_connection(db)
     verified_item_ids = {
         str(proof.checklist_item_id)
         for proof in all_user_proofs
@@ -2292,6 +2371,7 @@ def generate_student_guidance(
             "AI strict mode: /user/ai/guide requires AI provider configuration."
         )
     if ai_is_configured():
+        release_connection(db)
         try:
             response = _generate_student_guidance_with_llm(
                 question=question,
@@ -2785,7 +2865,8 @@ def _generate_admin_summary_with_llm(source_text: str, purpose: str | None) -> d
         "keys: summary (string), rationale_draft (string or null)."
     )
     user = json.dumps({"purpose": purpose, "source_text": source_text})
-    raw = _call_llm(system, user)
+    # Admins often resubmit the same source text verbatim.
+    raw = _call_llm(system, user, use_cache=True)
     parsed = _safe_json(raw)
     if not parsed:
         return {"summary": "Summary pending.", "rationale_draft": None}
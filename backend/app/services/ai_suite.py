@@ -6,6 +6,7 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
+from app.core.database import release_connection
 from app.models.entities import MarketSignal, Skill, StudentProfile
 from app.services.ai import (
     _call_llm,
@@ -358,6 +359,7 @@ def generate_if_i_were_you(
             "AI strict mode: /user/ai/if-i-were-you requires AI provider configuration."
         )
     if ai_is_configured():
+        release_connection(db)
         try:
             system = (
                 "You are an AI career strategist in 'If I Were You' mode. "
@@ -460,6 +462,7 @@ def generate_certification_roi(
             "AI strict mode: /user/ai/certification-roi requires AI provider configuration."
         )
     if ai_is_configured():
+        release_connection(db)
         try:
             system = (
                 "You are an AI certification ROI calculator. "
@@ -468,7 +471,7 @@ def generate_certification_roi(
                 "Each top_options row must include certificate, cost_usd, time_required, entry_salary_range, "
                 "difficulty_level, demand_trend, roi_score (1-100), why_it_helps."
             )
-            parsed = _safe_json(_call_llm(system, json.dumps(payload)))
+            parsed = _safe_json(_call_llm(system, json.dumps(payload), use_cache=True))
             if parsed:
                 rows: list[dict[str, Any]] = []
                 for item in parsed.get("top_options", []) if isinstance(parsed.get("top_options"), list) else []:
@@ -568,6 +571,7 @@ def generate_emotional_reset(
             "AI strict mode: /user/ai/emotional-reset requires AI provider configuration."
         )
     if ai_is_configured():
+        release_connection(db)
         try:
             system = (
                 "You are an empathetic career coach. "
@@ -659,6 +663,7 @@ def generate_rebuild_90_day_plan(
             "AI strict mode: /user/ai/rebuild-90-day requires AI provider configuration."
         )
     if ai_is_configured():
+        release_connection(db)
         try:
             system = (
                 "You generate a structured 90-day rebuild plan for career readiness. "
@@ -752,6 +757,7 @@ def generate_college_gap_playbook(
             "AI strict mode: /user/ai/college-gap-playbook requires AI provider configuration."
         )
     if ai_is_configured():
+        release_connection(db)
         try:
             system = (
                 "You are an AI coach creating a practical 'College Did not Teach Me This' playbook. "
@@ -759,7 +765,7 @@ def generate_college_gap_playbook(
                 "Return JSON with keys: job_description_playbook (max 6), reverse_engineer_skills (max 6), "
                 "project_that_recruiters_care (max 6), networking_strategy (max 6), uncertainty."
             )
-            parsed = _safe_json(_call_llm(system, json.dumps(payload)))
+            parsed = _safe_json(_call_llm(system, json.dumps(payload), use_cache=True))
             if parsed:
                 response = {
                     "job_description_playbook": _safe_list(parsed.get("job_description_playbook"), max_items=6),
@@ -7,6 +7,7 @@ import secrets
 import string
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 import re
 
 from app.core.config import settings
@@ -89,7 +90,12 @@ def create_auth_token(user_id: str) -> str:
     return create_access_token(user_id)
 
 
-def verify_auth_token(token: str) -> str | None:
+@lru_cache(maxsize=10_000)
+def _decode_access_token(token: str) -> tuple[str, int] | None:
+    """Signature check and payload parse for an access token, memoized per token.
+
+    Expiry is deliberately not checked here so a cached entry never outlives the token.
+    """
     try:
         payload_b64, sig_b64 = token.split(".", 1)
     except ValueError:
@@ -113,11 +119,19 @@ def verify_auth_token(token: str) -> str | None:
     token_type = payload.get("typ")
     if not user_id or not isinstance(exp, int):
         return None
-    if exp < int(time.time()):
-        return None
     # Accept legacy tokens that have no "typ", but reject explicit non-access tokens.
     if token_type and token_type != "access":
         return None
+    return user_id, exp
+
+
+def verify_auth_token(token: str) -> str | None:
+    decoded = _decode_access_token(token)
+    if decoded is None:
+        return None
+    user_id, exp = decoded
+    if exp < int(time.time()):
+        return None
     return user_id
 
 
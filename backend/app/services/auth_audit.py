@@ -0,0 +1,155 @@
+import logging
+import queue
+import threading
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.entities import AuthAuditLog
+
+
+logger = logging.getLogger(__name__)
+
+AUDIT_QUEUE_MAXSIZE = 10_000
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_SECONDS = 1.0
+# Above this fill level callers write inline instead, so a stuck writer
+# slows auth requests down rather than silently dropping audit rows.
+AUDIT_BACKPRESSURE_THRESHOLD = int(AUDIT_QUEUE_MAXSIZE * 0.9)
+
+_audit_queue: "queue.Queue[dict]" = queue.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+_writer_thread: threading.Thread | None = None
+_writer_stop = threading.Event()
+_PENDING_INFO_KEY = "pending_auth_audit_rows"
+
+
+def enqueue_auth_audit(row: dict) -> bool:
+    """Hand an audit row to the batch writer; False means the caller must write it."""
+    if not _writer_thread or not _writer_thread.is_alive():
+        return False
+    if _audit_queue.qsize() >= AUDIT_BACKPRESSURE_THRESHOLD:
+        return False
+    try:
+        _audit_queue.put_nowait(row)
+    except queue.Full:
+        return False
+    return True
+
+
+def enqueue_auth_audit_on_commit(db: Session, row: dict) -> None:
+    """Queue an audit row once db's current transaction commits.
+
+    Rows are discarded if that transaction rolls back, so an audit entry never
+    outlives the change it describes. Without a running writer the row is added
+    to the transaction itself.
+    """
+    if not _writer_thread or not _writer_thread.is_alive():
+        db.add(AuthAuditLog(**row))
+        return
+    db.info.setdefault(_PENDING_INFO_KEY, []).append(row)
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_pending_rows(db: Session) -> None:
+    rows = db.info.pop(_PENDING_INFO_KEY, None)
+    if not rows:
+        return
+    # The session cannot run SQL inside this hook, so rows the queue refuses are
+    # written through a session of their own.
+    refused = [row for row in rows if not enqueue_auth_audit(row)]
+    if refused:
+        _write_batch(refused)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_rows(db: Session) -> None:
+    db.info.pop(_PENDING_INFO_KEY, None)
+
+
+def auth_audit_queue_depth() -> int:
+    return _audit_queue.qsize()
+
+
+def _drain_batch() -> list[dict]:
+    try:
+        batch = [_audit_queue.get(timeout=AUDIT_FLUSH_SECONDS)]
+    except queue.Empty:
+        return []
+    while len(batch) < AUDIT_BATCH_SIZE:
+        try:
+            batch.append(_audit_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write_batch(batch: list[dict]) -> None:
+    db = SessionLocal()
+    try:
+        # One executemany INSERT and one commit for the whole batch.
+        db.execute(insert(AuthAuditLog), batch)
+        db.commit()
+    except Exception as exc:  # pragma: no cover - defensive for runtime environments
+        db.rollback()
+        logger.warning("Batch insert of %s auth audit rows failed, retrying row by row: %s", len(batch), exc)
+        # Retry individually so one bad row cannot take the rest of the batch with it.
+        for row in batch:
+            try:
+                db.execute(insert(AuthAuditLog), [row])
+                db.commit()
+            except Exception as row_exc:
+                db.rollback()
+                logger.exception(
+                    "Dropping auth audit row (action=%s, user_id=%s): %s",
+                    row.get("action"),
+                    row.get("user_id"),
+                    row_exc,
+                )
+    finally:
+        db.close()
+
+
+def _flush_pending() -> None:
+    while True:
+        batch = []
+        while len(batch) < AUDIT_BATCH_SIZE:
+            try:
+                batch.append(_audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        _write_batch(batch)
+
+
+def _writer_loop() -> None:
+    while not _writer_stop.is_set() or not _audit_queue.empty():
+        batch = _drain_batch()
+        if batch:
+            _write_batch(batch)
+
+
+def start_auth_audit_writer() -> None:
+    global _writer_thread
+    if _writer_thread and _writer_thread.is_alive():
+        return
+    _writer_stop.clear()
+    _writer_thread = threading.Thread(target=_writer_loop, name="auth-audit-writer", daemon=True)
+    _writer_thread.start()
+
+
+def stop_auth_audit_writer(timeout: float = 10.0) -> None:
+    """Stop accepting rows and flush whatever is still queued."""
+    global _writer_thread
+    thread = _writer_thread
+    if not thread:
+        return
+    _writer_thread = None
+    _writer_stop.set()
+    thread.join(timeout=timeout)
+    if thread.is_alive():
+        logger.warning("Auth audit writer did not stop within %ss; flushing the queue inline", timeout)
+    # The writer is a daemon thread, so anything it has not taken yet would be
+    # lost at exit; write it from here instead.
+    _flush_pending()
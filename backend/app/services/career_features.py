@@ -182,7 +182,7 @@ def _resolve_user_context(
     milestones: list[Milestone] = []
     if selection:
         if selection.checklist_version_id:
-            version = db.query(ChecklistVersion).get(selection.checklist_version_id)
+            version = db.get(ChecklistVersion, selection.checklist_version_id)
         if not version:
             version = (
                 db.query(ChecklistVersion)
@@ -229,8 +229,8 @@ def _serialize_session(
     session: AiInterviewSession,
     questions: list[AiInterviewQuestion],
     responses: list[AiInterviewResponse],
-    item_map: dict[str, ChecklistItem],
-    milestone_map: dict[str, Milestone],
+    item_titles: dict[str, str],
+    milestone_titles: dict[str, str],
 ) -> dict[str, Any]:
     return {
         "id": session.id,
@@ -247,16 +247,10 @@ def _serialize_session(
                 "order_index": row.order_index,
                 "prompt": row.prompt,
                 "focus_item_id": row.focus_item_id,
-                "focus_title": (
-                    item_map[str(row.focus_item_id)].title
-                    if row.focus_item_id and str(row.focus_item_id) in item_map
-                    else None
-                ),
+                "focus_title": item_titles.get(str(row.focus_item_id)) if row.focus_item_id else None,
                 "focus_milestone_id": row.focus_milestone_id,
                 "focus_milestone_title": (
-                    milestone_map[str(row.focus_milestone_id)].title
-                    if row.focus_milestone_id and str(row.focus_milestone_id) in milestone_map
-                    else None
+                    milestone_titles.get(str(row.focus_milestone_id)) if row.focus_milestone_id else None
                 ),
                 "source_proof_id": row.source_proof_id,
                 "difficulty": row.difficulty,
@@ -452,9 +446,9 @@ def create_interview_session(
         model=get_active_ai_model() if ai_is_configured() else "n/a",
         output=session.summary,
     )
-    item_map = {str(item.id): item for item in items}
-    milestone_map = {str(milestone.id): milestone for milestone in milestones}
-    return _serialize_session(session, created_questions, [], item_map, milestone_map)
+    item_titles = {str(item.id): item.title for item in items}
+    milestone_titles = {str(milestone.id): milestone.title for milestone in milestones}
+    return _serialize_session(session, created_questions, [], item_titles, milestone_titles)
 
 
 def list_interview_sessions(db: Session, user_id: str, limit: int = 10) -> list[dict[str, Any]]:
@@ -483,11 +477,15 @@ def list_interview_sessions(db: Session, user_id: str, limit: int = 10) -> list[
 
 
 def get_interview_session(db: Session, user_id: str, session_id: str) -> dict[str, Any]:
-    session = db.query(AiInterviewSession).get(session_id)
+    session = db.get(AiInterviewSession, session_id)
     if not session or session.user_id != user_id:
         raise ValueError("Interview session not found")
-    questions = (
-        db.query(AiInterviewQuestion)
+    # Focus titles come from outer joins on the questions query rather than two
+    # follow-up IN lookups.
+    question_rows = (
+        db.query(AiInterviewQuestion, ChecklistItem.title, Milestone.title)
+        .outerjoin(ChecklistItem, ChecklistItem.id == AiInterviewQuestion.focus_item_id)
+        .outerjoin(Milestone, Milestone.id == AiInterviewQuestion.focus_milestone_id)
         .filter(AiInterviewQuestion.session_id == session.id)
         .order_by(AiInterviewQuestion.order_index.asc())
         .all()
@@ -498,17 +496,18 @@ def get_interview_session(db: Session, user_id: str, session_id: str) -> dict[st
         .order_by(AiInterviewResponse.submitted_at.asc())
         .all()
     )
-    item_ids = [q.focus_item_id for q in questions if q.focus_item_id]
-    milestone_ids = [q.focus_milestone_id for q in questions if q.focus_milestone_id]
-    items = db.query(ChecklistItem).filter(ChecklistItem.id.in_(item_ids)).all() if item_ids else []
-    milestones = (
-        db.query(Milestone).filter(Milestone.id.in_(milestone_ids)).all()
-        if milestone_ids
-        else []
-    )
-    item_map = {str(item.id): item for item in items}
-    milestone_map = {str(m.id): m for m in milestones}
-    return _serialize_session(session, questions, responses, item_map, milestone_map)
+    questions = [question for question, _, _ in question_rows]
+    item_titles = {
+        str(question.focus_item_id): item_title
+        for question, item_title, _ in question_rows
+        if item_title is not None
+    }
+    milestone_titles = {
+        str(question.focus_milestone_id): milestone_title
+        for question, _, milestone_title in question_rows
+        if milestone_title is not None
+    }
+    return _serialize_session(session, questions, responses, item_titles, milestone_titles)
 
 
 def _fallback_feedback(prompt: str, answer_text: str, has_video: bool) -> tuple[float, float, str]:
@@ -533,10 +532,10 @@ def submit_interview_response(
     answer_text: str | None,
     video_url: str | None,
 ) -> dict[str, Any]:
-    session = db.query(AiInterviewSession).get(session_id)
+    session = db.get(AiInterviewSession, session_id)
     if not session or session.user_id != user_id:
         raise ValueError("Interview session not found")
-    question = db.query(AiInterviewQuestion).get(question_id)
+    question = db.get(AiInterviewQuestion, question_id)
     if not question or question.session_id != session.id:
         raise ValueError("Interview question not found")
 
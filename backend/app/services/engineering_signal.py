@@ -8,11 +8,14 @@ from typing import Any
 
 import httpx
 
+from app.services.http_clients import github_client
+
 GITHUB_API_BASE = "https://api.github.com"
 REQUEST_TIMEOUT_SECONDS = 3.0
 RECENT_WINDOW_DAYS = 90
 README_SAMPLE_LIMIT = 10
 CACHE_TTL_SECONDS = 15 * 60
+HEADERS = {"User-Agent": "MarketReadyEngineeringSignal/1.0"}
 
 _cache_lock = Lock()
 _signal_cache: dict[str, tuple[float, dict[str, Any]]] = {}
@@ -80,7 +83,11 @@ def _readme_ratio(client: httpx.Client, owner: str, repos: list[dict[str, Any]])
             continue
         checked += 1
         try:
-            response = client.get(f"{GITHUB_API_BASE}/repos/{owner}/{name}/readme")
+            response = client.get(
+                f"{GITHUB_API_BASE}/repos/{owner}/{name}/readme",
+                headers=HEADERS,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
         except Exception:
             continue
 
@@ -123,73 +130,75 @@ def compute_engineering_signal(github_username: str) -> dict[str, Any]:
         return cached
 
     fallback = _default_payload()
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "User-Agent": "MarketReadyEngineeringSignal/1.0",
-    }
 
     try:
-        with httpx.Client(timeout=REQUEST_TIMEOUT_SECONDS, headers=headers, follow_redirects=True) as client:
-            user_response = client.get(f"{GITHUB_API_BASE}/users/{username}")
-            if user_response.status_code != 200:
-                _cache_set(username, fallback)
-                return fallback
-            user_payload = user_response.json()
-            user_data = user_payload if isinstance(user_payload, dict) else {}
-
-            repos_response = client.get(
-                f"{GITHUB_API_BASE}/users/{username}/repos",
-                params={"per_page": 100, "sort": "updated", "direction": "desc", "type": "owner"},
-            )
-            if repos_response.status_code != 200:
-                _cache_set(username, fallback)
-                return fallback
-            repos = repos_response.json()
-            if not isinstance(repos, list):
-                _cache_set(username, fallback)
-                return fallback
-
-            now = datetime.now(timezone.utc)
-            recent_threshold = now - timedelta(days=RECENT_WINDOW_DAYS)
-
-            public_repos = int(user_data.get("public_repos") or len(repos) or 0)
-            recent_repo_count = 0
-            total_stars = 0
-            languages: set[str] = set()
-
-            for repo in repos:
-                if not isinstance(repo, dict):
-                    continue
-                updated_at = _safe_dt(repo.get("updated_at"))
-                if updated_at and updated_at >= recent_threshold:
-                    recent_repo_count += 1
-                total_stars += int(repo.get("stargazers_count") or 0)
-                language = (repo.get("language") or "").strip()
-                if language:
-                    languages.add(language.lower())
-
-            readme_presence_ratio = _readme_ratio(client, username, repos)
-            unique_languages = len(languages)
-            score = _compute_score(
-                public_repos=public_repos,
-                recent_repo_count=recent_repo_count,
-                total_stars=total_stars,
-                unique_languages=unique_languages,
-                readme_presence_ratio=readme_presence_ratio,
-            )
-
-            payload = {
-                "score": score,
-                "metrics": {
-                    "public_repos": public_repos,
-                    "recent_repo_count": recent_repo_count,
-                    "total_stars": total_stars,
-                    "unique_languages": unique_languages,
-                    "readme_presence_ratio": readme_presence_ratio,
-                },
-            }
-            _cache_set(username, payload)
-            return payload
+        client = github_client()
+        user_response = client.get(
+            f"{GITHUB_API_BASE}/users/{username}",
+            headers=HEADERS,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        if user_response.status_code != 200:
+            _cache_set(username, fallback)
+            return fallback
+        user_payload = user_response.json()
+        user_data = user_payload if isinstance(user_payload, dict) else {}
+
+        repos_response = client.get(
+            f"{GITHUB_API_BASE}/users/{username}/repos",
+            params={"per_page": 100, "sort": "updated", "direction": "desc", "type": "owner"},
+            headers=HEADERS,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        if repos_response.status_code != 200:
+            _cache_set(username, fallback)
+            return fallback
+        repos = repos_response.json()
+        if not isinstance(repos, list):
+            _cache_set(username, fallback)
+            return fallback
+
+        now = datetime.now(timezone.utc)
+        recent_threshold = now - timedelta(days=RECENT_WINDOW_DAYS)
+
+        public_repos = int(user_data.get("public_repos") or len(repos) or 0)
+        recent_repo_count = 0
+        total_stars = 0
+        languages: set[str] = set()
+
+        for repo in repos:
+            if not isinstance(repo, dict):
+                continue
+            updated_at = _safe_dt(repo.get("updated_at"))
+            if updated_at and updated_at >= recent_threshold:
+                recent_repo_count += 1
+            total_stars += int(repo.get("stargazers_count") or 0)
+            language = (repo.get("language") or "").strip()
+            if language:
+                languages.add(language.lower())
+
+        readme_presence_ratio = _readme_ratio(client, username, repos)
+        unique_languages = len(languages)
+        score = _compute_score(
+            public_repos=public_repos,
+            recent_repo_count=recent_repo_count,
+            total_stars=total_stars,
+            unique_languages=unique_languages,
+            readme_presence_ratio=readme_presence_ratio,
+        )
+
+        payload = {
+            "score": score,
+            "metrics": {
+                "public_repos": public_repos,
+                "recent_repo_count": recent_repo_count,
+                "total_stars": total_stars,
+                "unique_languages": unique_languages,
+                "readme_presence_ratio": readme_presence_ratio,
+            },
+        }
+        _cache_set(username, payload)
+        return payload
     except Exception:
         _cache_set(username, fallback)
         return fallback
@@ -0,0 +1,27 @@
+from functools import lru_cache
+
+import httpx
+
+
+GITHUB_TIMEOUT_SECONDS = 10.0
+GITHUB_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "MarketReady/1.0",
+}
+
+
+@lru_cache(maxsize=1)
+def github_client() -> httpx.Client:
+    """Process-wide pooled client for api.github.com and raw.githubusercontent.com.
+
+    Callers that need a different timeout or user agent pass it per request
+    rather than building their own client, so every GitHub call shares one
+    connection pool. Connect failures are retried twice.
+    """
+    return httpx.Client(
+        timeout=GITHUB_TIMEOUT_SECONDS,
+        headers=GITHUB_HEADERS,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0),
+        transport=httpx.HTTPTransport(retries=2),
+    )
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from threading import Lock
+import time
 from typing import Any
 from urllib.parse import quote
 
@@ -9,6 +12,7 @@ import httpx
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.services.http_clients import github_client
 from app.models.entities import (
     ChecklistItem,
     ChecklistVersion,
@@ -28,6 +32,13 @@ SNAPSHOT_TTL_SKILLS_HOURS = 168
 SNAPSHOT_TTL_ADZUNA_HOURS = 24
 SNAPSHOT_TTL_STRESS_HOURS = 24
 ADZUNA_PROXY_WINDOWS = (30, 14, 7, 3, 1)
+REPO_EVIDENCE_FILES = ("README.md", "readme.md", "package.json", "requirements.txt", "pyproject.toml")
+REPO_EVIDENCE_CACHE_TTL_SECONDS = 5 * 60
+REPO_FETCH_WORKERS = 8
+GITHUB_EVIDENCE_TIMEOUT_SECONDS = 5.0
+
+_repo_cache_lock = Lock()
+_repo_evidence_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
 
 
 @dataclass
@@ -1171,17 +1182,19 @@ def _repo_owner_name(repo_url: str) -> tuple[str, str] | None:
     return None
 
 
-def _fetch_owner_repos(client: httpx.Client, owner: str) -> list[str]:
+def _fetch_owner_repos(client: httpx.Client, owner: str) -> tuple[list[str], bool]:
+    """Return the owner's recent repo names and whether GitHub answered normally."""
     try:
         response = client.get(
             f"https://api.github.com/users/{owner}/repos",
             params={"per_page": 30, "sort": "updated", "direction": "desc", "type": "owner"},
+            timeout=GITHUB_EVIDENCE_TIMEOUT_SECONDS,
         )
         if response.status_code != 200:
-            return []
+            return [], response.status_code == 404
         payload = response.json()
         if not isinstance(payload, list):
-            return []
+            return [], True
         repos: list[str] = []
         for row in payload:
             if not isinstance(row, dict):
@@ -1189,22 +1202,91 @@ def _fetch_owner_repos(client: httpx.Client, owner: str) -> list[str]:
             name = str(row.get("name") or "").strip()
             if name and name not in repos:
                 repos.append(name)
-        return repos
+        return repos, True
     except Exception:
-        return []
+        return [], False
 
 
-def _fetch_repo_languages(client: httpx.Client, owner: str, repo: str) -> set[str]:
+def _fetch_repo_languages(client: httpx.Client, owner: str, repo: str) -> tuple[set[str], bool]:
     try:
-        response = client.get(f"https://api.github.com/repos/{owner}/{repo}/languages")
+        response = client.get(
+            f"https://api.github.com/repos/{owner}/{repo}/languages",
+            timeout=GITHUB_EVIDENCE_TIMEOUT_SECONDS,
+        )
         if response.status_code != 200:
-            return set()
+            return set(), response.status_code == 404
         payload = response.json()
         if not isinstance(payload, dict):
-            return set()
-        return {str(name).lower() for name in payload.keys() if str(name).strip()}
+            return set(), True
+        return {str(name).lower() for name in payload.keys() if str(name).strip()}, True
     except Exception:
-        return set()
+        return set(), False
+
+
+def _fetch_repo_evidence(
+    client: httpx.Client, owner: str, repo_name: str
+) -> tuple[set[str], list[str], list[str], bool]:
+    languages, complete = _fetch_repo_languages(client, owner, repo_name)
+    checked: list[str] = []
+    corpus: list[str] = []
+    for file_name in REPO_EVIDENCE_FILES:
+        try:
+            url = f"https://raw.githubusercontent.com/{owner}/{repo_name}/HEAD/{file_name}"
+            response = client.get(url, timeout=GITHUB_EVIDENCE_TIMEOUT_SECONDS)
+            if response.status_code == 200 and response.text:
+                checked.append(f"{repo_name}/{file_name}")
+                corpus.append(response.text.lower())
+            elif response.status_code not in (200, 404):
+                complete = False
+        except Exception:
+            complete = False
+    return languages, checked, corpus, complete
+
+
+def _load_repo_evidence(owner: str, repo: str) -> dict[str, Any]:
+    cache_key = (owner.lower(), repo.lower())
+    now = time.time()
+    with _repo_cache_lock:
+        cached = _repo_evidence_cache.get(cache_key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    client = github_client()
+    complete = True
+    target_repos = [repo] if repo else []
+    if not target_repos:
+        owner_repos, complete = _fetch_owner_repos(client, owner)
+        target_repos = [name for name in owner_repos[:8] if name]
+
+    checked: list[str] = []
+    corpus: list[str] = []
+    languages_detected: set[str] = set()
+    # Repos are independent; fetch them in parallel and merge in the original order.
+    with ThreadPoolExecutor(max_workers=max(1, min(REPO_FETCH_WORKERS, len(target_repos)))) as pool:
+        for languages, repo_checked, repo_corpus, repo_complete in pool.map(
+            lambda repo_name: _fetch_repo_evidence(client, owner, repo_name), target_repos
+        ):
+            languages_detected.update(languages)
+            checked.extend(repo_checked)
+            corpus.extend(repo_corpus)
+            complete = complete and repo_complete
+
+    evidence = {
+        "files_checked": checked,
+        "corpus": corpus,
+        "repos_checked": target_repos,
+        "languages_detected": languages_detected,
+    }
+    if not complete:
+        # Rate limits and GitHub errors look like missing files; caching that
+        # would report "no skills matched" after GitHub recovers.
+        return evidence
+    with _repo_cache_lock:
+        _repo_evidence_cache[cache_key] = (now + REPO_EVIDENCE_CACHE_TTL_SECONDS, evidence)
+        if len(_repo_evidence_cache) > 256:
+            oldest_key = min(_repo_evidence_cache.items(), key=lambda item: item[1][0])[0]
+            _repo_evidence_cache.pop(oldest_key, None)
+    return evidence
 
 
 def verify_repo_against_skills(repo_url: str, required_skills: list[str]) -> dict[str, Any]:
@@ -1218,35 +1300,11 @@ def verify_repo_against_skills(repo_url: str, required_skills: list[str]) -> dic
             "languages_detected": [],
         }
 
-    owner, repo = parsed
-    headers: dict[str, str] = {"Accept": "application/vnd.github+json"}
-    files_to_check = ["README.md", "readme.md", "package.json", "requirements.txt", "pyproject.toml"]
-    checked: list[str] = []
-    corpus: list[str] = []
-    repos_checked: list[str] = []
-    languages_detected: set[str] = set()
-
-    with httpx.Client(timeout=5.0, headers=headers) as client:
-        target_repos = [repo] if repo else []
-        if not target_repos:
-            target_repos = _fetch_owner_repos(client, owner)[:8]
-
-        for repo_name in target_repos:
-            if not repo_name:
-                continue
-            repos_checked.append(repo_name)
-            languages_detected.update(_fetch_repo_languages(client, owner, repo_name))
-            for file_name in files_to_check:
-                try:
-                    url = f"https://raw.githubusercontent.com/{owner}/{repo_name}/HEAD/{file_name}"
-                    response = client.get(url)
-                    if response.status_code == 200 and response.text:
-                        checked.append(f"{repo_name}/{file_name}")
-                        corpus.append(response.text.lower())
-                except Exception:
-                    continue
-
-    corpus.extend(languages_detected)
+    evidence = _load_repo_evidence(*parsed)
+    checked = list(evidence["files_checked"])
+    repos_checked = list(evidence["repos_checked"])
+    languages_detected = set(evidence["languages_detected"])
+    corpus = [*evidence["corpus"], *languages_detected]
     combined = "\n".join(corpus)
     matched: list[str] = []
     for skill in required_skills:
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.partitions import ensure_log_partitions
+
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+_state_lock = threading.Lock()
+_state: dict = {
+    "state": "idle",
+    "started_at": None,
+    "finished_at": None,
+    "error": None,
+}
+_migration_task: asyncio.Task | None = None
+
+
+def _alembic_config() -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    # script_location in alembic.ini is relative to the backend directory, which
+    # is not necessarily the server's working directory.
+    config.set_main_option("script_location", str(BACKEND_DIR / "app" / "alembic"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def _set_state(**values) -> None:
+    with _state_lock:
+        _state.update(values)
+
+
+def run_migrations() -> None:
+    """Upgrade the database to head, recording progress for migration_status."""
+    _set_state(state="running", started_at=datetime.utcnow(), finished_at=None, error=None)
+    try:
+        command.upgrade(_alembic_config(), "head")
+    except Exception as exc:
+        logger.exception("Database migration failed: %s", exc)
+        _set_state(state="failed", finished_at=datetime.utcnow(), error=str(exc))
+        raise
+    _set_state(state="succeeded", finished_at=datetime.utcnow())
+
+
+def _run_background_migrations() -> None:
+    try:
+        run_migrations()
+    except Exception:
+        return
+    ensure_log_partitions()
+
+
+async def start_background_migrations() -> None:
+    global _migration_task
+    if _migration_task and not _migration_task.done():
+        return
+    _migration_task = asyncio.create_task(
+        asyncio.to_thread(_run_background_migrations),
+        name="database-migrations",
+    )
+    logger.info("Database migrations started in the background")
+
+
+def migration_status(db: Session) -> dict:
+    with _state_lock:
+        snapshot = dict(_state)
+    current_revision = MigrationContext.configure(db.connection()).get_current_revision()
+    head_revision = ScriptDirectory.from_config(_alembic_config()).get_current_head()
+    return {
+        "mode": settings.migration_mode,
+        **snapshot,
+        "current_revision": current_revision,
+        "head_revision": head_revision,
+        "up_to_date": current_revision == head_revision,
+    }
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+
+# Range-partitioned by created_at in migration 0018.
+PARTITIONED_LOG_TABLES = ("auth_audit_logs", "ai_audit_logs")
+PARTITION_MONTHS_AHEAD = 3
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 24 * 3600
+
+_maintenance_task: asyncio.Task | None = None
+_maintenance_stop_event: asyncio.Event | None = None
+
+
+def ensure_log_partitions(months_ahead: int = PARTITION_MONTHS_AHEAD) -> None:
+    """Create upcoming monthly partitions so new log rows never fall into the default partition.
+
+    Starting from the oldest row still in the default partition lets
+    ensure_monthly_partitions (migration 0028) move stragglers into their month.
+    """
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name != "postgresql":
+            return
+        for table_name in PARTITIONED_LOG_TABLES:
+            try:
+                db.execute(
+                    text(
+                        "SELECT ensure_monthly_partitions(:parent, :months_ahead, "
+                        f"COALESCE((SELECT min(created_at) FROM {table_name}_default), now()::timestamp))"
+                    ),
+                    {"parent": table_name, "months_ahead": months_ahead},
+                )
+                db.commit()
+            except Exception as exc:  # pragma: no cover - defensive for runtime environments
+                db.rollback()
+                logger.exception("Could not create %s partitions: %s", table_name, exc)
+    finally:
+        db.close()
+
+
+async def _maintenance_loop(stop_event: asyncio.Event) -> None:
+    # Startup already created the partitions; keep the months-ahead window
+    # moving for processes that stay up longer than it.
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            await asyncio.to_thread(ensure_log_partitions)
+
+
+async def start_partition_maintenance() -> None:
+    global _maintenance_task, _maintenance_stop_event
+    if _maintenance_task and not _maintenance_task.done():
+        return
+    _maintenance_stop_event = asyncio.Event()
+    _maintenance_task = asyncio.create_task(
+        _maintenance_loop(_maintenance_stop_event),
+        name="log-partition-maintenance",
+    )
+
+
+async def stop_partition_maintenance() -> None:
+    global _maintenance_task, _maintenance_stop_event
+    if not _maintenance_task:
+        return
+    if _maintenance_stop_event:
+        _maintenance_stop_event.set()
+    try:
+        await asyncio.wait_for(_maintenance_task, timeout=5)
+    except asyncio.TimeoutError:
+        _maintenance_task.cancel()
+    except Exception:
+        logger.exception("Error while stopping log partition maintenance")
+    finally:
+        _maintenance_task = None
+        _maintenance_stop_event = None
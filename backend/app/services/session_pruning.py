@@ -0,0 +1,87 @@
+import asyncio
+from datetime import datetime, timedelta
+import logging
+
+from sqlalchemy import delete, or_, select
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.entities import AuthSession
+
+
+logger = logging.getLogger(__name__)
+
+PRUNE_BATCH_SIZE = 5000
+
+_prune_task: asyncio.Task | None = None
+_prune_stop_event: asyncio.Event | None = None
+
+
+def prune_auth_sessions(retention_days: int | None = None) -> int:
+    """Delete refresh sessions that expired or were revoked before the retention window."""
+    days = settings.auth_session_retention_days if retention_days is None else retention_days
+    if days <= 0:
+        return 0
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    stale = or_(AuthSession.expires_at < cutoff, AuthSession.revoked_at < cutoff)
+    deleted = 0
+    db = SessionLocal()
+    try:
+        # Small batches keep each delete's locks and WAL burst short on a live table.
+        while True:
+            ids = db.scalars(select(AuthSession.id).where(stale).limit(PRUNE_BATCH_SIZE)).all()
+            if not ids:
+                break
+            db.execute(delete(AuthSession).where(AuthSession.id.in_(ids)))
+            db.commit()
+            deleted += len(ids)
+            if len(ids) < PRUNE_BATCH_SIZE:
+                break
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    return deleted
+
+
+async def _prune_loop(stop_event: asyncio.Event) -> None:
+    interval_seconds = settings.auth_session_prune_interval_hours * 3600
+    while not stop_event.is_set():
+        try:
+            deleted = await asyncio.to_thread(prune_auth_sessions)
+            if deleted:
+                logger.info("Pruned %s stale auth sessions", deleted)
+        except Exception as exc:  # pragma: no cover - defensive for runtime environments
+            logger.exception("Auth session pruning failed: %s", exc)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def start_session_pruning() -> None:
+    global _prune_task, _prune_stop_event
+    if settings.auth_session_retention_days <= 0:
+        return
+    if _prune_task and not _prune_task.done():
+        return
+    _prune_stop_event = asyncio.Event()
+    _prune_task = asyncio.create_task(_prune_loop(_prune_stop_event), name="auth-session-pruning")
+
+
+async def stop_session_pruning() -> None:
+    global _prune_task, _prune_stop_event
+    if not _prune_task:
+        return
+    if _prune_stop_event:
+        _prune_stop_event.set()
+    try:
+        await asyncio.wait_for(_prune_task, timeout=5)
+    except asyncio.TimeoutError:
+        _prune_task.cancel()
+    except Exception:
+        logger.exception("Error while stopping auth session pruning")
+    finally:
+        _prune_task = None
+        _prune_stop_event = None
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from urllib.parse import unquote, urlparse
 from uuid import uuid4
 
@@ -18,7 +19,10 @@ def s3_is_enabled() -> bool:
     return bool(settings.s3_bucket)
 
 
+@lru_cache(maxsize=1)
 def _create_s3_client():
+    # boto3 clients are thread-safe and expensive to build (credential and
+    # endpoint resolution), so one is shared for the life of the process.
     kwargs: dict = {}
     if settings.s3_region:
         kwargs["region_name"] = settings.s3_region
@@ -149,6 +153,11 @@ def resolve_file_view_url(file_url: str) -> str:
     return presigned or file_url
 
 
+def resolve_file_view_urls(file_urls) -> dict[str, str]:
+    """resolve_file_view_url for a batch, signing each distinct URL once."""
+    return {file_url: resolve_file_view_url(file_url) for file_url in set(file_urls)}
+
+
 def read_s3_object_bytes(file_url: str, max_bytes: int = 250_000) -> bytes | None:
     if not s3_is_enabled():
         return None
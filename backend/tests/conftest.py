@@ -1,5 +1,6 @@
 import os
 
 os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("DB_USE_NULL_POOL", "true")
 os.environ.setdefault("AI_ENABLED", "false")
 os.environ.setdefault("AI_STRICT_MODE", "false")
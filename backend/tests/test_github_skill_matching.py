@@ -0,0 +1,78 @@
+from pathlib import Path
+import random
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.api.routes import github
+from app.api.routes.github import (
+    COMMIT_SKILL_KEYWORDS,
+    DEP_SKILL_MAP,
+    _extract_skills_from_commits,
+    _extract_skills_from_deps,
+)
+
+
+def _naive(mapping: dict[str, list[str]], text: str) -> set[str]:
+    return {skill for keyword, mapped in mapping.items() if keyword in text for skill in mapped}
+
+
+def test_compiled_matchers_agree_with_substring_scan():
+    rng = random.Random(7)
+    pieces = list(DEP_SKILL_MAP) + list(COMMIT_SKILL_KEYWORDS) + ["-", " ", "x", "@types/", "js"]
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 6)))
+        assert _extract_skills_from_deps([text]) == _naive(DEP_SKILL_MAP, text)
+        commits = [{"commit": {"message": part.upper()}} for part in text.split(" ")]
+        expected = set().union(*(_naive(COMMIT_SKILL_KEYWORDS, part) for part in text.split(" ")))
+        assert _extract_skills_from_commits(commits) == expected
+
+
+def test_prefix_keywords_are_still_reported():
+    pattern, skills = github._compile_keyword_matcher({"db": ["Database"], "dbt": ["Analytics"]})
+    found = set()
+    for match in pattern.finditer("uses dbt"):
+        found.update(skills[match.group(1)])
+    assert found == {"Database", "Analytics"}
+
+
+def _mock_client(handler):
+    return github.httpx.Client(transport=github.httpx.MockTransport(handler))
+
+
+def test_audit_with_failed_fetches_is_not_cached(monkeypatch):
+    def handler(request):
+        path = request.url.path
+        if path == "/users/octo":
+            return github.httpx.Response(200, json={"public_repos": 1})
+        if path == "/users/octo/repos":
+            return github.httpx.Response(200, json=[{"name": "app", "owner": {"login": "octo"}, "language": "Python"}])
+        # Every per-repo fetch hits the rate limit.
+        return github.httpx.Response(403, json={"message": "API rate limit exceeded"})
+
+    monkeypatch.setattr(github, "github_client", lambda: _mock_client(handler))
+    monkeypatch.setattr(github.settings, "github_token", None)
+    monkeypatch.setattr(github, "_audit_cache", {})
+
+    result = github.audit_github_user("octo", github.BackgroundTasks())
+    assert result["verified_skills"] == ["Python"]
+    assert any("incomplete" in warning for warning in result["warnings"])
+    assert "octo" not in github._audit_cache
+
+
+def test_rate_limited_repo_listing_is_an_error_not_an_empty_profile(monkeypatch):
+    def handler(request):
+        if request.url.path == "/users/octo":
+            return github.httpx.Response(200, json={})
+        return github.httpx.Response(403, json={"message": "API rate limit exceeded"})
+
+    monkeypatch.setattr(github, "github_client", lambda: _mock_client(handler))
+    monkeypatch.setattr(github.settings, "github_token", None)
+    monkeypatch.setattr(github, "_audit_cache", {})
+
+    with pytest.raises(github.HTTPException) as exc:
+        github.audit_github_user("octo", github.BackgroundTasks())
+    assert exc.value.status_code == 503
+    assert github._audit_cache == {}
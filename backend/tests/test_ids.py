@@ -0,0 +1,29 @@
+from pathlib import Path
+import sys
+import time
+from uuid import RFC_4122
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core.ids import uuid7
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == RFC_4122
+
+
+def test_uuid7_embeds_current_millisecond_timestamp():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= value.int >> 80 <= after
+
+
+def test_uuid7_sorts_by_creation_time():
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first < second
+    assert str(first) < str(second)
@@ -0,0 +1,72 @@
+from pathlib import Path
+import sys
+import threading
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.services import ai
+
+
+def _fake_completion(calls: list, gate: threading.Event | None = None, started: threading.Event | None = None):
+    def fake(system_prompt, user_payload, *, override_model=None, expect_json=True):
+        calls.append(user_payload)
+        if started is not None:
+            started.set()
+        if gate is not None:
+            gate.wait(timeout=2)
+        return f"reply:{user_payload}"
+
+    return fake
+
+
+def test_opted_in_prompts_reuse_cached_completion(monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(ai, "_request_llm_completion", _fake_completion(calls))
+    monkeypatch.setattr(ai.settings, "llm_response_cache_ttl_seconds", 30)
+    ai._llm_response_cache.clear()
+
+    assert ai._call_llm("system", "payload-a", use_cache=True) == "reply:payload-a"
+    assert ai._call_llm("system", "payload-a", use_cache=True) == "reply:payload-a"
+    assert ai._call_llm("system", "payload-b", use_cache=True) == "reply:payload-b"
+    assert calls == ["payload-a", "payload-b"]
+
+
+def test_sequential_calls_are_not_cached_by_default(monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(ai, "_request_llm_completion", _fake_completion(calls))
+    monkeypatch.setattr(ai.settings, "llm_response_cache_ttl_seconds", 30)
+    ai._llm_response_cache.clear()
+
+    ai._call_llm("system", "regenerate")
+    ai._call_llm("system", "regenerate")
+    assert calls == ["regenerate", "regenerate"]
+    assert ai._llm_response_cache == {}
+
+
+def test_concurrent_identical_prompts_share_one_call(monkeypatch):
+    calls: list = []
+    gate = threading.Event()
+    started = threading.Event()
+    monkeypatch.setattr(ai, "_request_llm_completion", _fake_completion(calls, gate, started))
+    monkeypatch.setattr(ai.settings, "llm_response_cache_ttl_seconds", 30)
+    ai._llm_response_cache.clear()
+
+    results: list = []
+    leader = threading.Thread(target=lambda: results.append(ai._call_llm("system", "same")))
+    leader.start()
+    assert started.wait(timeout=2)
+    followers = [
+        threading.Thread(target=lambda: results.append(ai._call_llm("system", "same")))
+        for _ in range(3)
+    ]
+    for thread in followers:
+        thread.start()
+    # The leader is parked on the gate, so followers can only block on its future.
+    for thread in followers:
+        thread.join(timeout=0.2)
+    gate.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=2)
+
+    assert results == ["reply:same"] * 4
+    assert calls == ["same"]
@@ -0,0 +1,42 @@
+from pathlib import Path
+import sys
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.core import ratelimit
+from app.core.ratelimit import RateLimiter
+
+
+def test_bucket_allows_burst_then_refills(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    limiter = RateLimiter(limit=3, window_seconds=30)
+
+    for _ in range(3):
+        limiter.check("k")
+    with pytest.raises(HTTPException) as exc:
+        limiter.check("k")
+    assert exc.value.status_code == 429
+    assert exc.value.detail["retry_after_seconds"] == 10
+
+    now[0] += 10
+    limiter.check("k")
+    with pytest.raises(HTTPException):
+        limiter.check("k")
+
+
+def test_idle_buckets_are_swept(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(RateLimiter, "SWEEP_EVERY", 4)
+    limiter = RateLimiter(limit=5, window_seconds=60)
+
+    limiter.check("a")
+    limiter.check("b")
+    now[0] += 61
+    limiter.check("c")
+    limiter.check("c")
+    assert set(limiter.buckets) == {"c"}
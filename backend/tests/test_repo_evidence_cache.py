@@ -0,0 +1,40 @@
+from pathlib import Path
+import sys
+
+import httpx
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.services import market_stress as ms
+
+
+def _use_transport(monkeypatch, handler):
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ms, "github_client", lambda: client)
+    monkeypatch.setattr(ms, "_repo_evidence_cache", {})
+
+
+def test_rate_limited_evidence_is_not_cached(monkeypatch):
+    _use_transport(monkeypatch, lambda request: httpx.Response(403, json={"message": "rate limited"}))
+
+    evidence = ms._load_repo_evidence("octo", "app")
+
+    assert evidence["files_checked"] == []
+    assert ms._repo_evidence_cache == {}
+
+
+def test_missing_files_are_cached(monkeypatch):
+    def handler(request):
+        if request.url.path.endswith("/languages"):
+            return httpx.Response(200, json={"Python": 100})
+        if request.url.path.endswith("/README.md"):
+            return httpx.Response(200, text="FastAPI service")
+        return httpx.Response(404)
+
+    _use_transport(monkeypatch, handler)
+
+    evidence = ms._load_repo_evidence("octo", "app")
+
+    assert evidence["files_checked"] == ["app/README.md"]
+    assert evidence["languages_detected"] == {"python"}
+    assert ("octo", "app") in ms._repo_evidence_cache
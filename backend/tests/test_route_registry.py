@@ -0,0 +1,65 @@
+from collections import Counter
+from pathlib import Path
+import sys
+
+from fastapi.routing import APIRoute
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.api import routes
+from app.api.routes import (
+    admin,
+    ai,
+    auth,
+    github,
+    kanban,
+    majors,
+    market,
+    meta,
+    mri,
+    proofs,
+    public_profile,
+    readiness,
+    sentinel,
+    simulator,
+    timeline,
+    user,
+)
+
+MODULES = (
+    auth,
+    majors,
+    user,
+    proofs,
+    readiness,
+    timeline,
+    admin,
+    ai,
+    market,
+    meta,
+    github,
+    mri,
+    sentinel,
+    kanban,
+    simulator,
+    public_profile,
+)
+
+
+def test_no_method_and_path_is_registered_twice():
+    registered = Counter(
+        (route.path, method)
+        for module in MODULES
+        for route in module.router.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+    duplicates = sorted(key for key, count in registered.items() if count > 1)
+    assert duplicates == []
+
+
+def test_every_route_module_is_covered():
+    modules = {
+        path.stem for path in Path(routes.__file__).parent.glob("*.py") if path.stem != "__init__"
+    }
+    assert {module.__name__.rsplit(".", 1)[-1] for module in MODULES} == modules
@@ -1,7 +1,7 @@
 "use client";
 
 import { useCallback, useEffect, useMemo, useState } from "react";
-import { apiGet, apiSend } from "@/lib/api";
+import { apiGetPage, apiSend } from "@/lib/api";
 import { useLocalStorage } from "@/lib/useLocalStorage";
 import { useSession } from "@/lib/session";
 
@@ -16,6 +16,8 @@ type Proof = {
   review_note?: string | null;
 };
 
+const PAGE_SIZE = 100;
+
 export default function AdminProofsPage() {
   const { isLoggedIn, username } = useSession();
   const [adminToken, setAdminToken] = useLocalStorage(
@@ -23,24 +25,55 @@ export default function AdminProofsPage() {
     "change-me"
   );
   const [proofs, setProofs] = useState<Proof[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [statusFilter, setStatusFilter] = useState("");
   const [reviewNotes, setReviewNotes] = useState<Record<string, string>>({});
 
   const headers = useMemo(() => ({ "X-Admin-Token": adminToken }), [adminToken]);
 
+  const fetchPage = useCallback(
+    (cursor: string | null) => {
+      const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+      if (statusFilter) params.set("status", statusFilter);
+      if (cursor) params.set("cursor", cursor);
+      return apiGetPage<Proof>(`/admin/proofs?${params.toString()}`, headers);
+    },
+    [headers, statusFilter]
+  );
+
   const loadProofs = useCallback(() => {
-    const query = statusFilter ? `?status=${statusFilter}` : "";
-    apiGet<Proof[]>(`/admin/proofs${query}`, headers)
-      .then((data) => {
-        setProofs(data);
+    fetchPage(null)
+      .then(({ items, nextCursor: cursor }) => {
+        setProofs(items);
+        setNextCursor(cursor);
         const notes: Record<string, string> = {};
-        data.forEach((proof) => {
+        items.forEach((proof) => {
           notes[proof.id] = proof.review_note ?? "";
         });
         setReviewNotes(notes);
       })
-      .catch(() => setProofs([]));
-  }, [headers, statusFilter]);
+      .catch(() => {
+        setProofs([]);
+        setNextCursor(null);
+      });
+  }, [fetchPage]);
+
+  const loadMore = () => {
+    if (!nextCursor) return;
+    fetchPage(nextCursor)
+      .then(({ items, nextCursor: cursor }) => {
+        setProofs((prev) => [...prev, ...items]);
+        setNextCursor(cursor);
+        setReviewNotes((prev) => {
+          const notes = { ...prev };
+          items.forEach((proof) => {
+            notes[proof.id] = proof.review_note ?? "";
+          });
+          return notes;
+        });
+      })
+      .catch(() => setNextCursor(null));
+  };
 
   useEffect(() => {
     if (isLoggedIn) {
@@ -182,6 +215,13 @@ export default function AdminProofsPage() {
           </div>
         ))}
       </div>
+      {nextCursor && (
+        <div className="mt-6">
+          <button className="cta cta-secondary" onClick={loadMore}>
+            Load more
+          </button>
+        </div>
+      )}
     </section>
   );
 }
@@ -63,7 +63,7 @@ async function tryRefreshSession(): Promise<boolean> {
   }
 }
 
-export async function apiGet<T>(path: string, headers?: HeadersInit): Promise<T> {
+async function apiGetResponse(path: string, headers?: HeadersInit): Promise<Response> {
   const bases = getCandidateApiBases();
   let res: Response | null = null;
   for (const base of bases) {
@@ -92,9 +92,24 @@ export async function apiGet<T>(path: string, headers?: HeadersInit): Promise<T>
     const body = await res.text();
     throw new ApiError(res.status, body);
   }
+  return res;
+}
+
+export async function apiGet<T>(path: string, headers?: HeadersInit): Promise<T> {
+  const res = await apiGetResponse(path, headers);
   return res.json() as Promise<T>;
 }
 
+/** GET a keyset-paginated list; nextCursor is null on the last page. */
+export async function apiGetPage<T>(
+  path: string,
+  headers?: HeadersInit
+): Promise<{ items: T[]; nextCursor: string | null }> {
+  const res = await apiGetResponse(path, headers);
+  const items = (await res.json()) as T[];
+  return { items, nextCursor: res.headers.get("X-Next-Cursor") };
+}
+
 export async function apiSend<T>(
   path: string,
   options: RequestInit